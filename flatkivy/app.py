@@ -6,37 +6,37 @@ This module contains :class:`MDApp` class that is inherited from
 :class:`~kivy.app.App`. :class:`MDApp` has some properties needed for ``KivyMD``
 library (like :attr:`~MDApp.theme_cls`).
 
-You can turn on the monitor displaying the current ``FPS`` value in your application:
+You can turn on the performance overlay of your application, showing the
+``FPS``, a frame time histogram, widget, instruction and texture counts
+(see :mod:`flatkivy.uix.perf_hud`):
 
 .. code-block:: python
 
     KV = '''
     Screen:
 
-        MDLabel:
+        FlatLabel:
             text: "Hello, World!"
             halign: "center"
     '''
 
     from kivy.lang import Builder
 
-    from kivymd.app import MDApp
+    from flatkivy.app import FlatApp
 
 
-    class MainApp(MDApp):
+    class MainApp(FlatApp):
         def build(self):
             return Builder.load_string(KV)
 
         def on_start(self):
-            self.fps_monitor_start()
+            self.perf_hud_start()
 
 
     MainApp().run()
 
-.. image:: https://github.com/HeaTTheatR/KivyMD-data/raw/master/gallery/kivymddoc/fps-monitor.png
-    :width: 350 px
-    :align: center
-
+The overlay is toggled at runtime with :meth:`FlatApp.perf_hud_toggle` and
+costs nothing while it is off.
 """
 
 __all__ = ("FlatApp",)
@@ -72,3 +72,29 @@ class FlatApp(App):
 
     :attr:`theme_cls` is an :class:`~kivy.properties.ObjectProperty`.
     """
+
+    perf_hud = None
+    """:class:`~flatkivy.uix.perf_hud.PerfHUD` of the app, created the first
+    time it is started."""
+
+    def perf_hud_start(self):
+        if self.perf_hud is None:
+            from flatkivy.uix.perf_hud import PerfHUD
+
+            self.perf_hud = PerfHUD()
+        self.perf_hud.start()
+
+    def perf_hud_stop(self):
+        if self.perf_hud is not None:
+            self.perf_hud.stop()
+
+    def perf_hud_toggle(self):
+        if self.perf_hud is not None and self.perf_hud.running:
+            self.perf_hud_stop()
+        else:
+            self.perf_hud_start()
+
+    def fps_monitor_start(self):
+        """Same as :meth:`perf_hud_start`."""
+
+        self.perf_hud_start()
@@ -0,0 +1,200 @@
+"""
+Themes/Colors
+=============
+
+Colors derived from :data:`~flatkivy.color_definitions.colors`.
+
+Every palette is derived once, when the module is imported, into a
+:class:`PaletteColors` of ``rgba`` tuples: lighter and darker shades, the
+pressed variant and the text colors contrasting with it. The colors
+depending on the theme style are in :data:`style_colors`.
+:class:`~flatkivy.theming.ThemeManager` exposes both as cached lookups, so
+widgets read their colors instead of computing them:
+
+.. code-block:: python
+
+    theme_cls.primary_colors.pressed
+    theme_cls.get_palette_colors("Alizarin").text
+    theme_cls.style_colors.disabled
+
+All those colors are interned by :func:`intern_color`: equal colors are the
+same tuple. The color properties of the themed widgets are
+:class:`~kivy.properties.ObjectProperty` holding these tuples rather than
+:class:`~kivy.properties.ListProperty` copies, so thousands of widgets
+using a theme color share one object, and setting it again compares by
+equality and dispatches nothing.
+
+.. warning:: Since those properties hold tuples, in-place edits such as
+    ``widget.text_color[3] = .5`` raise :class:`TypeError`. Assign a new
+    color instead, e.g. ``widget.text_color = with_alpha(color, .5)``.
+"""
+
+__all__ = (
+    "PaletteColors",
+    "StyleColors",
+    "contrast_colors",
+    "derive_palette",
+    "hex_to_rgba",
+    "intern_color",
+    "palette_colors",
+    "pressed_color",
+    "shade",
+    "style_colors",
+    "with_alpha",
+)
+
+from collections import namedtuple
+from functools import lru_cache
+
+from flatkivy.color_definitions import colors
+
+PaletteColors = namedtuple(
+    "PaletteColors",
+    ("base", "light", "dark", "pressed", "text", "secondary_text"),
+)
+"""Colors derived from the base color of a palette."""
+
+StyleColors = namedtuple(
+    "StyleColors",
+    ("bg", "bg_accent", "disabled", "flat_pressed", "text", "secondary_text"),
+)
+"""Colors of a theme style."""
+
+LIGHT_SHADE = 0.3
+"""Part of white mixed in the light shade of a palette."""
+
+DARK_SHADE = 0.2
+"""Part of black mixed in the dark shade of a palette."""
+
+PRESSED_FACTOR = 0.8
+"""Factor of the color channels of a pressed surface."""
+
+LUMINANCE_THRESHOLD = 0.6
+"""Luminance over which a background gets dark text."""
+
+MAX_INTERNED = 1024
+"""Number of colors over which :func:`intern_color` stops interning."""
+
+_interned = {}
+
+
+def intern_color(rgba):
+    """Returns the shared ``rgba`` tuple equal to `rgba`, a sequence of
+    four numbers or `None`."""
+
+    if rgba is None:
+        return None
+    key = tuple(rgba)
+    color = _interned.get(key)
+    if color is None:
+        if len(_interned) >= MAX_INTERNED:
+            return key
+        color = _interned[key] = key
+    return color
+
+
+def with_alpha(rgba, alpha, intern=True):
+    """Returns the color `rgba` with the alpha channel `alpha`, interned
+    unless `intern` is `False`, e.g. for the short-lived colors of a theme
+    transition."""
+
+    color = (rgba[0], rgba[1], rgba[2], alpha)
+    return intern_color(color) if intern else color
+
+
+DARK_TEXT = (
+    intern_color((0.0, 0.0, 0.0, 0.87)),
+    intern_color((0.0, 0.0, 0.0, 0.54)),
+)
+LIGHT_TEXT = (
+    intern_color((1.0, 1.0, 1.0, 1.0)),
+    intern_color((1.0, 1.0, 1.0, 0.7)),
+)
+
+
+def hex_to_rgba(value):
+    value = value.lstrip("#")
+    return intern_color(
+        (
+            int(value[0:2], 16) / 255.0,
+            int(value[2:4], 16) / 255.0,
+            int(value[4:6], 16) / 255.0,
+            int(value[6:8], 16) / 255.0 if len(value) == 8 else 1.0,
+        )
+    )
+
+
+def shade(rgba, amount):
+    """Mixes `rgba` with white when `amount` is positive, with black when
+    it is negative."""
+
+    r, g, b, a = rgba
+    if amount >= 0:
+        return intern_color(
+            (
+                r + (1 - r) * amount,
+                g + (1 - g) * amount,
+                b + (1 - b) * amount,
+                a,
+            )
+        )
+    return intern_color(
+        (r * (1 + amount), g * (1 + amount), b * (1 + amount), a)
+    )
+
+
+@lru_cache(maxsize=256)
+def pressed_color(rgba):
+    """Returns the pressed variant of the ``rgba`` tuple `rgba`."""
+
+    r, g, b, a = rgba
+    return intern_color(
+        (r * PRESSED_FACTOR, g * PRESSED_FACTOR, b * PRESSED_FACTOR, a)
+    )
+
+
+def contrast_colors(rgba):
+    """Returns the ``(text, secondary text)`` colors readable on `rgba`."""
+
+    r, g, b = rgba[:3]
+    if 0.299 * r + 0.587 * g + 0.114 * b > LUMINANCE_THRESHOLD:
+        return DARK_TEXT
+    return LIGHT_TEXT
+
+
+def derive_palette(hex_value):
+    base = hex_to_rgba(hex_value)
+    text, secondary_text = contrast_colors(base)
+    return PaletteColors(
+        base,
+        shade(base, LIGHT_SHADE),
+        shade(base, -DARK_SHADE),
+        pressed_color(base),
+        text,
+        secondary_text,
+    )
+
+
+palette_colors = {
+    name: derive_palette(definition["BASE"])
+    for name, definition in colors.items()
+}
+"""``{palette name: PaletteColors}`` of all the palettes."""
+
+style_colors = {
+    "Light": StyleColors(
+        palette_colors["Clouds"].base,
+        palette_colors["Silver"].base,
+        intern_color((0.0, 0.0, 0.0, 0.12)),
+        intern_color((0.6, 0.6, 0.6, 0.4)),
+        *DARK_TEXT,
+    ),
+    "Dark": StyleColors(
+        palette_colors["Midnight Blue"].base,
+        palette_colors["Wet Asphalt"].base,
+        intern_color((1.0, 1.0, 1.0, 0.12)),
+        intern_color((0.8, 0.8, 0.8, 0.25)),
+        *LIGHT_TEXT,
+    ),
+}
+"""``{theme style: StyleColors}``."""
@@ -0,0 +1,116 @@
+"""
+Themes/Icon Level Of Detail
+===========================
+
+Picks how a vector icon is drawn from the size it is actually shown at.
+
+Small icons are rasterized once into a texture and drawn as a single
+textured quad, large icons keep their tessellated vector paths so they stay
+sharp. Sizes are rounded up to a bucket of :data:`BUCKETS` so icons of
+close sizes share one bitmap, and the bitmaps are cached per
+``(key, bucket)`` for the whole process.
+
+The physical size used for the decision comes from :attr:`Window.dpi
+<kivy.core.window.WindowBase.dpi>`, so the same icon stays a bitmap on a
+dense phone screen where it is small to the eye.
+"""
+
+__all__ = ("IconLOD", "icon_lod", "size_bucket", "LOD_BITMAP", "LOD_VECTOR")
+
+from kivy.core.window import Window
+from kivy.graphics import (
+    ClearBuffers,
+    ClearColor,
+    Fbo,
+    PopMatrix,
+    PushMatrix,
+    Scale,
+)
+
+LOD_BITMAP = "bitmap"
+"""Icon drawn from a cached texture."""
+
+LOD_VECTOR = "vector"
+"""Icon drawn from its vector instructions."""
+
+BUCKETS = (16, 24, 32, 48, 64, 96, 128, 192, 256, 384, 512)
+"""Pixel sizes bitmaps are rendered at."""
+
+REFERENCE_DPI = 160.0
+"""Density of one ``dp``, the reference :func:`kivy.metrics.dp` uses."""
+
+
+def size_bucket(pixels):
+    """Returns the smallest bucket holding `pixels` or ``None`` when it
+    exceeds the largest bucket."""
+
+    for bucket in BUCKETS:
+        if pixels <= bucket:
+            return bucket
+    return None
+
+
+class IconLOD:
+    """Level of detail selection and the per bucket bitmap cache."""
+
+    bitmap_max_dp = 96
+    """Largest physical size, in ``dp`` at :data:`REFERENCE_DPI`, drawn
+    from a bitmap."""
+
+    def __init__(self):
+        self._bitmaps = {}
+
+    def select(self, pixels, dpi=None):
+        """Returns ``(lod, bucket)`` for an icon shown `pixels` wide."""
+
+        dpi = dpi or Window.dpi or REFERENCE_DPI
+        bucket = size_bucket(pixels)
+        if bucket is not None and (
+            pixels * REFERENCE_DPI / dpi <= self.bitmap_max_dp
+        ):
+            return LOD_BITMAP, bucket
+        return LOD_VECTOR, None
+
+    def get_bitmap(self, key, bucket, size, instruction):
+        """Returns the texture of `key` rendered at `bucket` pixels.
+
+        `size` is the ``(width, height)`` of the artwork and `instruction`
+        a callable returning the instruction drawing it; it is only called
+        on a cache miss and the instruction is kept by the framebuffer so
+        it can be redrawn after a GL context loss. The longest side of the
+        artwork is scaled to `bucket`.
+        """
+
+        cache_key = (key, bucket)
+        fbo = self._bitmaps.get(cache_key)
+        if fbo is None:
+            factor = bucket / float(max(size))
+            fbo = Fbo(
+                size=(
+                    max(1, int(round(size[0] * factor))),
+                    max(1, int(round(size[1] * factor))),
+                )
+            )
+            with fbo:
+                ClearColor(0, 0, 0, 0)
+                ClearBuffers()
+                PushMatrix()
+                Scale(factor, factor, 1)
+            fbo.add(instruction())
+            fbo.add(PopMatrix())
+            fbo.draw()
+            self._bitmaps[cache_key] = fbo
+        return fbo.texture
+
+    def clear(self, key=None):
+        """Drops the cached bitmaps of `key`, or all of them."""
+
+        if key is None:
+            self._bitmaps.clear()
+        else:
+            for cache_key in [k for k in self._bitmaps if k[0] == key]:
+                del self._bitmaps[cache_key]
+
+
+icon_lod = IconLOD()
+"""Shared :class:`IconLOD` instance."""
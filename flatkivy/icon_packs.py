@@ -0,0 +1,361 @@
+"""
+Themes/Icon Packs
+=================
+
+FlatKivy ships more than one icon font. Every font is described by an
+:class:`IconPack` and registered in the module level :data:`icon_registry`.
+A pack only loads its index, memory-mapping its compiled table when there
+is one, and registers its font with :class:`~kivy.core.text.LabelBase` the
+first time one of its icons is used.
+
+Qualified names are looked up in their own pack. Bare names are looked up
+in a dictionary of the names of the packs, which is filled pack by pack in
+registration order until the name is found, so packs after the first match
+are never loaded.
+
+Icons are addressed either by their bare name or by a ``"pack:name"``
+qualified name:
+
+.. code-block:: python
+
+    from flatkivy.uix.label import FlatIcon
+
+    FlatIcon(icon="App-Amethyst")            # searched in the default pack
+    FlatIcon(icon="glyphicons:triangle-up")  # only loads the glyphicons pack
+
+Each icon is a list of layers, every layer being ``[rgba, code]`` exactly like
+the entries of :data:`flatkivy.icon_definitions.flat_icons`.
+"""
+
+__all__ = ("IconPack", "IconRegistry", "icon_registry")
+
+import ast
+import importlib
+import importlib.util
+import json
+import os
+from bisect import bisect_left
+
+from kivy.core.text import LabelBase
+from kivy.logger import Logger
+
+from flatkivy import path
+from flatkivy.icon_search import IconSearchIndex
+from flatkivy.icon_table import MappedIconTable
+
+DEFAULT_LAYER_COLOR = [0.0, 0.0, 0.0, 1]
+"""Color of the layer of single color icons without a ``fill`` entry."""
+
+
+def parse_selection(selection):
+    """Converts an IcoMoon ``selection.json`` document into icon layers.
+
+    Uses the same rules as :mod:`flatkivy.tools.update_icons`: attributes
+    without a ``fill`` are skipped and icons without attributes become a
+    single layer of :data:`DEFAULT_LAYER_COLOR`.
+    """
+
+    icons = {}
+    for icon in selection["icons"]:
+        properties = icon["properties"]
+        layers = []
+        for index, attr in enumerate(icon.get("attrs") or []):
+            if not attr or attr.get("fill", "none") == "none":
+                continue
+            color = [
+                c / 255 for c in ast.literal_eval(attr["fill"].strip("rgb"))
+            ]
+            color.append(attr.get("opacity", 1))
+            if "codes" in properties:
+                code = properties["codes"][index]
+            else:
+                code = properties["code"]
+            layers.append([color, chr(code)])
+        if not layers:
+            layers.append([DEFAULT_LAYER_COLOR[:], chr(properties["code"])])
+        icons[properties["name"]] = layers
+    return icons
+
+
+class IconPack:
+    """An icon font together with its lazily loaded index."""
+
+    def __init__(
+        self,
+        name,
+        font_name,
+        font_file,
+        selection_file=None,
+        definitions=None,
+        table_file=None,
+    ):
+        self.name = name
+        """Name of the pack, used as prefix in ``"pack:name"`` icon names."""
+
+        self.font_name = font_name
+        """Name the font is registered under in ``LabelBase``."""
+
+        self.font_file = font_file
+        """Path to the ``.ttf`` file of the pack."""
+
+        self.selection_file = selection_file
+        """Path to the IcoMoon ``selection.json`` of the pack."""
+
+        self.definitions = definitions
+        """Dotted path of a module with a precompiled ``flat_icons`` dict.
+        Takes precedence over :attr:`selection_file`."""
+
+        self.table_file = table_file
+        """Path to the compiled :mod:`~flatkivy.icon_table` of the pack.
+        When the file is at least as recent as the source of the pack, see
+        :meth:`has_fresh_table`, it is memory-mapped instead of loading
+        :attr:`definitions` or :attr:`selection_file`."""
+
+        self._icons = None
+        self._font_registered = False
+
+    @property
+    def loaded(self):
+        return self._icons is not None
+
+    @property
+    def icons(self):
+        """Mapping of icon names to their layers."""
+
+        if self._icons is None:
+            if self.has_fresh_table():
+                self._icons = MappedIconTable(self.table_file)
+            else:
+                self._icons = self.load_source()
+        return self._icons
+
+    @property
+    def source_file(self):
+        """Path to the file :meth:`load_source` reads, found without
+        importing :attr:`definitions`."""
+
+        if self.definitions:
+            spec = importlib.util.find_spec(self.definitions)
+            return spec.origin if spec is not None else None
+        return self.selection_file
+
+    def has_fresh_table(self):
+        """``True`` if :attr:`table_file` exists and is at least as recent
+        as :attr:`source_file`. An outdated table is ignored, with a
+        warning, so icons added to the source are not hidden by it."""
+
+        if not self.table_file or not os.path.exists(self.table_file):
+            return False
+        source = self.source_file
+        if not source or not os.path.exists(source):
+            return True
+        if os.path.getmtime(self.table_file) >= os.path.getmtime(source):
+            return True
+        Logger.warning(
+            f"FlatKivy: {self.table_file} is older than {source}, run "
+            f"flatkivy/tools/compile_icon_table.py to update it"
+        )
+        return False
+
+    def load_source(self):
+        """Builds the index dict from :attr:`definitions` or
+        :attr:`selection_file`, ignoring :attr:`table_file`."""
+
+        if self.definitions:
+            return importlib.import_module(self.definitions).flat_icons
+        with open(self.selection_file) as f:
+            return parse_selection(json.load(f))
+
+    def register_font(self):
+        if not self._font_registered:
+            LabelBase.register(name=self.font_name, fn_regular=self.font_file)
+            self._font_registered = True
+        return self.font_name
+
+    def get(self, name):
+        return self.icons.get(name)
+
+
+class IconRegistry:
+    """Merged, lazily built index over all registered :class:`IconPack`."""
+
+    separator = ":"
+
+    def __init__(self):
+        self._packs = {}
+        self._lookup = {}
+        self._unindexed = []
+        self._names = []
+        self._search_index = None
+        self._index_dirty = True
+
+    @property
+    def packs(self):
+        return list(self._packs.values())
+
+    @property
+    def default_pack(self):
+        return next(iter(self._packs.values()), None)
+
+    def register_pack(self, pack):
+        """Registers `pack`. The first registered pack is the default one
+        and wins when a bare icon name exists in several packs."""
+
+        replaced = pack.name in self._packs
+        self._packs[pack.name] = pack
+        if replaced:
+            self._lookup = {}
+            self._unindexed = list(self._packs.values())
+        else:
+            self._unindexed.append(pack)
+        self._index_dirty = True
+        return pack
+
+    def _index_next_pack(self):
+        pack = self._unindexed.pop(0)
+        lookup = self._lookup
+        for name in pack.icons:
+            lookup.setdefault(name, (pack, name))
+
+    def _find(self, icon):
+        """Returns ``(pack, name)`` for `icon` or ``None`` if unknown,
+        without reading its layers."""
+
+        pack, name = self.split_name(icon)
+        if pack is not None:
+            return (pack, name) if name in pack.icons else None
+        found = self._lookup.get(icon)
+        while found is None and self._unindexed:
+            self._index_next_pack()
+            found = self._lookup.get(icon)
+        return found
+
+    def get_pack(self, name):
+        try:
+            return self._packs[name]
+        except KeyError:
+            raise ValueError(
+                f"FlatKivy: unknown icon pack '{name}'. Available packs: "
+                f"{', '.join(self._packs)}"
+            )
+
+    def split_name(self, icon):
+        """Returns ``(pack, name)`` for `icon`; `pack` is ``None`` for bare
+        names."""
+
+        pack_name, sep, name = icon.partition(self.separator)
+        if sep and pack_name in self._packs:
+            return self._packs[pack_name], name
+        return None, icon
+
+    def resolve(self, icon):
+        """Returns ``(pack, layers)`` for `icon` or ``None`` if unknown.
+
+        Qualified names only load their own pack. Bare names are looked up
+        in the first registered pack having them, loading the packs in
+        registration order until one has them.
+        """
+
+        found = self._find(icon)
+        if found is None:
+            return None
+        pack, name = found
+        return pack, pack.get(name)
+
+    def __getitem__(self, icon):
+        resolved = self.resolve(icon)
+        if resolved is None:
+            raise KeyError(icon)
+        return resolved
+
+    def __contains__(self, icon):
+        return self._find(icon) is not None
+
+    def _build_index(self):
+        while self._unindexed:
+            self._index_next_pack()
+        names = set(self._lookup)
+        for pack in self._packs.values():
+            names.update(
+                f"{pack.name}{self.separator}{name}" for name in pack.icons
+            )
+        self._names = sorted(names)
+        self._search_index = None
+        self._index_dirty = False
+
+    @property
+    def names(self):
+        """Sorted list of every bare and qualified icon name. Building it
+        loads the index of every pack."""
+
+        if self._index_dirty:
+            self._build_index()
+        return self._names
+
+    def search_prefix(self, prefix, limit=None):
+        """Returns the icon names starting with `prefix`, in sorted order."""
+
+        names = self.names
+        found = []
+        for index in range(bisect_left(names, prefix), len(names)):
+            name = names[index]
+            if not name.startswith(prefix):
+                break
+            found.append(name)
+            if limit is not None and len(found) >= limit:
+                break
+        return found
+
+    @property
+    def search_index(self):
+        """:class:`~flatkivy.icon_search.IconSearchIndex` over the qualified
+        names of every pack, the pack name being an extra tag."""
+
+        if self._index_dirty or self._search_index is None:
+            names = self.names
+            qualified = [n for n in names if self.separator in n]
+            self._search_index = IconSearchIndex(
+                qualified, extra_tags=lambda n: [n.split(self.separator)[0]]
+            )
+        return self._search_index
+
+    def search(self, query, limit=None):
+        """Returns the qualified icon names matching `query`, ranked.
+        See :mod:`flatkivy.icon_search`."""
+
+        return self.search_index.search(query, limit)
+
+    def search_session(self, limit=None):
+        return self.search_index.session(limit)
+
+
+icon_registry = IconRegistry()
+"""Registry with the packs shipped with FlatKivy."""
+
+icon_registry.register_pack(
+    IconPack(
+        "iconmoon",
+        "Icons",
+        os.path.join(path, "icons", "iconmoon", "icomoon.ttf"),
+        selection_file=os.path.join(
+            path, "icons", "iconmoon", "selection.json"
+        ),
+        definitions="flatkivy.icon_definitions",
+        table_file=os.path.join(path, "icons", "iconmoon", "icomoon.fkit"),
+    )
+)
+icon_registry.register_pack(
+    IconPack(
+        "glyphicons",
+        "FlatUIProIcons",
+        os.path.join(
+            path, "icons", "glyphicons", "flat-ui-pro-icons-regular.ttf"
+        ),
+        selection_file=os.path.join(
+            path, "icons", "glyphicons", "selection.json"
+        ),
+        table_file=os.path.join(
+            path, "icons", "glyphicons", "flat-ui-pro-icons-regular.fkit"
+        ),
+    )
+)
@@ -0,0 +1,258 @@
+"""
+Themes/Icon Search
+==================
+
+Search index over icon names for icon pickers.
+
+Every name is split into lowercase tags (``"Apps-Adobe-Lightroom"`` gives
+``apps``, ``adobe`` and ``lightroom``, ``"MacBookPro"`` gives ``mac``,
+``book`` and ``pro``). The index keeps a sorted array of tags for prefix
+lookups and trigram postings for substring and typo tolerant matches, so a
+query only touches the entries sharing a tag prefix or a trigram with it.
+
+.. code-block:: python
+
+    from flatkivy.icon_packs import icon_registry
+
+    icon_registry.search("adobe light")
+    # ['iconmoon:Apps-Adobe-Lightroom', ...]
+
+    session = icon_registry.search_session()
+    session.update("ado")
+    session.update("adob")  # tag prefixes looked up among those of "ado"
+"""
+
+__all__ = ("IconSearchIndex", "IconSearchSession", "extract_tags")
+
+import re
+from bisect import bisect_left
+
+_camel_re = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+[a-zA-Z]*")
+_split_re = re.compile(r"[^0-9A-Za-z]+")
+
+SCORE_TAG = 4
+"""Score of a query token equal to a tag."""
+
+SCORE_TAG_PREFIX = 3
+"""Score of a query token that is the prefix of a tag."""
+
+SCORE_SUBSTRING = 2
+"""Score of a query token found inside the name."""
+
+SCORE_FUZZY = 1
+"""Score of a query token sharing at least :data:`FUZZY_THRESHOLD` of its
+trigrams with the name, scaled by the shared fraction."""
+
+FUZZY_THRESHOLD = 0.5
+
+
+def extract_tags(name):
+    """Returns the lowercase tags of an icon name.
+
+    Names are split on any non alphanumeric character, each part is kept
+    as a tag and is also split on ``camelCase`` boundaries.
+    """
+
+    tags = []
+    for part in _split_re.split(name):
+        if not part:
+            continue
+        lowered = part.lower()
+        if lowered not in tags:
+            tags.append(lowered)
+        for word in _camel_re.findall(part):
+            word = word.lower()
+            if word not in tags:
+                tags.append(word)
+    return tags
+
+
+def _normalize(text):
+    return _split_re.sub("", text).lower()
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _tokenize(query):
+    return [token for token in _split_re.split(query.lower()) if token]
+
+
+class IconSearchIndex:
+    """Precomputed tag and trigram index over a list of icon names."""
+
+    def __init__(self, names, extra_tags=None):
+        self.names = list(names)
+        """Indexed names, entries are referred to by their position here."""
+
+        self._keys = [_normalize(name) for name in self.names]
+        self._tags = [None] * len(self.names)
+        tag_pairs = []
+        postings = {}
+        for entry, name in enumerate(self.names):
+            tags = extract_tags(name)
+            if extra_tags:
+                tags.extend(t for t in extra_tags(name) if t not in tags)
+            self._tags[entry] = frozenset(tags)
+            for tag in tags:
+                tag_pairs.append((tag, entry))
+            for gram in _trigrams(self._keys[entry]):
+                postings.setdefault(gram, []).append(entry)
+        tag_pairs.sort()
+        self._tag_keys = [tag for tag, _ in tag_pairs]
+        self._tag_entries = [entry for _, entry in tag_pairs]
+        self._postings = {gram: tuple(e) for gram, e in postings.items()}
+
+    def __len__(self):
+        return len(self.names)
+
+    def tags(self, name_or_entry):
+        if isinstance(name_or_entry, str):
+            name_or_entry = self.names.index(name_or_entry)
+        return sorted(self._tags[name_or_entry])
+
+    def tag_prefix_entries(self, token, within=None):
+        """Returns the entries having a tag starting with `token`, looked up
+        among `within` when given."""
+
+        if within is not None:
+            return {
+                entry
+                for entry in within
+                if any(tag.startswith(token) for tag in self._tags[entry])
+            }
+        keys = self._tag_keys
+        found = set()
+        for index in range(bisect_left(keys, token), len(keys)):
+            if not keys[index].startswith(token):
+                break
+            found.add(self._tag_entries[index])
+        return found
+
+    def _gram_counts(self, grams):
+        counts = {}
+        for gram in grams:
+            for entry in self._postings.get(gram, ()):
+                counts[entry] = counts.get(entry, 0) + 1
+        return counts
+
+    def _score_token(self, token, candidates=None, prefix_entries=None):
+        """Returns ``{entry: score}`` for the entries matching `token`,
+        restricted to `candidates` when given. `prefix_entries` are the
+        entries of :meth:`tag_prefix_entries` when already known."""
+
+        if prefix_entries is None:
+            prefix_entries = self.tag_prefix_entries(token)
+        scores = {}
+        for entry in prefix_entries:
+            if candidates is not None and entry not in candidates:
+                continue
+            if token in self._tags[entry]:
+                scores[entry] = SCORE_TAG
+            else:
+                scores[entry] = SCORE_TAG_PREFIX
+        grams = _trigrams(token)
+        if not grams:
+            return scores
+        needed = max(1, int(len(grams) * FUZZY_THRESHOLD + 0.5))
+        for entry, count in self._gram_counts(grams).items():
+            if entry in scores or count < needed:
+                continue
+            if candidates is not None and entry not in candidates:
+                continue
+            if count == len(grams) and token in self._keys[entry]:
+                scores[entry] = SCORE_SUBSTRING
+            else:
+                scores[entry] = SCORE_FUZZY * count / len(grams)
+        return scores
+
+    def score(self, query, candidates=None, last_prefix_entries=None):
+        """Returns ``{entry: score}`` for the entries matching every token
+        of `query`. `last_prefix_entries` are the tag prefix entries of the
+        last token, when already known."""
+
+        tokens = _tokenize(query)
+        total = None
+        for position, token in enumerate(tokens):
+            scores = self._score_token(
+                token,
+                candidates if total is None else total,
+                last_prefix_entries if position == len(tokens) - 1 else None,
+            )
+            if total is None:
+                total = scores
+            else:
+                total = {
+                    entry: total[entry] + score
+                    for entry, score in scores.items()
+                }
+            if not total:
+                break
+        return total or {}
+
+    def rank(self, scores, limit=None):
+        """Sorts the entries of `scores` best first; ties prefer shorter
+        names."""
+
+        names = self.names
+        ranked = sorted(
+            scores, key=lambda e: (-scores[e], len(names[e]), names[e])
+        )
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [names[entry] for entry in ranked]
+
+    def search(self, query, limit=None):
+        """Returns the names matching `query`, best match first."""
+
+        return self.rank(self.score(query), limit)
+
+    def session(self, limit=None):
+        return IconSearchSession(self, limit)
+
+
+class IconSearchSession:
+    """Incremental search for search-as-you-type fields.
+
+    When the new query extends the last word of the previous one, the
+    entries with a tag starting with that word are looked up among the
+    previous ones instead of the whole index. Substring and fuzzy matches
+    are not narrowed that way, a longer word can match names the shorter
+    one did not, so they are computed again: the results are always those
+    of :meth:`IconSearchIndex.search`.
+    """
+
+    def __init__(self, index, limit=None):
+        self.index = index
+        self.limit = limit
+        self.query = ""
+        self.results = []
+        self._prefix_entries = None
+
+    def update(self, query):
+        if query == self.query:
+            return self.results
+        tokens = _tokenize(query)
+        previous = _tokenize(self.query)
+        prefix_entries = None
+        if tokens:
+            within = None
+            if (
+                self._prefix_entries is not None
+                and previous
+                and tokens[:-1] == previous[:-1]
+                and tokens[-1].startswith(previous[-1])
+            ):
+                within = self._prefix_entries
+            prefix_entries = self.index.tag_prefix_entries(tokens[-1], within)
+        scores = self.index.score(query, last_prefix_entries=prefix_entries)
+        self.query = query
+        self._prefix_entries = prefix_entries
+        self.results = self.index.rank(scores, self.limit)
+        return self.results
+
+    def clear(self):
+        self.query = ""
+        self.results = []
+        self._prefix_entries = None
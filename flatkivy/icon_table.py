@@ -0,0 +1,175 @@
+"""
+Themes/Icon Table
+=================
+
+Compiled, memory-mapped form of an icon pack index.
+
+The layers of every icon are stored in a flat binary file that is opened
+with :mod:`mmap` and read through :class:`memoryview` casts, so processes
+showing the same pack share the pages of the file in the OS page cache
+instead of each building a dictionary of Python lists and floats.
+
+Layout (little endian, every section aligned to 8 bytes)::
+
+    header   magic "FKIT", version u32, icon count u32, layer count u32,
+             names offset u32, records offset u32, colors offset u32,
+             codes offset u32
+    names    utf-8 icon names, concatenated in sorted order
+    records  per icon: name offset u32, name length u32, first layer u32,
+             layer count u32
+    colors   per layer: r, g, b, a float64, the values of the source
+    codes    per layer: code point u32
+
+Tables are written by ``flatkivy/tools/compile_icon_table.py``.
+"""
+
+__all__ = ("MappedIconTable", "write_icon_table")
+
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Mapping
+
+MAGIC = b"FKIT"
+VERSION = 2
+
+_header = struct.Struct("<4s7I")
+_RECORD_FIELDS = 4
+
+
+def _pad(data):
+    return data + b"\0" * (-len(data) % 8)
+
+
+def write_icon_table(icons, filename):
+    """Writes the ``{name: [[rgba, code], ...]}`` dict `icons` to
+    `filename`."""
+
+    names = sorted(icons)
+    name_blob = bytearray()
+    records = array("I")
+    colors = array("d")
+    codes = array("I")
+    for name in names:
+        encoded = name.encode("utf-8")
+        records.extend((len(name_blob), len(encoded), len(codes)))
+        records.append(len(icons[name]))
+        name_blob += encoded
+        for color, code in icons[name]:
+            colors.extend(color)
+            codes.append(ord(code))
+    if sys.byteorder != "little":
+        for section in (records, colors, codes):
+            section.byteswap()
+
+    sections = [_pad(bytes(name_blob)), records.tobytes()]
+    sections += [colors.tobytes(), codes.tobytes()]
+    offsets = []
+    offset = _header.size
+    for section in sections:
+        offsets.append(offset)
+        offset += len(section)
+    with open(filename, "wb") as f:
+        f.write(
+            _header.pack(MAGIC, VERSION, len(names), len(codes), *offsets)
+        )
+        for section in sections:
+            f.write(section)
+
+
+class MappedIconTable(Mapping):
+    """Read only ``{name: layers}`` mapping over a compiled icon table.
+
+    Lookups binary search the sorted names directly in the mapped file;
+    the layers of an icon are only turned into Python objects when the icon
+    is requested.
+    """
+
+    def __init__(self, filename):
+        if sys.byteorder != "little":
+            raise ValueError(
+                "FlatKivy: compiled icon tables need a little endian host"
+            )
+        with open(filename, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.filename = filename
+        self._buffer = buffer = memoryview(self._mmap)
+        (
+            magic,
+            version,
+            self._count,
+            layers,
+            names_offset,
+            records_offset,
+            colors_offset,
+            codes_offset,
+        ) = _header.unpack_from(buffer)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(
+                f"FlatKivy: '{filename}' is not a version {VERSION} "
+                f"icon table"
+            )
+        self._names = buffer[names_offset:records_offset]
+        self._records = buffer[
+            records_offset:records_offset + self._count * 16
+        ].cast("I")
+        self._colors = buffer[colors_offset:colors_offset + layers * 32].cast(
+            "d"
+        )
+        self._codes = buffer[codes_offset:codes_offset + layers * 4].cast("I")
+
+    def _name(self, index):
+        start = self._records[index * _RECORD_FIELDS]
+        length = self._records[index * _RECORD_FIELDS + 1]
+        return bytes(self._names[start:start + length])
+
+    def _find(self, name):
+        key = name.encode("utf-8")
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._name(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._count and self._name(low) == key:
+            return low
+        return -1
+
+    def layer_range(self, name):
+        """Returns the ``range`` of layer indices of `name`."""
+
+        index = self._find(name)
+        if index < 0:
+            raise KeyError(name)
+        first = self._records[index * _RECORD_FIELDS + 2]
+        return range(first, first + self._records[index * _RECORD_FIELDS + 3])
+
+    def layer_color(self, layer):
+        return self._colors[layer * 4:layer * 4 + 4]
+
+    def layer_code(self, layer):
+        return chr(self._codes[layer])
+
+    def __getitem__(self, name):
+        return [
+            [self.layer_color(layer).tolist(), self.layer_code(layer)]
+            for layer in self.layer_range(name)
+        ]
+
+    def __contains__(self, name):
+        return self._find(name) >= 0
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self._name(index).decode("utf-8")
+
+    def close(self):
+        for view in (self._names, self._records, self._colors, self._codes):
+            view.release()
+        self._buffer.release()
+        self._mmap.close()
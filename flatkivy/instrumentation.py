@@ -0,0 +1,162 @@
+"""
+Themes/Instrumentation
+======================
+
+Opt-in counters of the time spent in FlatKivy's hot methods.
+
+Set ``FLATKIVY_INSTRUMENT=1`` before starting the app to record every call
+of the methods decorated with :func:`instrumented`: widget construction,
+theme callbacks, ripple canvas setup, button color updates and toolbar
+action bar updates. Each call is counted and timed per widget class, and
+the last calls are kept in a ring buffer of ``FLATKIVY_INSTRUMENT_BUFFER``
+entries (``100000`` by default).
+
+.. code-block:: python
+
+    from flatkivy.instrumentation import recorder
+
+    recorder.summary()  # {"FlatLabel.update_font_style": {...}, ...}
+    recorder.export_json("counters.json")
+    recorder.export_chrome_trace("trace.json")  # chrome://tracing
+
+With ``FLATKIVY_INSTRUMENT_TRACE=trace.json`` the Chrome trace is written
+when the process exits.
+
+When the variable is not set :func:`instrumented` returns the methods
+unchanged, so instrumentation costs nothing.
+"""
+
+__all__ = ("ENABLED", "Recorder", "instrumented", "recorder")
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+ENABLED = os.environ.get("FLATKIVY_INSTRUMENT", "") not in ("", "0")
+"""Whether ``FLATKIVY_INSTRUMENT`` enabled instrumentation."""
+
+
+class Recorder:
+    """Per class call counters and a ring buffer of the last calls."""
+
+    def __init__(self, size=100000):
+        self.events = deque(maxlen=size)
+        """``(name, start, duration, thread id)`` of the last calls, times
+        in seconds from :func:`time.perf_counter`."""
+
+        self.counters = {}
+        """``{name: [calls, total seconds]}``."""
+
+        self._lock = threading.Lock()
+
+    def record(self, name, start, duration):
+        with self._lock:
+            self.events.append(
+                (name, start, duration, threading.get_ident())
+            )
+            counter = self.counters.get(name)
+            if counter is None:
+                self.counters[name] = [1, duration]
+            else:
+                counter[0] += 1
+                counter[1] += duration
+
+    def clear(self):
+        with self._lock:
+            self.events.clear()
+            self.counters.clear()
+
+    def summary(self):
+        """Returns ``{name: {"calls", "total_ms", "mean_ms"}}`` sorted by
+        total time."""
+
+        with self._lock:
+            items = sorted(
+                self.counters.items(), key=lambda item: -item[1][1]
+            )
+        return {
+            name: {
+                "calls": calls,
+                "total_ms": total * 1000,
+                "mean_ms": total * 1000 / calls,
+            }
+            for name, (calls, total) in items
+        }
+
+    def export_json(self, filename):
+        with open(filename, "w") as f:
+            json.dump(self.summary(), f, indent=2)
+
+    def export_chrome_trace(self, filename):
+        """Writes the ring buffer in the Trace Event Format read by
+        ``chrome://tracing`` and Perfetto."""
+
+        pid = os.getpid()
+        with self._lock:
+            events = list(self.events)
+        trace = [
+            {
+                "name": name,
+                "cat": name.split(".", 1)[0],
+                "ph": "X",
+                "ts": start * 1e6,
+                "dur": duration * 1e6,
+                "pid": pid,
+                "tid": tid,
+            }
+            for name, start, duration, tid in events
+        ]
+        with open(filename, "w") as f:
+            json.dump({"traceEvents": trace}, f)
+
+
+recorder = Recorder(int(os.environ.get("FLATKIVY_INSTRUMENT_BUFFER", 100000)))
+"""Shared :class:`Recorder` instance."""
+
+
+_active = threading.local()
+
+
+def instrumented(method):
+    """Decorates a method to record its calls under
+    ``"<class of self>.<method name>"`` when instrumentation is enabled.
+
+    Overrides calling the decorated method of their base class through
+    :func:`super` are recorded once, as the outermost call.
+    """
+
+    if not ENABLED:
+        return method
+    method_name = method.__name__
+    perf_counter = time.perf_counter
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        calls = getattr(_active, "calls", None)
+        if calls is None:
+            calls = _active.calls = set()
+        key = (id(self), method_name)
+        if key in calls:
+            return method(self, *args, **kwargs)
+        calls.add(key)
+        start = perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            duration = perf_counter() - start
+            calls.discard(key)
+            recorder.record(
+                f"{type(self).__name__}.{method_name}", start, duration
+            )
+
+    return wrapper
+
+
+if ENABLED and os.environ.get("FLATKIVY_INSTRUMENT_TRACE"):
+    atexit.register(
+        recorder.export_chrome_trace, os.environ["FLATKIVY_INSTRUMENT_TRACE"]
+    )
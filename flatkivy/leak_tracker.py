@@ -0,0 +1,337 @@
+"""
+Themes/Leak Tracker
+===================
+
+Debug mode tracking every :class:`~flatkivy.theming.ThemableBehavior`
+instance to find widgets kept alive after they left the widget tree.
+
+Themable widgets bind callbacks on the shared
+:class:`~flatkivy.theming.ThemeManager`, so a discarded widget can stay
+reachable from it or from anything else holding one of its methods.
+Tracking is enabled with ``FLATKIVY_TRACK_LEAKS=1`` or
+:meth:`LeakTracker.enable`, before the widgets are created. Instances are
+only held through weak references.
+
+.. code-block:: python
+
+    from flatkivy.leak_tracker import leak_tracker
+
+    leak_tracker.dump("before.json")
+    ...  # open and close the screen suspected of leaking
+    leak_tracker.dump("after.json")
+
+then compare the two snapshots:
+
+.. code-block:: bash
+
+    python flatkivy/tools/leak_diff.py before.json after.json
+
+A widget is reported as an orphan when it is still alive, after a garbage
+collection, while the top of its parent chain is not the window. Screens
+held by a :class:`~kivy.uix.screenmanager.ScreenManager` but not shown are
+not orphans, nor are widgets kept for reuse by a tracked widget in the
+tree: a widget keeping a pool, like the action buttons of a
+:class:`~flatkivy.uix.toolbar.FlatToolbar`, lists it from a
+``pooled_widgets()`` method.
+
+Orphans come with what keeps them alive: the property bindings of the app,
+the theme manager, the window and the widgets in the tree whose callbacks
+hold them, and the reference paths found by walking
+:func:`gc.get_referrers` back to a module, a class or the window.
+"""
+
+__all__ = ("LeakTracker", "diff_snapshots", "leak_tracker")
+
+import functools
+import gc
+import json
+import os
+import time
+import types
+import weakref
+from collections import Counter, deque
+
+MAX_PATH_DEPTH = 8
+"""Longest reference path searched from an orphan."""
+
+MAX_PATHS = 3
+"""Most reference paths reported per orphan."""
+
+
+class LeakTracker:
+    def __init__(self):
+        self.enabled = False
+        self._instances = {}
+        self._serial = 0
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def track(self, instance):
+        self._serial += 1
+        key = self._serial
+        self._instances[key] = (
+            weakref.ref(instance, lambda ref: self._instances.pop(key, None)),
+            time.monotonic(),
+        )
+
+    def instances(self):
+        """Returns ``[(serial, instance, created), ...]`` of the live tracked
+        instances."""
+
+        live = []
+        for serial, (ref, created) in list(self._instances.items()):
+            instance = ref()
+            if instance is not None:
+                live.append((serial, instance, created))
+        return live
+
+    def counts(self):
+        return Counter(
+            type(instance).__name__ for _, instance, _ in self.instances()
+        )
+
+    def orphans(self, min_age=1.0):
+        """Returns the tracked widgets out of the widget tree and created
+        more than `min_age` seconds ago."""
+
+        return [self._get(serial) for serial in self._orphan_serials(min_age)]
+
+    def _orphan_serials(self, min_age):
+        gc.collect()
+        now = time.monotonic()
+        live = self.instances()
+        pooled = _pooled_ids(instance for _, instance, _ in live)
+        serials = []
+        for serial, instance, created in live:
+            if now - created >= min_age and not _in_tree(instance, pooled):
+                serials.append(serial)
+        return serials
+
+    def _get(self, serial):
+        entry = self._instances.get(serial)
+        return entry[0]() if entry else None
+
+    def retention_paths(self, instance, max_depth=MAX_PATH_DEPTH):
+        """Returns up to :data:`MAX_PATHS` reference paths, each a list of
+        descriptions going from a root to `instance`."""
+
+        # The containers of the search itself refer to the objects too.
+        ignored = {id(self), id(self._instances)}
+        paths = []
+        entry = (instance, [])
+        ignored.add(id(entry))
+        queue = deque([entry])
+        seen = {id(instance)}
+        while queue and len(paths) < MAX_PATHS:
+            target, path = queue.popleft()
+            if len(path) >= max_depth:
+                continue
+            referrers = gc.get_referrers(target)
+            ignored.add(id(referrers))
+            for referrer in referrers:
+                if (
+                    id(referrer) in ignored
+                    or id(referrer) in seen
+                    or isinstance(referrer, types.FrameType)
+                ):
+                    continue
+                seen.add(id(referrer))
+                step = [_describe(referrer, target)] + path
+                if _is_root(referrer):
+                    paths.append(step)
+                    if len(paths) >= MAX_PATHS:
+                        break
+                else:
+                    entry = (referrer, step)
+                    ignored.add(id(entry))
+                    queue.append(entry)
+            del referrers
+        return paths
+
+    def binding_paths(self, instance):
+        """Returns ``"<dispatcher>.<property> -> <callback>"`` for the
+        property bindings of the app, its theme manager, the window and the
+        tracked widgets still in the tree that hold `instance`.
+
+        Those bindings are stored by Kivy where :func:`gc.get_referrers`
+        does not look.
+        """
+
+        from kivy.app import App
+        from kivy.core.window import Window
+
+        app = App.get_running_app()
+        dispatchers = [app, getattr(app, "theme_cls", None), Window]
+        dispatchers += [
+            widget
+            for _, widget, _ in self.instances()
+            if widget is not instance and _in_tree(widget)
+        ]
+        paths = []
+        seen = set()
+        for dispatcher in dispatchers:
+            if dispatcher is None or id(dispatcher) in seen:
+                continue
+            seen.add(id(dispatcher))
+            for name in dispatcher.properties():
+                for callback in dispatcher.get_property_observers(name):
+                    # Kivy holds bound methods weakly, anything else
+                    # strongly in `method`.
+                    target = getattr(callback, "method", callback)
+                    if target is not None and _holds(target, instance):
+                        paths.append(
+                            f"{type(dispatcher).__name__}.{name} -> "
+                            f"{_describe_callback(target)}"
+                        )
+        return paths
+
+    def snapshot(self, min_age=1.0):
+        """Returns the counts per class and the orphans, with their
+        reference paths, as JSON serializable data."""
+
+        orphans = []
+        for serial in self._orphan_serials(min_age):
+            instance = self._get(serial)
+            if instance is None:
+                continue
+            orphans.append(
+                {
+                    "serial": serial,
+                    "class": type(instance).__name__,
+                    "bindings": self.binding_paths(instance),
+                    "paths": self.retention_paths(instance),
+                }
+            )
+            del instance
+        return {
+            "time": time.time(),
+            "counts": dict(self.counts()),
+            "orphans": orphans,
+        }
+
+    def dump(self, filename, min_age=1.0):
+        with open(filename, "w") as f:
+            json.dump(self.snapshot(min_age), f, indent=2)
+
+
+def diff_snapshots(before, after):
+    """Returns ``(count changes, new orphans)`` between two snapshots."""
+
+    classes = set(before["counts"]) | set(after["counts"])
+    changes = {}
+    for name in classes:
+        delta = after["counts"].get(name, 0) - before["counts"].get(name, 0)
+        if delta:
+            changes[name] = delta
+    known = {orphan["serial"] for orphan in before["orphans"]}
+    new_orphans = [o for o in after["orphans"] if o["serial"] not in known]
+    return changes, new_orphans
+
+
+def _in_tree(widget, pooled=()):
+    """Whether `widget` is in the widget tree, or in the subtree of a
+    widget whose id is in `pooled`."""
+
+    from kivy.core.window import WindowBase
+    from kivy.uix.screenmanager import Screen
+
+    if not hasattr(widget, "parent"):
+        return True
+    top = widget
+    while top.parent is not None and top.parent is not top:
+        top = top.parent
+    if isinstance(top, WindowBase) or id(top) in pooled:
+        return True
+    return isinstance(top, Screen) and top.manager is not None
+
+
+def _pooled_ids(instances):
+    """Returns the ids of the widgets listed by the ``pooled_widgets()``
+    method of the `instances` in the tree."""
+
+    pooled = set()
+    for instance in instances:
+        pooled_widgets = getattr(instance, "pooled_widgets", None)
+        if pooled_widgets is not None and _in_tree(instance):
+            pooled.update(id(widget) for widget in pooled_widgets())
+    return pooled
+
+
+def _holds(callback, instance, depth=3):
+    """Whether `instance` is reachable from `callback` in `depth` steps,
+    through partial arguments, closures or bound methods."""
+
+    pending = [callback]
+    seen = set()
+    for _ in range(depth):
+        found = []
+        for obj in pending:
+            if id(obj) in seen:
+                continue
+            seen.add(id(obj))
+            for referent in gc.get_referents(obj):
+                if referent is instance:
+                    return True
+                # A dead proxy raises on any attribute access.
+                if type(referent) not in weakref.ProxyTypes and not isinstance(
+                    referent, (type, types.ModuleType)
+                ):
+                    found.append(referent)
+        pending = found
+    return False
+
+
+def _describe_callback(callback):
+    if isinstance(callback, functools.partial):
+        return f"partial({_describe_callback(callback.func)})"
+    if isinstance(callback, types.MethodType):
+        return f"bound method {callback.__func__.__qualname__}"
+    return getattr(callback, "__qualname__", type(callback).__name__)
+
+
+def _is_root(referrer):
+    from kivy.core.window import WindowBase
+
+    if isinstance(referrer, (types.ModuleType, type, WindowBase)):
+        return True
+    if isinstance(referrer, dict):
+        return referrer.get("__name__") is not None and "__file__" in referrer
+    return False
+
+
+def _describe(referrer, target):
+    name = type(referrer).__name__
+    if isinstance(referrer, dict):
+        if "__file__" in referrer:
+            name = f"module {referrer.get('__name__')}"
+        for key, value in referrer.items():
+            if value is target:
+                return f"{name}[{key!r}]"
+        return name
+    if isinstance(referrer, (list, tuple, deque)):
+        for index, value in enumerate(referrer):
+            if value is target:
+                return f"{name}[{index}]"
+        return name
+    if isinstance(referrer, types.MethodType):
+        return f"bound method {referrer.__func__.__qualname__}"
+    if isinstance(referrer, types.FunctionType):
+        return f"function {referrer.__qualname__}"
+    if isinstance(referrer, types.CellType):
+        return "closure cell"
+    if isinstance(referrer, types.ModuleType):
+        return f"module {referrer.__name__}"
+    if isinstance(referrer, type):
+        return f"class {referrer.__qualname__}"
+    return f"{name} at {id(referrer):#x}"
+
+
+leak_tracker = LeakTracker()
+"""Shared :class:`LeakTracker` instance."""
+
+if os.environ.get("FLATKIVY_TRACK_LEAKS", "") not in ("", "0"):
+    leak_tracker.enable()
@@ -0,0 +1,91 @@
+"""
+Themes/Spatial Index
+====================
+
+Uniform grid of rectangles answering "which rectangles contain this
+point" without testing them all. Used to route touches and pointer
+positions to widgets in constant time in the number of widgets:
+
+.. code-block:: python
+
+    index = SpatialIndex()
+    index.rebuild((child, *child.pos, *child.size) for child in children)
+    index.query(x, y)  # children containing (x, y), in rebuild order
+
+The cell size defaults to the mean size of the rectangles, so most of them
+cover one to four cells. Rectangles covering more than
+:data:`MAX_ITEM_CELLS` cells are kept aside and tested on every query.
+"""
+
+__all__ = ("SpatialIndex",)
+
+from math import floor
+
+MAX_ITEM_CELLS = 64
+"""Number of cells over which a rectangle is tested on every query instead
+of being stored in its cells."""
+
+
+class SpatialIndex:
+    def __init__(self, cell_size=None):
+        self.cell_size = cell_size
+        """``(width, height)`` of the cells, or `None` to use the mean size
+        of the rectangles."""
+
+        self._cells = {}
+        self._large = []
+        self._rects = []
+        self._cell_w = self._cell_h = 1.0
+
+    def rebuild(self, items):
+        """Indexes `items`, an iterable of ``(item, x, y, width, height)``.
+        :meth:`query` returns the items in the same order."""
+
+        rects = [
+            (item, x, y, x + width, y + height)
+            for item, x, y, width, height in items
+        ]
+        self._rects = rects
+        self._cells = cells = {}
+        self._large = large = []
+        if not rects:
+            return
+        if self.cell_size:
+            cell_w, cell_h = self.cell_size
+        else:
+            cell_w = sum(r[3] - r[1] for r in rects) / len(rects)
+            cell_h = sum(r[4] - r[2] for r in rects) / len(rects)
+        self._cell_w = cell_w = max(1.0, cell_w)
+        self._cell_h = cell_h = max(1.0, cell_h)
+        for index, (item, x, y, right, top) in enumerate(rects):
+            col0, col1 = floor(x / cell_w), floor(right / cell_w)
+            row0, row1 = floor(y / cell_h), floor(top / cell_h)
+            if (col1 - col0 + 1) * (row1 - row0 + 1) > MAX_ITEM_CELLS:
+                large.append(index)
+                continue
+            for col in range(col0, col1 + 1):
+                for row in range(row0, row1 + 1):
+                    cell = cells.get((col, row))
+                    if cell is None:
+                        cells[(col, row)] = [index]
+                    else:
+                        cell.append(index)
+
+    def query(self, x, y):
+        """Returns the items whose rectangle contains the point `x`, `y`."""
+
+        candidates = self._cells.get(
+            (floor(x / self._cell_w), floor(y / self._cell_h)), ()
+        )
+        if self._large:
+            candidates = sorted((*candidates, *self._large))
+        rects = self._rects
+        found = []
+        for index in candidates:
+            item, left, bottom, right, top = rects[index]
+            if left <= x <= right and bottom <= y <= top:
+                found.append(item)
+        return found
+
+    def __len__(self):
+        return len(self._rects)
@@ -0,0 +1,154 @@
+"""
+Themes/SVG Cache
+================
+
+Process wide cache of tessellated SVG files.
+
+Entries are keyed by the absolute path and modification time of the file,
+so an edited file is tessellated again while every widget showing an
+unchanged file shares one :class:`~flatkivy.svg_mesh.SvgMeshData`.
+Files with an up to date compiled mesh (see :mod:`flatkivy.svg_mesh`) are
+read from it directly, without parsing nor tessellating.
+
+:meth:`SvgCache.request` tessellates on a worker thread and calls back on
+the main thread through :class:`~kivy.clock.Clock`:
+
+.. code-block:: python
+
+    from flatkivy.svg_cache import svg_cache
+
+    def on_loaded(data):
+        if data is None:
+            ...  # not supported by flatkivy.svg_mesh, use kivy's Svg
+        else:
+            canvas.add(data.instructions())
+
+    svg_cache.request("icon.svg", on_loaded)
+"""
+
+__all__ = ("SvgCache", "svg_cache")
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from kivy.clock import Clock
+from kivy.logger import Logger
+from kivy.weakmethod import WeakMethod
+
+from flatkivy.svg_mesh import (
+    COMPILED_EXTENSION,
+    UnsupportedSvg,
+    compiled_filename,
+    has_compiled_mesh,
+    read_svg_mesh,
+    tessellate_svg,
+)
+
+UNSUPPORTED = object()
+"""Cache value of files :func:`~flatkivy.svg_mesh.tessellate_svg` can not
+draw."""
+
+
+class SvgCache:
+    def __init__(self):
+        self._entries = {}
+        self._pending = {}
+        self._executor = None
+
+    def key(self, filename):
+        """Returns the ``(path, mtime)`` cache key of `filename`."""
+
+        path = os.path.abspath(filename)
+        if os.path.exists(path):
+            return path, os.path.getmtime(path)
+        return path, os.path.getmtime(compiled_filename(path))
+
+    def _store(self, key, value):
+        for old_key in [k for k in self._entries if k[0] == key[0]]:
+            del self._entries[old_key]
+        self._entries[key] = value
+
+    def get(self, filename):
+        """Returns the cached data of `filename`, ``None`` when the file is
+        not cached or not supported."""
+
+        value = self._entries.get(self.key(filename))
+        return None if value is None or value is UNSUPPORTED else value
+
+    def is_cached(self, filename):
+        return self.key(filename) in self._entries
+
+    def is_ready(self, filename):
+        """``True`` if :meth:`load` returns without tessellating."""
+
+        return self.is_cached(filename) or has_compiled_mesh(filename)
+
+    def load(self, filename):
+        """Tessellates `filename` on the calling thread unless cached.
+        Returns ``None`` for unsupported files."""
+
+        key = self.key(filename)
+        if key not in self._entries:
+            self._store(key, self._tessellate(key[0]))
+        value = self._entries[key]
+        return None if value is UNSUPPORTED else value
+
+    def _tessellate(self, path):
+        if has_compiled_mesh(path):
+            if not path.endswith(COMPILED_EXTENSION):
+                path = compiled_filename(path)
+            return read_svg_mesh(path)
+        try:
+            return tessellate_svg(path)
+        except UnsupportedSvg as e:
+            Logger.info(f"FlatKivy: {path} drawn by kivy's Svg ({e})")
+            return UNSUPPORTED
+
+    def request(self, filename, callback):
+        """Calls ``callback(data)`` on the main thread once `filename` is
+        tessellated; immediately if it is cached. `data` is ``None`` for
+        files that are not supported.
+
+        A bound method `callback` is only held weakly until then, so a
+        widget discarded while its file is tessellated is not kept alive
+        and not called.
+        """
+
+        if self.is_ready(filename):
+            callback(self.load(filename))
+            return
+        key = self.key(filename)
+        callbacks = self._pending.get(key)
+        if callbacks is not None:
+            callbacks.append(WeakMethod(callback))
+            return
+        self._pending[key] = [WeakMethod(callback)]
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="flatkivy-svg"
+            )
+        future = self._executor.submit(self._tessellate, key[0])
+        future.add_done_callback(
+            lambda f: Clock.schedule_once(lambda dt: self._deliver(key, f))
+        )
+
+    def _deliver(self, key, future):
+        callbacks = self._pending.pop(key, [])
+        try:
+            value = future.result()
+        except Exception as e:
+            Logger.error(f"FlatKivy: can not load {key[0]}: {e}")
+            value = UNSUPPORTED
+        self._store(key, value)
+        data = None if value is UNSUPPORTED else value
+        for ref in callbacks:
+            callback = ref()
+            if callback is not None:
+                callback(data)
+
+    def clear(self):
+        self._entries.clear()
+
+
+svg_cache = SvgCache()
+"""Shared :class:`SvgCache` instance."""
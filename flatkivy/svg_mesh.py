@@ -0,0 +1,715 @@
+"""
+Themes/SVG Meshes
+=================
+
+Converts SVG files into plain triangle mesh data.
+
+:func:`tessellate_svg` parses the document with :mod:`xml.etree` and
+tessellates every filled shape with :class:`~kivy.graphics.tesselator.Tesselator`.
+Neither step creates graphics instructions, so it can run on a worker
+thread; :meth:`SvgMeshData.instructions` then turns the data into
+:class:`~kivy.graphics.Color` and :class:`~kivy.graphics.Mesh` instructions
+on the main thread.
+
+Only filled shapes are supported: ``path``, ``rect``, ``circle``,
+``ellipse``, ``polygon`` and ``polyline`` inside ``g`` groups with
+transforms, solid fills and opacities. Documents using anything else
+(strokes, gradients, text, clipping...) raise :class:`UnsupportedSvg` and
+should be drawn with :class:`kivy.graphics.svg.Svg` instead.
+
+Compiled meshes
+---------------
+
+``flatkivy/tools/compile_svg_meshes.py`` stores the tessellation of SVG
+files next to them in :data:`COMPILED_EXTENSION` files, read back by
+:func:`read_svg_mesh` without any XML parsing or tessellation. Layout,
+little endian::
+
+    header   magic "FKSM", version u32, width f32, height f32,
+             fill count u32
+    fills    per fill: r, g, b, a f32, vertex count u32, index count u32
+    data     per fill: x, y f32 vertices, then u16 indices padded to
+             4 bytes
+"""
+
+__all__ = (
+    "SvgMeshData",
+    "UnsupportedSvg",
+    "tessellate_svg",
+    "tessellate_polygon",
+    "read_svg_mesh",
+    "write_svg_mesh",
+    "compiled_filename",
+)
+
+import math
+import os
+import re
+import struct
+import sys
+import xml.etree.ElementTree as ET
+from array import array
+
+from kivy.graphics import Color, InstructionGroup, Mesh
+from kivy.graphics.tesselator import (
+    TYPE_POLYGONS,
+    WINDING_NONZERO,
+    WINDING_ODD,
+    Tesselator,
+)
+from kivy.utils import colormap, get_color_from_hex
+
+BEZIER_SEGMENTS = 16
+"""Number of segments a Bézier curve is flattened into."""
+
+ARC_SEGMENT_ANGLE = math.pi / 18
+"""Largest angle covered by one segment of a flattened arc."""
+
+MAX_MESH_VERTICES = 65535
+"""Vertices per :class:`~kivy.graphics.Mesh`, indices are 16 bits."""
+
+MESH_FMT = [(b"vPosition", 2, "float")]
+"""Vertex format of the meshes, fills are flat so no texture coordinates
+are stored."""
+
+_SHAPES = {"path", "rect", "circle", "ellipse", "polygon", "polyline", "line"}
+_CONTAINERS = {"svg", "g", "a"}
+_IGNORED = {
+    "defs",
+    "desc",
+    "metadata",
+    "title",
+    "style",
+    "namedview",
+    "sodipodi:namedview",
+}
+
+COMPILED_EXTENSION = ".fkmesh"
+"""Extension of compiled meshes, appended to the SVG file name."""
+
+MAGIC = b"FKSM"
+VERSION = 1
+
+_header = struct.Struct("<4sIffI")
+_fill = struct.Struct("<4fII")
+
+_number_re = re.compile(r"[-+]?(?:\d*\.\d+|\d+\.?)(?:[eE][-+]?\d+)?")
+_transform_re = re.compile(r"(\w+)\s*\(([^)]*)\)")
+
+
+class UnsupportedSvg(ValueError):
+    """The document uses a feature :func:`tessellate_svg` can not draw."""
+
+
+class SvgMeshData:
+    """Tessellated SVG document.
+
+    :attr:`fills` holds one ``(rgba, vertices, indices)`` entry per mesh,
+    `vertices` being an ``array('f')`` of ``x, y`` values and `indices` an
+    ``array('H')`` of triangles.
+    """
+
+    def __init__(self, width, height, fills=None):
+        self.width = width
+        self.height = height
+        self.fills = fills if fills is not None else []
+
+    @property
+    def size(self):
+        return self.width, self.height
+
+    @property
+    def vertex_count(self):
+        return sum(len(vertices) // 2 for _, vertices, _ in self.fills)
+
+    def instructions(self):
+        """Returns a new :class:`~kivy.graphics.InstructionGroup` drawing
+        the document. Must be called on the main thread."""
+
+        group = InstructionGroup()
+        for rgba, vertices, indices in self.fills:
+            group.add(Color(rgba=rgba))
+            group.add(
+                Mesh(
+                    vertices=vertices,
+                    indices=indices,
+                    mode="triangles",
+                    fmt=MESH_FMT,
+                )
+            )
+        return group
+
+
+def _length(value, default=0.0):
+    if value is None:
+        return default
+    match = _number_re.match(value.strip())
+    if match is None:
+        return default
+    return float(match.group(0))
+
+
+def _multiply(m, n):
+    a, b, c, d, e, f = m
+    A, B, C, D, E, F = n
+    return (
+        a * A + c * B,
+        b * A + d * B,
+        a * C + c * D,
+        b * C + d * D,
+        a * E + c * F + e,
+        b * E + d * F + f,
+    )
+
+
+def _parse_transform(value):
+    matrix = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+    for name, args in _transform_re.findall(value or ""):
+        values = [float(v) for v in _number_re.findall(args)]
+        if name == "matrix" and len(values) == 6:
+            step = tuple(values)
+        elif name == "translate":
+            step = (1, 0, 0, 1, values[0], values[1] if len(values) > 1 else 0)
+        elif name == "scale":
+            sy = values[1] if len(values) > 1 else values[0]
+            step = (values[0], 0, 0, sy, 0, 0)
+        elif name == "rotate":
+            angle = math.radians(values[0])
+            cos, sin = math.cos(angle), math.sin(angle)
+            step = (cos, sin, -sin, cos, 0, 0)
+            if len(values) == 3:
+                cx, cy = values[1], values[2]
+                step = _multiply(
+                    _multiply((1, 0, 0, 1, cx, cy), step),
+                    (1, 0, 0, 1, -cx, -cy),
+                )
+        elif name == "skewX":
+            step = (1, 0, math.tan(math.radians(values[0])), 1, 0, 0)
+        elif name == "skewY":
+            step = (1, math.tan(math.radians(values[0])), 0, 1, 0, 0)
+        else:
+            raise UnsupportedSvg(f"transform '{name}'")
+        matrix = _multiply(matrix, step)
+    return matrix
+
+
+def _parse_color(value):
+    value = value.strip()
+    if value.startswith("#"):
+        hex_value = value[1:]
+        if len(hex_value) == 3:
+            hex_value = "".join(c * 2 for c in hex_value)
+        return get_color_from_hex(hex_value)[:3]
+    if value.startswith("rgb"):
+        parts = value[value.index("(") + 1:value.rindex(")")].split(",")
+        channels = []
+        for part in parts[:3]:
+            part = part.strip()
+            if part.endswith("%"):
+                channels.append(float(part[:-1]) / 100.0)
+            else:
+                channels.append(float(part) / 255.0)
+        return channels
+    if value == "currentColor":
+        return [0.0, 0.0, 0.0]
+    if value.lower() in colormap:
+        return list(colormap[value.lower()][:3])
+    raise UnsupportedSvg(f"fill '{value}'")
+
+
+def _style(element, inherited):
+    style = dict(inherited)
+    style.pop("opacity", None)
+    for key in (
+        "fill",
+        "fill-opacity",
+        "fill-rule",
+        "opacity",
+        "stroke",
+        "stroke-width",
+        "display",
+        "clip-path",
+        "mask",
+        "filter",
+    ):
+        if key in element.attrib:
+            style[key] = element.attrib[key]
+    for declaration in element.attrib.get("style", "").split(";"):
+        key, sep, value = declaration.partition(":")
+        if sep:
+            style[key.strip()] = value.strip()
+    for key in ("clip-path", "mask", "filter"):
+        if style.get(key, "none") != "none":
+            raise UnsupportedSvg(key)
+    stroke = style.get("stroke", "none")
+    if stroke != "none" and _length(style.get("stroke-width"), 1.0) > 0:
+        raise UnsupportedSvg("stroke")
+    style["group-opacity"] = inherited.get("group-opacity", 1.0) * _length(
+        style.get("opacity"), 1.0
+    )
+    return style
+
+
+def _arc(x1, y1, rx, ry, phi, large, sweep, x2, y2):
+    """Flattens an SVG endpoint arc, excluding its starting point."""
+
+    if rx == 0 or ry == 0:
+        return [(x2, y2)]
+    rx, ry = abs(rx), abs(ry)
+    cos_phi, sin_phi = math.cos(phi), math.sin(phi)
+    dx, dy = (x1 - x2) / 2.0, (y1 - y2) / 2.0
+    x1p = cos_phi * dx + sin_phi * dy
+    y1p = -sin_phi * dx + cos_phi * dy
+    radii = (x1p * x1p) / (rx * rx) + (y1p * y1p) / (ry * ry)
+    if radii > 1:
+        rx *= math.sqrt(radii)
+        ry *= math.sqrt(radii)
+    numerator = rx * rx * ry * ry - rx * rx * y1p * y1p - ry * ry * x1p * x1p
+    denominator = rx * rx * y1p * y1p + ry * ry * x1p * x1p
+    factor = math.sqrt(max(0.0, numerator / denominator)) if denominator else 0
+    if large == sweep:
+        factor = -factor
+    cxp = factor * rx * y1p / ry
+    cyp = -factor * ry * x1p / rx
+    cx = cos_phi * cxp - sin_phi * cyp + (x1 + x2) / 2.0
+    cy = sin_phi * cxp + cos_phi * cyp + (y1 + y2) / 2.0
+
+    def angle(ux, uy, vx, vy):
+        return math.atan2(ux * vy - uy * vx, ux * vx + uy * vy)
+
+    theta = angle(1, 0, (x1p - cxp) / rx, (y1p - cyp) / ry)
+    delta = angle(
+        (x1p - cxp) / rx, (y1p - cyp) / ry, (-x1p - cxp) / rx, (-y1p - cyp) / ry
+    )
+    if not sweep and delta > 0:
+        delta -= 2 * math.pi
+    elif sweep and delta < 0:
+        delta += 2 * math.pi
+    segments = max(1, int(math.ceil(abs(delta) / ARC_SEGMENT_ANGLE)))
+    points = []
+    for i in range(1, segments + 1):
+        t = theta + delta * i / segments
+        x, y = rx * math.cos(t), ry * math.sin(t)
+        points.append(
+            (cos_phi * x - sin_phi * y + cx, sin_phi * x + cos_phi * y + cy)
+        )
+    return points
+
+
+def _cubic(p0, p1, p2, p3):
+    points = []
+    for i in range(1, BEZIER_SEGMENTS + 1):
+        t = i / BEZIER_SEGMENTS
+        mt = 1 - t
+        a, b, c, d = mt * mt * mt, 3 * mt * mt * t, 3 * mt * t * t, t * t * t
+        points.append(
+            (
+                a * p0[0] + b * p1[0] + c * p2[0] + d * p3[0],
+                a * p0[1] + b * p1[1] + c * p2[1] + d * p3[1],
+            )
+        )
+    return points
+
+
+def _quadratic(p0, p1, p2):
+    points = []
+    for i in range(1, BEZIER_SEGMENTS + 1):
+        t = i / BEZIER_SEGMENTS
+        mt = 1 - t
+        a, b, c = mt * mt, 2 * mt * t, t * t
+        points.append(
+            (
+                a * p0[0] + b * p1[0] + c * p2[0],
+                a * p0[1] + b * p1[1] + c * p2[1],
+            )
+        )
+    return points
+
+
+class _PathScanner:
+    """Reads commands, numbers and arc flags from path data."""
+
+    _separators = re.compile(r"[\s,]*")
+
+    def __init__(self, d):
+        self.d = d
+        self.position = 0
+
+    def _skip(self):
+        self.position = self._separators.match(self.d, self.position).end()
+
+    def at_end(self):
+        self._skip()
+        return self.position >= len(self.d)
+
+    def command(self):
+        """Returns the next command letter or ``None`` if a number
+        follows."""
+
+        self._skip()
+        char = self.d[self.position:self.position + 1]
+        if char.isalpha():
+            self.position += 1
+            return char
+        return None
+
+    def number(self):
+        self._skip()
+        match = _number_re.match(self.d, self.position)
+        if match is None:
+            raise UnsupportedSvg(f"malformed path data '{self.d[:40]}'")
+        self.position = match.end()
+        return float(match.group(0))
+
+    def numbers(self, count):
+        return [self.number() for _ in range(count)]
+
+    def flag(self):
+        self._skip()
+        char = self.d[self.position:self.position + 1]
+        if char not in ("0", "1"):
+            raise UnsupportedSvg(f"malformed arc flag in '{self.d[:40]}'")
+        self.position += 1
+        return char == "1"
+
+
+def _path_contours(d):
+    """Returns the flattened contours of the path data `d`."""
+
+    scanner = _PathScanner(d)
+    contours = []
+    contour = []
+    x = y = start_x = start_y = 0.0
+    last_control = None
+    command = None
+
+    while not scanner.at_end():
+        next_command = scanner.command()
+        if next_command is not None:
+            command = next_command
+        elif command is None or command in "Zz":
+            raise UnsupportedSvg(f"malformed path data '{d[:40]}'")
+        if command in "Zz":
+            if contour:
+                contours.append(contour)
+            contour = []
+            x, y = start_x, start_y
+            last_control = None
+            continue
+        relative = command.islower()
+        base_x, base_y = (x, y) if relative else (0.0, 0.0)
+        upper = command.upper()
+        control = None
+        if upper == "M":
+            x, y = scanner.numbers(2)
+            x, y = x + base_x, y + base_y
+            if contour:
+                contours.append(contour)
+            contour = [(x, y)]
+            start_x, start_y = x, y
+            command = "l" if relative else "L"
+        elif upper == "L":
+            x, y = scanner.numbers(2)
+            x, y = x + base_x, y + base_y
+            contour.append((x, y))
+        elif upper == "H":
+            x = scanner.number() + base_x
+            contour.append((x, y))
+        elif upper == "V":
+            y = scanner.number() + base_y
+            contour.append((x, y))
+        elif upper in "CS":
+            if upper == "C":
+                x1, y1, x2, y2, ex, ey = scanner.numbers(6)
+                p1 = (x1 + base_x, y1 + base_y)
+            else:
+                x2, y2, ex, ey = scanner.numbers(4)
+                if last_control is not None and last_control[0] == "C":
+                    p1 = (2 * x - last_control[1], 2 * y - last_control[2])
+                else:
+                    p1 = (x, y)
+            p2 = (x2 + base_x, y2 + base_y)
+            end = (ex + base_x, ey + base_y)
+            contour.extend(_cubic((x, y), p1, p2, end))
+            control = ("C", p2[0], p2[1])
+            x, y = end
+        elif upper in "QT":
+            if upper == "Q":
+                x1, y1, ex, ey = scanner.numbers(4)
+                p1 = (x1 + base_x, y1 + base_y)
+            else:
+                ex, ey = scanner.numbers(2)
+                if last_control is not None and last_control[0] == "Q":
+                    p1 = (2 * x - last_control[1], 2 * y - last_control[2])
+                else:
+                    p1 = (x, y)
+            end = (ex + base_x, ey + base_y)
+            contour.extend(_quadratic((x, y), p1, end))
+            control = ("Q", p1[0], p1[1])
+            x, y = end
+        elif upper == "A":
+            rx, ry, rotation = scanner.numbers(3)
+            large, sweep = scanner.flag(), scanner.flag()
+            ex, ey = scanner.numbers(2)
+            end = (ex + base_x, ey + base_y)
+            contour.extend(
+                _arc(x, y, rx, ry, math.radians(rotation), large, sweep, *end)
+            )
+            x, y = end
+        else:
+            raise UnsupportedSvg(f"path command '{command}'")
+        last_control = control
+        if not contour:
+            contour.append((x, y))
+    if contour:
+        contours.append(contour)
+    return contours
+
+
+def _ellipse_contour(cx, cy, rx, ry):
+    segments = max(8, int(math.ceil(2 * math.pi / ARC_SEGMENT_ANGLE)))
+    return [
+        (
+            cx + rx * math.cos(2 * math.pi * i / segments),
+            cy + ry * math.sin(2 * math.pi * i / segments),
+        )
+        for i in range(segments)
+    ]
+
+
+def _points(value):
+    numbers = [float(n) for n in _number_re.findall(value or "")]
+    return list(zip(numbers[0::2], numbers[1::2]))
+
+
+def _shape_contours(tag, attrib):
+    if tag == "path":
+        return _path_contours(attrib.get("d", ""))
+    if tag == "rect":
+        x, y = _length(attrib.get("x")), _length(attrib.get("y"))
+        width = _length(attrib.get("width"))
+        height = _length(attrib.get("height"))
+        rx = attrib.get("rx", attrib.get("ry"))
+        ry = attrib.get("ry", attrib.get("rx"))
+        rx = min(_length(rx), width / 2.0)
+        ry = min(_length(ry), height / 2.0)
+        if rx <= 0 or ry <= 0:
+            return [[(x, y), (x + width, y), (x + width, y + height),
+                     (x, y + height)]]
+        return _path_contours(
+            f"M{x + rx},{y} H{x + width - rx} "
+            f"A{rx},{ry} 0 0 1 {x + width},{y + ry} V{y + height - ry} "
+            f"A{rx},{ry} 0 0 1 {x + width - rx},{y + height} H{x + rx} "
+            f"A{rx},{ry} 0 0 1 {x},{y + height - ry} V{y + ry} "
+            f"A{rx},{ry} 0 0 1 {x + rx},{y} Z"
+        )
+    if tag == "circle":
+        r = _length(attrib.get("r"))
+        return [
+            _ellipse_contour(
+                _length(attrib.get("cx")), _length(attrib.get("cy")), r, r
+            )
+        ]
+    if tag == "ellipse":
+        return [
+            _ellipse_contour(
+                _length(attrib.get("cx")),
+                _length(attrib.get("cy")),
+                _length(attrib.get("rx")),
+                _length(attrib.get("ry")),
+            )
+        ]
+    if tag in ("polygon", "polyline"):
+        return [_points(attrib.get("points"))]
+    return []
+
+
+def _local_name(tag):
+    return tag.rsplit("}", 1)[-1]
+
+
+def _tessellate_shape(contours, matrix, winding):
+    a, b, c, d, e, f = matrix
+    tess = Tesselator()
+    for contour in contours:
+        if len(contour) < 3:
+            continue
+        flat = []
+        for x, y in contour:
+            flat.append(a * x + c * y + e)
+            flat.append(b * x + d * y + f)
+        tess.add_contour(flat)
+    if not tess.tesselate(winding, TYPE_POLYGONS):
+        return []
+    meshes = []
+    vertices = array("f")
+    indices = array("H")
+    for polygon, polygon_indices in tess.meshes:
+        count = len(polygon_indices)
+        if count < 3:
+            continue
+        if len(vertices) // 2 + count > MAX_MESH_VERTICES:
+            meshes.append((vertices, indices))
+            vertices = array("f")
+            indices = array("H")
+        offset = len(vertices) // 2
+        for i in range(count):
+            vertices.append(polygon[i * 4])
+            vertices.append(polygon[i * 4 + 1])
+        # Tesselator polygons are convex fans, turn them into triangles.
+        for i in range(1, count - 1):
+            indices.extend((offset, offset + i, offset + i + 1))
+    if indices:
+        meshes.append((vertices, indices))
+    return meshes
+
+
+def tessellate_polygon(contours):
+    """Returns the ``[(vertices, indices), ...]`` meshes filling the
+    ``[(x, y), ...]`` `contours` with the even-odd rule, in the layout of
+    :class:`SvgMeshData` fills."""
+
+    return _tessellate_shape(contours, (1, 0, 0, 1, 0, 0), WINDING_ODD)
+
+
+def tessellate_svg(filename):
+    """Parses and tessellates `filename` into :class:`SvgMeshData`.
+
+    Raises :class:`UnsupportedSvg` for documents it can not draw.
+    """
+
+    root = ET.parse(filename).getroot()
+    if _local_name(root.tag) != "svg":
+        raise UnsupportedSvg("root element is not <svg>")
+    view_box = [float(v) for v in _number_re.findall(
+        root.attrib.get("viewBox", ""))]
+    if len(view_box) == 4:
+        min_x, min_y, view_width, view_height = view_box
+    else:
+        min_x = min_y = 0.0
+        view_width = view_height = None
+    width = _length(root.attrib.get("width"), view_width or 0.0)
+    height = _length(root.attrib.get("height"), view_height or 0.0)
+    if not width or not height:
+        raise UnsupportedSvg("document without size")
+    view_width = view_width or width
+    view_height = view_height or height
+    # Document to Kivy coordinates: viewBox scaling and a vertical flip.
+    matrix = _multiply(
+        (1, 0, 0, -1, 0, height),
+        _multiply(
+            (width / view_width, 0, 0, height / view_height, 0, 0),
+            (1, 0, 0, 1, -min_x, -min_y),
+        ),
+    )
+    data = SvgMeshData(width, height)
+
+    def visit(element, matrix, inherited):
+        tag = _local_name(element.tag)
+        if tag in _IGNORED:
+            return
+        if tag not in _CONTAINERS and tag not in _SHAPES:
+            raise UnsupportedSvg(f"element <{tag}>")
+        style = _style(element, inherited)
+        if style.get("display") == "none":
+            return
+        if element is not root:
+            matrix = _multiply(
+                matrix, _parse_transform(element.attrib.get("transform"))
+            )
+        if tag in _CONTAINERS:
+            for child in element:
+                visit(child, matrix, style)
+            return
+        fill = style.get("fill", "#000000")
+        if fill == "none":
+            return
+        rgba = list(_parse_color(fill)) + [
+            _length(style.get("fill-opacity"), 1.0) * style["group-opacity"]
+        ]
+        if rgba[3] <= 0:
+            return
+        winding = (
+            WINDING_ODD
+            if style.get("fill-rule") == "evenodd"
+            else WINDING_NONZERO
+        )
+        contours = _shape_contours(tag, element.attrib)
+        for vertices, indices in _tessellate_shape(contours, matrix, winding):
+            data.fills.append((tuple(rgba), vertices, indices))
+
+    visit(root, matrix, {})
+    return data
+
+
+def compiled_filename(filename):
+    """Returns the path of the compiled mesh of the SVG `filename`."""
+
+    return filename + COMPILED_EXTENSION
+
+
+def write_svg_mesh(data, filename):
+    """Writes :class:`SvgMeshData` `data` to `filename`."""
+
+    blobs = []
+    with open(filename, "wb") as f:
+        f.write(
+            _header.pack(
+                MAGIC, VERSION, data.width, data.height, len(data.fills)
+            )
+        )
+        for rgba, vertices, indices in data.fills:
+            f.write(_fill.pack(*rgba, len(vertices) // 2, len(indices)))
+            vertices = array("f", vertices)
+            indices = array("H", indices)
+            if sys.byteorder != "little":
+                vertices.byteswap()
+                indices.byteswap()
+            padding = b"\0" * (-len(indices) * indices.itemsize % 4)
+            blobs.append(vertices.tobytes() + indices.tobytes() + padding)
+        for blob in blobs:
+            f.write(blob)
+
+
+def read_svg_mesh(filename):
+    """Reads a mesh written by :func:`write_svg_mesh`."""
+
+    with open(filename, "rb") as f:
+        buffer = f.read()
+    magic, version, width, height, count = _header.unpack_from(buffer)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(
+            f"FlatKivy: '{filename}' is not a version {VERSION} SVG mesh"
+        )
+    offset = _header.size
+    table = []
+    for _ in range(count):
+        table.append(_fill.unpack_from(buffer, offset))
+        offset += _fill.size
+    data = SvgMeshData(width, height)
+    for r, g, b, a, vertex_count, index_count in table:
+        vertices = array("f")
+        vertices.frombytes(buffer[offset:offset + vertex_count * 8])
+        offset += vertex_count * 8
+        indices = array("H")
+        indices.frombytes(buffer[offset:offset + index_count * 2])
+        offset += index_count * 2 + (-index_count * 2 % 4)
+        if sys.byteorder != "little":
+            vertices.byteswap()
+            indices.byteswap()
+        data.fills.append(((r, g, b, a), vertices, indices))
+    return data
+
+
+def has_compiled_mesh(filename):
+    """``True`` if `filename` has a compiled mesh at least as recent as
+    itself, or is a compiled mesh."""
+
+    if filename.endswith(COMPILED_EXTENSION):
+        return True
+    compiled = compiled_filename(filename)
+    if not os.path.exists(compiled):
+        return False
+    if not os.path.exists(filename):
+        return True
+    return os.path.getmtime(compiled) >= os.path.getmtime(filename)
@@ -0,0 +1,46 @@
+import os
+
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+os.environ.setdefault("KIVY_LOG_MODE", "PYTHON")
+
+from kivy.config import Config  # noqa: E402
+
+Config.set("graphics", "window_state", "hidden")
+
+import pytest  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def app():
+    """Running :class:`~flatkivy.app.FlatApp` with a hidden window, needed
+    by the themable widgets."""
+
+    from kivy.base import EventLoop
+
+    from flatkivy.app import FlatApp
+
+    app = FlatApp()
+    EventLoop.ensure_window()
+    return app
+
+
+@pytest.fixture
+def frames(app):
+    """Returns a function running `count` frames of the event loop."""
+
+    from kivy.base import EventLoop
+
+    def run(count=1):
+        for _ in range(count):
+            EventLoop.idle()
+
+    return run
+
+
+@pytest.fixture
+def window(app):
+    from kivy.core.window import Window
+
+    yield Window
+    for child in Window.children[:]:
+        Window.remove_widget(child)
@@ -0,0 +1,23 @@
+def test_flat_button_keeps_its_minimum_width(app, frames):
+    from flatkivy.uix.button import FlatButton
+
+    button = FlatButton(text="Ok")
+    frames()
+    assert button.width == max(
+        88, button.lbl_txt.texture_size[0] + button.increment_width
+    )
+    button.width = 10
+    assert button.width == 88
+    button.size = (10, 10)
+    assert button.size == [88, 10]
+
+
+def test_flat_button_grows_with_its_text(app, frames):
+    from flatkivy.uix.button import FlatButton
+
+    button = FlatButton(text="A button with a much longer caption")
+    frames()
+    assert button.width == (
+        button.lbl_txt.texture_size[0] + button.increment_width
+    )
+    assert button.width > 88
@@ -0,0 +1,52 @@
+import pytest
+
+from flatkivy.icon_packs import icon_registry
+
+
+@pytest.fixture
+def icon(app):
+    from flatkivy.uix.label import FlatColorIcon
+
+    return FlatColorIcon(icon="App-Amethyst", size=(100, 100))
+
+
+def test_one_widget_draws_every_layer(icon):
+    _, layers = icon_registry.resolve("App-Amethyst")
+    assert icon.children == []
+    assert len(icon._rect_instructions) == len(layers)
+    for instruction, (color, _) in zip(icon._color_instructions, layers):
+        assert list(instruction.rgba) == pytest.approx(color)
+
+
+def test_icons_share_glyph_textures(icon):
+    from flatkivy.uix.label import FlatColorIcon
+
+    other = FlatColorIcon(icon="App-Amethyst")
+    assert [r.texture for r in other._rect_instructions] == [
+        r.texture for r in icon._rect_instructions
+    ]
+
+
+def test_layer_colors_only_update_colors(icon):
+    textures = [rect.texture for rect in icon._rect_instructions]
+    icon.set_layer_color(1, [1, 0, 0, 1])
+    assert list(icon._color_instructions[1].rgba) == [1, 0, 0, 1]
+    assert [rect.texture for rect in icon._rect_instructions] == textures
+
+
+def test_layers_are_centered(icon):
+    icon.pos = (50, 20)
+    for rect in icon._rect_instructions:
+        assert rect.pos[0] == int(icon.center_x - rect.size[0] / 2.0)
+        assert rect.pos[1] == int(icon.center_y - rect.size[1] / 2.0)
+
+
+def test_changing_icon_and_size(icon):
+    icon.icon = "glyphicons:triangle-up"
+    assert len(icon._rect_instructions) == 1
+    icon.font_size = 48
+    small = icon._rect_instructions[0].size
+    icon.font_size = 96
+    assert icon._rect_instructions[0].size[1] > small[1]
+    icon.icon = "no-such-icon"
+    assert icon._rect_instructions == [] and icon.layer_colors == []
@@ -0,0 +1,114 @@
+import pytest
+
+from flatkivy.color_definitions import colors
+from flatkivy.colors import (
+    DARK_TEXT,
+    LIGHT_TEXT,
+    PRESSED_FACTOR,
+    contrast_colors,
+    derive_palette,
+    hex_to_rgba,
+    intern_color,
+    palette_colors,
+    pressed_color,
+    style_colors,
+    with_alpha,
+)
+
+
+def test_intern_color_shares_equal_colors():
+    color = intern_color([0.1, 0.2, 0.3, 1.0])
+    assert intern_color((0.1, 0.2, 0.3, 1.0)) is color
+    assert isinstance(color, tuple)
+    assert intern_color(None) is None
+
+
+def test_with_alpha_returns_interned_color():
+    color = intern_color((0.4, 0.5, 0.6, 1.0))
+    faded = with_alpha(color, 0.5)
+    assert faded == (0.4, 0.5, 0.6, 0.5)
+    assert with_alpha(color, 0.5) is faded
+
+
+def test_theme_colors_are_shared_tuples(app):
+    from flatkivy.uix.button import FlatButton
+
+    theme_cls = app.theme_cls
+    assert theme_cls.primary_color is theme_cls.primary_colors.base
+    first = FlatButton()
+    second = FlatButton()
+    assert first.specific_text_color is second.specific_text_color
+    assert first._current_button_color is second._current_button_color
+
+
+def test_equal_color_does_not_dispatch(app):
+    from flatkivy.uix.label import FlatLabel
+
+    label = FlatLabel(text="a")
+    label.text_color = (0.1, 0.1, 0.1, 1.0)
+    changes = []
+    label.bind(text_color=lambda *args: changes.append(args))
+    label.text_color = (0.1, 0.1, 0.1, 1.0)
+    assert changes == []
+
+
+def test_text_color_cannot_be_edited_in_place(app):
+    from flatkivy.uix.label import FlatLabel
+
+    label = FlatLabel(text="a")
+    label.text_color = app.theme_cls.primary_color
+    with pytest.raises(TypeError):
+        label.text_color[3] = 0.5
+    label.text_color = with_alpha(label.text_color, 0.5)
+    assert label.text_color[3] == 0.5
+
+
+def test_hex_to_rgba():
+    assert hex_to_rgba("#ff8000") == (1.0, 128 / 255.0, 0.0, 1.0)
+    assert hex_to_rgba("00000080")[3] == pytest.approx(0.5, abs=0.01)
+
+
+def test_derive_palette():
+    derived = derive_palette("3498db")
+    base = hex_to_rgba("3498db")
+    assert derived.base is base
+    assert all(l > b for l, b in zip(derived.light[:3], base[:3]))
+    assert all(d < b for d, b in zip(derived.dark[:3], base[:3]))
+    assert derived.pressed == pytest.approx(
+        (*(c * PRESSED_FACTOR for c in base[:3]), 1.0)
+    )
+    assert derived.pressed is pressed_color(base)
+    assert (derived.text, derived.secondary_text) == LIGHT_TEXT
+
+
+def test_contrast_colors():
+    assert contrast_colors((1.0, 1.0, 1.0, 1.0)) is DARK_TEXT
+    assert contrast_colors((0.0, 0.0, 0.0, 1.0)) is LIGHT_TEXT
+    assert contrast_colors(palette_colors["Clouds"].base) is DARK_TEXT
+
+
+def test_every_palette_is_derived():
+    assert palette_colors.keys() == colors.keys()
+    for name, definition in colors.items():
+        assert palette_colors[name].base == hex_to_rgba(definition["BASE"])
+    assert style_colors["Dark"].text == LIGHT_TEXT[0]
+
+
+def test_theme_manager_tables(app):
+    theme_cls = app.theme_cls
+    primary, accent = theme_cls.primary_palette, theme_cls.accent_palette
+    try:
+        theme_cls.primary_palette = "Alizarin"
+        theme_cls.accent_palette = "Emerald"
+        assert theme_cls.primary_colors is palette_colors["Alizarin"]
+        assert theme_cls.accent_colors is palette_colors["Emerald"]
+        assert theme_cls.get_palette_colors("Accent") is (
+            theme_cls.accent_colors
+        )
+        assert theme_cls.get_palette_colors("Silver") is (
+            palette_colors["Silver"]
+        )
+        assert theme_cls.style_colors is style_colors[theme_cls.theme_style]
+    finally:
+        theme_cls.primary_palette = primary
+        theme_cls.accent_palette = accent
@@ -0,0 +1,58 @@
+import pytest
+from kivy.metrics import Metrics, sp
+
+from flatkivy.theming import FontStyle
+
+
+@pytest.fixture
+def theme_cls(app):
+    theme_cls = app.theme_cls
+    font_styles = dict(theme_cls.font_styles)
+    yield theme_cls
+    theme_cls.font_styles = font_styles
+
+
+def test_table_resolves_sizes(theme_cls):
+    table = theme_cls.font_style_table
+    assert table.keys() == theme_cls.font_styles.keys()
+    name, size, capitalize, spacing = theme_cls.font_styles["Button"]
+    assert table["Button"] == FontStyle(
+        name, size * sp(1), capitalize, spacing * sp(1)
+    )
+
+
+def test_table_is_cached_until_styles_change(theme_cls):
+    table = theme_cls.font_style_table
+    assert theme_cls.font_style_table is table
+    theme_cls.font_styles["Caption"] = ["Lato", 12, False]
+    new_table = theme_cls.font_style_table
+    assert new_table is not table
+    assert new_table["Caption"] == FontStyle("Lato", 12 * sp(1), False, 0)
+
+
+def test_table_follows_the_font_scale(theme_cls):
+    size = theme_cls.font_style_table["Body"].font_size
+    fontscale = Metrics.fontscale
+    Metrics.fontscale = fontscale * 2
+    try:
+        assert theme_cls.font_style_table["Body"].font_size == size * 2
+    finally:
+        Metrics.fontscale = fontscale
+    assert theme_cls.font_style_table["Body"].font_size == size
+
+
+def test_label_skips_an_applied_style(theme_cls):
+    from flatkivy.uix.label import FlatLabel
+
+    label = FlatLabel(text="Style")
+    changes = []
+    for name in ("font_name", "font_size", "letter_spacing"):
+        label.fbind(name, lambda *args, name=name: changes.append(name))
+    label.update_font_style()
+    assert changes == []
+    label.font_style = "Header"
+    header = theme_cls.font_style_table["Header"]
+    assert (label.font_name, label.font_size) == (
+        header.font_name, header.font_size
+    )
+    assert sorted(changes) == ["font_name", "font_size", "letter_spacing"]
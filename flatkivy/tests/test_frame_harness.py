@@ -0,0 +1,73 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from flatkivy import path
+
+ROOT = os.path.dirname(path)
+
+
+@pytest.fixture
+def harness(app):
+    from kitchen_sink import frame_harness
+
+    return frame_harness
+
+
+def test_percentile(harness):
+    assert harness.percentile([], 0.5) == 0.0
+    values = [5, 1, 4, 2, 3]
+    assert harness.percentile(values, 0.5) == 3
+    assert harness.percentile(values, 0.99) == 5
+    assert harness.percentile(values, 0) == 1
+
+
+def test_summarize(harness):
+    result = harness.summarize("taps", [0.001, 0.002, 0.003], [4, -2, 1])
+    assert result["scenario"] == "taps"
+    assert result["frames"] == 3
+    assert result["p50_ms"] == pytest.approx(2)
+    assert result["max_ms"] == pytest.approx(3)
+    assert result["mean_blocks"] == pytest.approx(1)
+    assert result["net_blocks"] == 3
+
+
+def test_regressions(harness):
+    baseline = [
+        {"scenario": "taps", "p99_ms": 10.0},
+        {"scenario": "scroll", "p99_ms": 10.0},
+    ]
+    results = [
+        {"scenario": "taps", "p99_ms": 11.9},
+        {"scenario": "scroll", "p99_ms": 12.1},
+        {"scenario": "new", "p99_ms": 100.0},
+    ]
+    assert harness.regressions(results, baseline, 0.2) == ["scroll"]
+
+
+def test_harness_run(tmp_path):
+    output = tmp_path / "frames.json"
+    command = [
+        sys.executable, "-m", "kitchen_sink.frame_harness", "--frames", "3",
+        "--scenario", "button_taps",
+    ]
+    result = subprocess.run(
+        command + ["--output", str(output)],
+        capture_output=True, text=True, cwd=ROOT, timeout=300,
+    )
+    assert result.returncode == 0, result.stderr
+    (entry,) = json.loads(output.read_text())
+    assert entry["scenario"] == "button_taps" and entry["frames"] == 3
+
+    baseline = tmp_path / "baseline.json"
+    entry["p99_ms"] = 1e-6
+    baseline.write_text(json.dumps([entry]))
+    result = subprocess.run(
+        command + ["--baseline", str(baseline)],
+        capture_output=True, text=True, cwd=ROOT, timeout=300,
+    )
+    assert result.returncode == 1
+    assert "p99 regressions: button_taps" in result.stdout
@@ -0,0 +1,140 @@
+import pytest
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.floatlayout import FloatLayout
+from kivy.uix.gridlayout import GridLayout
+from kivy.uix.scrollview import ScrollView
+from kivy.uix.widget import Widget
+
+from flatkivy.uix.behaviors import HoverBehavior
+from flatkivy.uix.behaviors.hover_behavior import hover_tracker
+
+
+class HoverWidget(HoverBehavior, Widget):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.events = []
+
+    def on_enter(self):
+        self.events.append("enter")
+
+    def on_leave(self):
+        self.events.append("leave")
+
+
+@pytest.fixture
+def pointer(window, frames):
+    window.dispatch("on_cursor_enter")
+
+    def move(x, y):
+        window.mouse_pos = (x, y)
+        frames()
+
+    yield move
+    window.dispatch("on_cursor_leave")
+
+
+@pytest.fixture
+def float_layout(window, frames):
+    layout = FloatLayout()
+    window.add_widget(layout)
+    frames()
+    return layout
+
+
+def add_hover(layout, pos, size=(100, 100)):
+    widget = HoverWidget(size_hint=(None, None), pos=pos, size=size)
+    layout.add_widget(widget)
+    return widget
+
+
+def test_enter_and_leave_once(float_layout, pointer):
+    first = add_hover(float_layout, (0, 0))
+    second = add_hover(float_layout, (200, 0))
+    pointer(50, 50)
+    pointer(60, 60)
+    assert first.events == ["enter"]
+    assert first.hovering
+    assert first.enter_point == (50, 50)
+    pointer(250, 50)
+    assert first.events == ["enter", "leave"]
+    assert second.events == ["enter"]
+    assert hover_tracker.hovered() == [second]
+
+
+def test_cursor_leaving_the_window(window, float_layout, pointer):
+    widget = add_hover(float_layout, (0, 0))
+    pointer(50, 50)
+    window.dispatch("on_cursor_leave")
+    assert widget.events == ["enter", "leave"]
+    assert not widget.hovering
+
+
+def test_moving_widget_under_still_pointer(float_layout, pointer, frames):
+    widget = add_hover(float_layout, (0, 0))
+    pointer(350, 350)
+    widget.pos = (300, 300)
+    frames(2)
+    assert widget.events == ["enter"]
+
+
+def test_removed_widget_is_left(float_layout, pointer, frames):
+    widget = add_hover(float_layout, (0, 0))
+    pointer(50, 50)
+    float_layout.remove_widget(widget)
+    frames(2)
+    assert widget.events == ["enter", "leave"]
+
+
+@pytest.fixture
+def scrolled(window, frames):
+    root = BoxLayout(orientation="vertical")
+    header = Widget(size_hint_y=None, height=100)
+    scroll = ScrollView(size_hint_y=None, height=200)
+    grid = GridLayout(cols=1, size_hint_y=None, height=1000)
+    items = [HoverWidget(size_hint_y=None, height=100) for _ in range(10)]
+    for item in items:
+        grid.add_widget(item)
+    scroll.add_widget(grid)
+    root.add_widget(header)
+    root.add_widget(scroll)
+    root.add_widget(Widget())
+    window.add_widget(root)
+    frames(3)
+    return scroll, items
+
+
+def test_scrolled_out_content_is_not_hovered(window, scrolled, pointer):
+    scroll, items = scrolled
+    top = scroll.top
+    # Over the header drawn above the scroll view, where the hidden
+    # content would be without clipping.
+    pointer(10, top + 50)
+    assert not any(item.events for item in items)
+    pointer(10, scroll.y - 50)
+    assert not any(item.events for item in items)
+    pointer(10, top - 50)
+    assert items[0].events == ["enter"]
+
+
+def test_scrolling_updates_hover(scrolled, pointer, frames):
+    scroll, items = scrolled
+    pointer(10, scroll.top - 50)
+    scroll.scroll_y = 0
+    frames(3)
+    assert items[0].events == ["enter", "leave"]
+    assert items[-2].events == ["enter"]
+
+
+def test_parents_are_unwatched(window, frames, pointer):
+    first = FloatLayout()
+    second = FloatLayout()
+    window.add_widget(first)
+    window.add_widget(second)
+    widget = add_hover(first, (0, 0))
+    pointer(50, 50)
+    assert first in hover_tracker._watched
+    first.remove_widget(widget)
+    second.add_widget(widget)
+    pointer(60, 60)
+    assert first not in hover_tracker._watched
+    assert second in hover_tracker._watched
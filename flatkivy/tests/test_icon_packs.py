@@ -0,0 +1,109 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from flatkivy import path
+from flatkivy.icon_packs import IconPack, IconRegistry, icon_registry
+
+RED = [1.0, 0.0, 0.0, 1]
+BLUE = [0.0, 0.0, 1.0, 1]
+ROOT = os.path.dirname(path)
+
+
+class CountingPack(IconPack):
+    def __init__(self, name, icons):
+        super().__init__(name, name, None)
+        self._source = icons
+        self.gets = []
+
+    def load_source(self):
+        return self._source
+
+    def get(self, name):
+        self.gets.append(name)
+        return super().get(name)
+
+
+@pytest.fixture
+def registry():
+    registry = IconRegistry()
+    first = registry.register_pack(
+        CountingPack("first", {"star": [[RED, "a"]], "moon": [[RED, "b"]]})
+    )
+    second = registry.register_pack(
+        CountingPack("second", {"star": [[BLUE, "c"]], "sun": [[BLUE, "d"]]})
+    )
+    return registry, first, second
+
+
+def test_packs_load_on_first_use(registry):
+    registry, first, second = registry
+    assert not first.loaded and not second.loaded
+    assert registry.resolve("star") == (first, [[RED, "a"]])
+    assert first.loaded and not second.loaded
+    assert registry.resolve("sun") == (second, [[BLUE, "d"]])
+    assert first.gets == ["star"] and second.gets == ["sun"]
+
+
+def test_qualified_names_resolve_to_their_pack(registry):
+    registry, first, second = registry
+    assert registry.resolve("second:star") == (second, [[BLUE, "c"]])
+    assert registry.resolve("second:moon") is None
+    assert not first.loaded
+    assert registry.resolve("first:sun") is None
+    assert first.gets == []
+
+
+def test_unknown_names(registry):
+    registry, first, second = registry
+    assert registry.resolve("comet") is None
+    assert "comet" not in registry
+    assert "unknown:star" not in registry
+    with pytest.raises(KeyError):
+        registry["comet"]
+    assert first.gets == second.gets == []
+
+
+def test_containment_does_not_read_layers(registry):
+    registry, first, second = registry
+    assert "moon" in registry and "second:sun" in registry
+    assert first.gets == second.gets == []
+
+
+def test_replacing_a_pack(registry):
+    registry, first, second = registry
+    replacement = registry.register_pack(
+        CountingPack("first", {"comet": [[BLUE, "e"]]})
+    )
+    assert "moon" not in registry
+    assert registry.resolve("star") == (second, [[BLUE, "c"]])
+    assert registry.resolve("first:comet") == (replacement, [[BLUE, "e"]])
+    assert registry.names == [
+        "comet", "first:comet", "second:star", "second:sun", "star", "sun"
+    ]
+
+
+def test_registering_does_not_load_the_shipped_packs():
+    # In a fresh interpreter, as other tests use the shipped packs.
+    code = (
+        "import sys\n"
+        "from flatkivy.icon_packs import icon_registry\n"
+        "assert not any(p.loaded for p in icon_registry.packs)\n"
+        "icon_registry.resolve('glyphicons:triangle-up')\n"
+        "assert [p.name for p in icon_registry.packs if p.loaded] == "
+        "['glyphicons']\n"
+        "assert 'flatkivy.icon_definitions' not in sys.modules\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True, text=True, cwd=ROOT, timeout=300,
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_shipped_packs():
+    pack, layers = icon_registry.resolve("glyphicons:triangle-up")
+    assert pack.name == "glyphicons" and layers
+    assert icon_registry.resolve("App-Amethyst")[0] is icon_registry.default_pack
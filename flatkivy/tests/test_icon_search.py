@@ -0,0 +1,71 @@
+import pytest
+
+from flatkivy.icon_search import IconSearchIndex, extract_tags
+
+NAMES = [
+    "Apps-Adobe-Lightroom",
+    "Apps-Adobe-Photoshop",
+    "Dobro-Guitar",
+    "Shadow",
+    "MacBookPro",
+    "Arrow-Left",
+    "Arrow-Right",
+]
+
+
+@pytest.fixture
+def index():
+    return IconSearchIndex(NAMES)
+
+
+def test_extract_tags():
+    assert extract_tags("Apps-Adobe-Lightroom") == [
+        "apps",
+        "adobe",
+        "lightroom",
+    ]
+    assert extract_tags("MacBookPro") == ["macbookpro", "mac", "book", "pro"]
+
+
+def test_exact_tag_ranks_first(index):
+    assert index.search("arrow left")[0] == "Arrow-Left"
+    assert index.search("book") == ["MacBookPro"]
+
+
+def test_prefix_and_fuzzy_matches(index):
+    assert set(index.search("adob")) >= {
+        "Apps-Adobe-Lightroom",
+        "Apps-Adobe-Photoshop",
+    }
+    # Only shares the trigram "dob" with the query.
+    assert "Dobro-Guitar" in index.search("adob")
+    assert "Dobro-Guitar" not in index.search("ado")
+
+
+@pytest.mark.parametrize(
+    "typed",
+    ["adobe light", "ad", "adob", "shado", "arrow ri", "mac bo"],
+)
+def test_session_matches_search(index, typed):
+    session = index.session()
+    for end in range(1, len(typed) + 1):
+        query = typed[:end]
+        assert session.update(query) == index.search(query), query
+
+
+def test_session_after_editing(index):
+    session = index.session()
+    for query in ("adob", "ado", "adobe", "shadow", "", "dob"):
+        assert session.update(query) == index.search(query), query
+
+
+def test_registry_session_matches_search():
+    from flatkivy.icon_packs import icon_registry
+
+    session = icon_registry.search_session(limit=50)
+    for typed in ("apps adobe", "arow"):
+        for end in range(1, len(typed) + 1):
+            query = typed[:end]
+            assert session.update(query) == icon_registry.search(
+                query, limit=50
+            )
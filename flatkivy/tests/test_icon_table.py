@@ -0,0 +1,88 @@
+import json
+import os
+
+import pytest
+
+from flatkivy.icon_packs import DEFAULT_LAYER_COLOR, IconPack, icon_registry
+from flatkivy.icon_table import MappedIconTable, write_icon_table
+
+ICONS = {
+    "star": [[[1.0, 0.5, 0.0, 1.0], ""]],
+    "moon": [[[0.0, 0.0, 0.0, 1.0], ""], [[0.25, 0.5, 0.75, 0.5], "b"]],
+    "étoile": [[[0.0, 0.0, 1.0, 1.0], "\U0001f600"]],
+}
+
+
+@pytest.fixture
+def table(tmp_path):
+    filename = str(tmp_path / "icons.fkit")
+    write_icon_table(ICONS, filename)
+    table = MappedIconTable(filename)
+    yield table
+    table.close()
+
+
+def test_round_trip(table):
+    assert len(table) == len(ICONS)
+    assert list(table) == sorted(ICONS)
+    assert dict(table) == ICONS
+
+
+def test_lookups(table):
+    assert "moon" in table and "mo" not in table and "zz" not in table
+    assert table.get("comet") is None
+    layers = table.layer_range("moon")
+    assert len(layers) == 2
+    assert table.layer_code(layers[1]) == "b"
+    assert table.layer_color(layers[1]).tolist() == [0.25, 0.5, 0.75, 0.5]
+    with pytest.raises(KeyError):
+        table["comet"]
+
+
+def test_not_a_table(tmp_path):
+    filename = tmp_path / "icons.fkit"
+    filename.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        MappedIconTable(str(filename))
+
+
+@pytest.mark.parametrize("pack", icon_registry.packs, ids=lambda p: p.name)
+def test_shipped_tables_match_their_source(pack):
+    assert pack.has_fresh_table()
+    table = MappedIconTable(pack.table_file)
+    source = pack.load_source()
+    assert list(table) == sorted(source)
+    for name, layers in source.items():
+        assert table[name] == layers
+    table.close()
+
+
+def test_outdated_tables_are_ignored(tmp_path):
+    selection = {
+        "icons": [
+            {"properties": {"name": "star", "code": 0xE900}, "attrs": []}
+        ]
+    }
+    selection_file = tmp_path / "selection.json"
+    selection_file.write_text(json.dumps(selection))
+    table_file = tmp_path / "icons.fkit"
+    write_icon_table(ICONS, str(table_file))
+    source_time = os.path.getmtime(selection_file)
+    os.utime(table_file, (source_time + 10, source_time + 10))
+
+    def make_pack():
+        return IconPack(
+            "test", "Test", None,
+            selection_file=str(selection_file), table_file=str(table_file),
+        )
+
+    pack = make_pack()
+    assert pack.has_fresh_table()
+    assert isinstance(pack.icons, MappedIconTable)
+    assert "moon" in pack.icons
+    pack.icons.close()
+
+    os.utime(selection_file, (source_time + 20, source_time + 20))
+    pack = make_pack()
+    assert not pack.has_fresh_table()
+    assert pack.icons == {"star": [[DEFAULT_LAYER_COLOR, "\ue900"]]}
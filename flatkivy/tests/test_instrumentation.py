@@ -0,0 +1,74 @@
+import json
+
+import pytest
+
+from flatkivy import instrumentation
+from flatkivy.instrumentation import Recorder, instrumented
+
+
+@pytest.fixture
+def recorder(monkeypatch):
+    recorder = Recorder(size=3)
+    monkeypatch.setattr(instrumentation, "recorder", recorder)
+    monkeypatch.setattr(instrumentation, "ENABLED", True)
+    return recorder
+
+
+def test_disabled_returns_the_method(monkeypatch):
+    monkeypatch.setattr(instrumentation, "ENABLED", False)
+
+    def method(self):
+        pass
+
+    assert instrumented(method) is method
+
+
+def test_calls_are_recorded_per_class(recorder):
+    class Base:
+        @instrumented
+        def update(self, value):
+            return value * 2
+
+    class Child(Base):
+        @instrumented
+        def update(self, value):
+            return super().update(value) + 1
+
+    assert Base().update(1) == 2
+    assert Child().update(1) == 3
+    assert Child().update(2) == 5
+    # The override calling its base class is recorded once.
+    assert recorder.counters.keys() == {"Base.update", "Child.update"}
+    assert recorder.counters["Child.update"][0] == 2
+    summary = recorder.summary()
+    assert summary["Base.update"]["calls"] == 1
+    assert summary["Child.update"]["mean_ms"] == pytest.approx(
+        summary["Child.update"]["total_ms"] / 2
+    )
+
+
+def test_ring_buffer_keeps_the_last_calls(recorder):
+    for index in range(5):
+        recorder.record(f"Widget.method{index}", index, 0.001)
+    assert [event[0] for event in recorder.events] == [
+        "Widget.method2", "Widget.method3", "Widget.method4"
+    ]
+    assert len(recorder.counters) == 5
+    recorder.clear()
+    assert not recorder.events and not recorder.counters
+
+
+def test_exports(recorder, tmp_path):
+    recorder.record("FlatLabel.update_font_style", 1.0, 0.002)
+    recorder.export_json(tmp_path / "counters.json")
+    counters = json.loads((tmp_path / "counters.json").read_text())
+    assert counters["FlatLabel.update_font_style"]["calls"] == 1
+    recorder.export_chrome_trace(tmp_path / "trace.json")
+    (event,) = json.loads((tmp_path / "trace.json").read_text())[
+        "traceEvents"
+    ]
+    assert event["name"] == "FlatLabel.update_font_style"
+    assert event["cat"] == "FlatLabel"
+    assert event["ph"] == "X"
+    assert event["ts"] == pytest.approx(1e6)
+    assert event["dur"] == pytest.approx(2000)
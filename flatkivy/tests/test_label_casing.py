@@ -0,0 +1,45 @@
+import pytest
+
+from flatkivy.uix import label as label_module
+from flatkivy.uix.label import upper_text
+
+
+@pytest.fixture
+def button_label(app):
+    from flatkivy.uix.label import FlatLabel
+
+    # The "Button" font style is in caps.
+    return FlatLabel(text="title", font_style="Button")
+
+
+def test_upper_text():
+    assert upper_text("title") == "TITLE"
+    assert upper_text("istanbul", "tr") == "İSTANBUL"
+    assert upper_text("istanbul", "tr_TR") == "İSTANBUL"
+    assert upper_text("istanbul", "fr_FR") == "ISTANBUL"
+
+
+def test_caps_text_is_computed_once_per_change(button_label, monkeypatch):
+    calls = []
+
+    def counting_upper_text(text, locale=None):
+        calls.append(text)
+        return upper_text(text, locale)
+
+    monkeypatch.setattr(label_module, "upper_text", counting_upper_text)
+    button_label.text = "istanbul"
+    for _ in range(3):
+        assert button_label.text == "ISTANBUL"
+    assert calls == ["istanbul"]
+    button_label.casing_locale = "tr"
+    assert button_label.text == "İSTANBUL"
+    assert len(calls) == 2
+
+
+def test_capitalizing_follows_the_style(button_label):
+    assert button_label.text == "TITLE"
+    button_label.can_capitalize = False
+    assert button_label.text == "title"
+    button_label.can_capitalize = True
+    button_label.font_style = "Body"
+    assert button_label.text == "title"
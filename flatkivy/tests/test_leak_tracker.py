@@ -0,0 +1,102 @@
+import gc
+
+import pytest
+
+from flatkivy.leak_tracker import LeakTracker, diff_snapshots
+
+kept = []
+
+
+@pytest.fixture
+def tracker(app, monkeypatch):
+    tracker = LeakTracker()
+    tracker.enable()
+    monkeypatch.setattr("flatkivy.theming.leak_tracker", tracker)
+    yield tracker
+    kept.clear()
+
+
+def label():
+    from flatkivy.uix.label import FlatLabel
+
+    return FlatLabel(text="Leak")
+
+
+def test_tracks_themable_widgets_weakly(tracker):
+    widget = label()
+    assert tracker.counts()["FlatLabel"] == 1
+    del widget
+    gc.collect()
+    assert tracker.counts()["FlatLabel"] == 0
+
+
+def test_orphans_are_widgets_out_of_the_tree(tracker, window):
+    shown, orphan = label(), label()
+    window.add_widget(shown)
+    kept.append(orphan)
+    assert tracker.orphans(min_age=0) == [orphan]
+    assert tracker.orphans(min_age=60) == []
+
+
+def test_hidden_screens_are_not_orphans(tracker, window):
+    from kivy.uix.screenmanager import Screen, ScreenManager
+
+    manager = ScreenManager()
+    shown, hidden = Screen(name="shown"), Screen(name="hidden")
+    manager.add_widget(shown)
+    manager.add_widget(hidden)
+    hidden.add_widget(label())
+    window.add_widget(manager)
+    assert tracker.orphans(min_age=0) == []
+
+
+
+def test_pooled_widgets_are_not_orphans(tracker, window):
+    from flatkivy.uix.label import FlatLabel
+
+    class PoolingLabel(FlatLabel):
+        def pooled_widgets(self):
+            return [pooled]
+
+    pooled = label()
+    owner = PoolingLabel()
+    window.add_widget(owner)
+    assert tracker.orphans(min_age=0) == []
+    window.remove_widget(owner)
+    assert set(tracker.orphans(min_age=0)) == {owner, pooled}
+
+def test_retention_paths(tracker):
+    kept.append(label())
+    (orphan,) = tracker.orphans(min_age=0)
+    paths = tracker.retention_paths(orphan)
+    assert [
+        f"module {__name__}['kept']",
+        "list[0]",
+    ] in [path[-2:] for path in paths]
+
+
+def test_binding_paths(tracker, app):
+    orphan = label()
+    callback = lambda *args: orphan  # noqa: E731
+    app.theme_cls.bind(primary_palette=callback)
+    try:
+        paths = tracker.binding_paths(orphan)
+        assert any(
+            path.startswith("ThemeManager.primary_palette -> ")
+            for path in paths
+        )
+    finally:
+        app.theme_cls.unbind(primary_palette=callback)
+
+
+def test_snapshot_diff(tracker, tmp_path):
+    import json
+
+    before = tracker.snapshot(min_age=0)
+    kept.append(label())
+    tracker.dump(tmp_path / "after.json", min_age=0)
+    after = json.loads((tmp_path / "after.json").read_text())
+    changes, orphans = diff_snapshots(before, after)
+    assert changes == {"FlatLabel": 1}
+    (orphan,) = orphans
+    assert orphan["class"] == "FlatLabel" and orphan["paths"]
@@ -0,0 +1,108 @@
+from math import floor
+
+import pytest
+from kivy.core.text import Label as CoreLabel
+
+from flatkivy.uix import label as label_module
+from flatkivy.uix.label import SpacedCoreLabel
+
+SPACING = 5
+
+
+@pytest.fixture
+def labels(app):
+    spaced = SpacedCoreLabel(font_size=40)
+    spaced.letter_spacing = SPACING
+    return spaced, CoreLabel(font_size=40)
+
+
+@pytest.mark.parametrize("text", ["i", "Wave", "AVATAR"])
+def test_spacing_is_only_between_characters(labels, text):
+    spaced, plain = labels
+    width, height = spaced.get_extents(text)
+    plain_width, plain_height = plain.get_extents(text)
+    # Kerned pairs are measured on their own, each within a pixel.
+    gaps = SPACING * (len(text) - 1)
+    assert abs(width - (plain_width + gaps)) <= len(text) - 1
+    assert height == plain_height
+
+
+def test_kerning_is_kept(labels):
+    spaced, plain = labels
+    kerned = plain.get_extents("AV")[0]
+    assert kerned < plain.get_extents("A")[0] + plain.get_extents("V")[0]
+    assert spaced.get_extents("AV")[0] == kerned + SPACING
+
+
+def test_no_spacing_is_the_core_label(labels):
+    spaced, plain = labels
+    spaced.letter_spacing = 0
+    assert spaced.get_extents("AVATAR") == plain.get_extents("AVATAR")
+
+
+def test_texture_fits_the_spaced_text(labels):
+    spaced, _ = labels
+    spaced.text = "AVATAR"
+    spaced.refresh()
+    assert spaced.texture.width == spaced.get_extents("AVATAR")[0]
+
+
+def test_glyph_extents_are_bounded(labels, monkeypatch):
+    spaced, _ = labels
+    monkeypatch.setattr(label_module, "MAX_GLYPH_EXTENTS", 8)
+    spaced.get_extents("abcdefghijklmnop")
+    assert len(label_module._glyph_extents) == 8
+    # The most recently used extents are kept.
+    assert label_module._glyph_extents.popitem()[0][-1] == "p"
+
+
+
+def visible_pixels(label, text):
+    label._render_begin()
+    label._render_text(text, 0, 0)
+    data = label._render_end().data
+    # The color of transparent pixels does not matter.
+    return [
+        data[i:i + 4] if data[i + 3] else None
+        for i in range(0, len(data), 4)
+    ]
+
+
+class GlyphByGlyphLabel(SpacedCoreLabel):
+    """Reference rendering of every glyph on its own."""
+
+    def _render_text(self, text, x, y):
+        for index, (char, advance) in enumerate(
+            zip(text, self._get_advances(text))
+        ):
+            position = floor(x + index * self.letter_spacing)
+            CoreLabel._render_text(self, char, position, y)
+            x += advance
+
+
+@pytest.mark.parametrize("spacing", [1, 2.5])
+def test_glyphs_are_rendered_at_their_spaced_position(app, spacing):
+    text = "AVATAR Wave"
+    spaced = SpacedCoreLabel(font_size=40)
+    reference = GlyphByGlyphLabel(font_size=40)
+    for label in (spaced, reference):
+        label.letter_spacing = spacing
+        label._size = (int(label.get_extents(text)[0]) + 4, 60)
+    assert visible_pixels(spaced, text) == visible_pixels(reference, text)
+
+
+def test_glyphs_moved_together_are_rendered_at_once(labels, monkeypatch):
+    spaced, _ = labels
+    spaced.letter_spacing = 0.25
+    calls = []
+    monkeypatch.setattr(
+        CoreLabel, "_render_text", lambda self, text, x, y: calls.append(text)
+    )
+    spaced._render_text("ABCD EFG", 0, 0)
+    # Moved by 0 and 1 pixel.
+    assert calls == ["ABCD", " EFG"]
+    calls.clear()
+    spaced.letter_spacing = 1.25
+    spaced._render_text("AB C", 0, 0)
+    # Spaces are not drawn.
+    assert calls == ["A", "B", "C"]
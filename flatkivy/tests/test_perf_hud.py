@@ -0,0 +1,55 @@
+import pytest
+from kivy.clock import Clock
+from kivy.graphics import Canvas, Rectangle
+from kivy.graphics.texture import Texture
+
+
+@pytest.fixture
+def hud(app, window):
+    yield app
+    app.perf_hud_stop()
+
+
+def test_toggle_adds_and_removes_the_overlay(hud, window):
+    events = len(Clock.get_events())
+    hud.perf_hud_toggle()
+    assert hud.perf_hud.running
+    assert hud.perf_hud in window.children
+    assert len(Clock.get_events()) == events + 2
+    hud.perf_hud_toggle()
+    assert not hud.perf_hud.running
+    assert hud.perf_hud not in window.children
+    assert len(Clock.get_events()) == events
+
+
+def test_histogram(app):
+    from flatkivy.uix.perf_hud import PerfHUD
+
+    overlay = PerfHUD()
+    for dt in (0.005, 0.01, 0.016, 0.03, 0.04, 0.2):
+        overlay._sample(dt)
+    assert overlay.histogram() == [1, 2, 1, 1, 1]
+
+
+def test_collect_counts_flatkivy_widgets(hud, window):
+    from flatkivy.uix.button import FlatIconButton
+
+    window.add_widget(FlatIconButton())
+    hud.perf_hud_start()
+    stats = hud.perf_hud.collect()
+    assert stats["widgets"]["FlatIconButton"] == 1
+    assert "PerfHUD" not in stats["widgets"]
+    assert stats["instructions"] > 0 and stats["clock_events"] > 0
+
+
+def test_canvas_stats_counts_textures_once():
+    from flatkivy.uix.perf_hud import canvas_stats
+
+    texture = Texture.create(size=(8, 4))
+    canvas = Canvas()
+    with canvas:
+        Rectangle(texture=texture)
+        Rectangle(texture=texture)
+    textures = {}
+    assert canvas_stats(canvas, textures) >= 3
+    assert textures == {texture.id: 8 * 4 * 4}
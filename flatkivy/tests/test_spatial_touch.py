@@ -0,0 +1,123 @@
+import pytest
+from kivy.tests.common import UnitTestTouch
+from kivy.uix.widget import Widget
+
+from flatkivy.spatial_index import SpatialIndex
+
+
+class Recorder(Widget):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.events = []
+
+    def on_touch_down(self, touch):
+        self.events.append("down")
+        return self.collide_point(*touch.pos)
+
+    def on_touch_move(self, touch):
+        self.events.append("move")
+
+    def on_touch_up(self, touch):
+        self.events.append("up")
+
+
+def make_touch(window, x, y):
+    touch = UnitTestTouch(x, y)
+    touch.scale_for_screen(*window.size)
+    return touch
+
+
+@pytest.fixture
+def grid(window):
+    from flatkivy.uix.layout import FlatSpatialGridLayout
+
+    layout = FlatSpatialGridLayout(
+        cols=10, size_hint=(None, None), size=(500, 500), pos=(0, 0)
+    )
+    for _ in range(100):
+        layout.add_widget(Recorder())
+    layout.do_layout()
+    return layout
+
+
+def test_index_returns_items_in_order():
+    index = SpatialIndex()
+    index.rebuild(
+        [("a", 0, 0, 10, 10), ("b", 5, 5, 10, 10), ("c", 50, 50, 5, 5)]
+    )
+    assert index.query(7, 7) == ["a", "b"]
+    assert index.query(52, 52) == ["c"]
+    assert index.query(30, 30) == []
+
+
+def test_index_keeps_large_items():
+    index = SpatialIndex(cell_size=(1, 1))
+    index.rebuild([("small", 0, 0, 1, 1), ("large", 0, 0, 100, 100)])
+    assert index.query(0.5, 0.5) == ["small", "large"]
+    assert index.query(90, 90) == ["large"]
+
+
+def test_touch_down_reaches_only_the_hit_child(window, grid):
+    target = grid.children[42]
+    touch = make_touch(window, *target.center)
+    assert grid.dispatch("on_touch_down", touch)
+    assert target.events == ["down"]
+    assert [c for c in grid.children if c.events] == [target]
+
+
+def test_moves_and_releases_reach_every_child(window, grid):
+    target = grid.children[42]
+    touch = make_touch(window, *target.center)
+    grid.dispatch("on_touch_down", touch)
+    touch.x, touch.y = touch.pos = (10, 10)
+    grid.dispatch("on_touch_move", touch)
+    grid.dispatch("on_touch_up", touch)
+    assert target.events == ["down", "move", "up"]
+    assert all(
+        "move" in child.events and "up" in child.events
+        for child in grid.children
+    )
+
+
+def test_index_follows_moved_children(window, grid):
+    target = grid.children[0]
+    target.pos = (1000, 1000)
+    touch = make_touch(window, target.center_x, target.center_y)
+    assert grid.dispatch("on_touch_down", touch)
+    assert target.events == ["down"]
+
+
+def test_disabled_layout_only_takes_touches_it_collides_with(window):
+    from flatkivy.uix.layout import FlatSpatialFloatLayout
+
+    layout = FlatSpatialFloatLayout(
+        size_hint=(None, None), size=(100, 100), pos=(0, 0)
+    )
+    outside = Recorder(size_hint=(None, None), size=(50, 50), pos=(200, 200))
+    layout.add_widget(outside)
+    layout.disabled = True
+    assert layout.dispatch("on_touch_down", make_touch(window, 50, 50))
+    assert outside.events == []
+    assert layout.dispatch("on_touch_down", make_touch(window, 300, 300)) is (
+        False
+    )
+    assert outside.events == []
+    assert layout.dispatch("on_touch_down", make_touch(window, 225, 225))
+    assert outside.events == ["down"]
+
+
+def test_button_ripple_finishes_when_dragged_off(window, frames):
+    from flatkivy.uix.button import FlatButton
+    from flatkivy.uix.layout import FlatSpatialFloatLayout
+
+    layout = FlatSpatialFloatLayout()
+    button = FlatButton(size_hint=(None, None), size=(100, 50), pos=(10, 10))
+    layout.add_widget(button)
+    window.add_widget(layout)
+    frames(2)
+    touch = UnitTestTouch(*button.center)
+    touch.touch_down()
+    assert button._doing_ripple
+    touch.touch_move(400, 400)
+    assert button._finishing_ripple
+    touch.touch_up()
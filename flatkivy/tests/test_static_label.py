@@ -0,0 +1,62 @@
+import pytest
+
+from flatkivy.uix import label as label_module
+
+
+@pytest.fixture
+def static_label(app):
+    from flatkivy.uix.label import FlatStaticLabel
+
+    return FlatStaticLabel(text="Caption")
+
+
+def test_texture_follows_text(static_label):
+    texture = static_label._rect.texture
+    assert texture is not None
+    assert list(texture.size) == static_label.texture_size
+    static_label.text = "A much longer caption"
+    assert static_label._rect.texture is not texture
+    assert static_label.texture_size[0] > texture.width
+
+
+def test_text_is_not_kept_in_the_glyph_cache(static_label):
+    static_label.text = "Only shown once"
+    assert not any(
+        key[2] == "Only shown once" for key in label_module._glyph_textures
+    )
+
+
+def test_theme_refresh_keeps_the_texture(app, static_label):
+    texture = static_label._rect.texture
+    static_label.refresh_theme(app.theme_cls)
+    assert static_label._rect.texture is texture
+
+
+def test_custom_color(static_label):
+    static_label.theme_text_color = "Custom"
+    static_label.color = [1, 0, 0, 1]
+    assert static_label._color_instruction.rgba == [1, 0, 0, 1]
+
+
+def test_glyph_cache_is_bounded(app, monkeypatch):
+    monkeypatch.setattr(label_module, "MAX_GLYPH_TEXTURES", 4)
+    label_module._glyph_textures.clear()
+    font_name = app.theme_cls.font_style_table["Body"].font_name
+    first = label_module.get_glyph_texture(font_name, 20, "a")
+    for code in "bcde":
+        label_module.get_glyph_texture(font_name, 20, code)
+    assert len(label_module._glyph_textures) == 4
+    assert (font_name, 20, "a") not in label_module._glyph_textures
+    assert label_module.get_glyph_texture(font_name, 20, "a") is not first
+
+
+def test_glyph_cache_keeps_recently_used(app, monkeypatch):
+    monkeypatch.setattr(label_module, "MAX_GLYPH_TEXTURES", 3)
+    label_module._glyph_textures.clear()
+    font_name = app.theme_cls.font_style_table["Body"].font_name
+    kept = label_module.get_glyph_texture(font_name, 21, "x")
+    label_module.get_glyph_texture(font_name, 21, "y")
+    label_module.get_glyph_texture(font_name, 21, "x")
+    label_module.get_glyph_texture(font_name, 21, "z")
+    label_module.get_glyph_texture(font_name, 21, "w")
+    assert label_module.get_glyph_texture(font_name, 21, "x") is kept
@@ -0,0 +1,185 @@
+import gc
+
+import pytest
+
+from flatkivy.icon_lod import (
+    BUCKETS,
+    LOD_BITMAP,
+    LOD_VECTOR,
+    IconLOD,
+    REFERENCE_DPI,
+    icon_lod,
+    size_bucket,
+)
+
+SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="64" height="32">'
+    '<path fill="#f00" d="M0 0H64V32H0Z"/></svg>'
+)
+
+
+@pytest.fixture
+def svg_file(tmp_path):
+    filename = tmp_path / "icon.svg"
+    filename.write_text(SVG)
+    yield str(filename)
+    icon_lod.clear()
+
+
+def make_image(svg_file, size, lod="auto"):
+    from flatkivy.uix.label import FlatSvgImage
+
+    # Loaded icons take the size of their artwork.
+    image = FlatSvgImage(filename=svg_file, async_load=False, lod=lod)
+    image.size = size
+    return image
+
+
+def test_size_bucket():
+    assert size_bucket(1) == BUCKETS[0]
+    assert size_bucket(24) == 24
+    assert size_bucket(25) == 32
+    assert size_bucket(BUCKETS[-1] + 1) is None
+
+
+def test_select_uses_the_physical_size():
+    lod = IconLOD()
+    assert lod.select(40, dpi=REFERENCE_DPI) == (LOD_BITMAP, 48)
+    assert lod.select(200, dpi=REFERENCE_DPI) == (LOD_VECTOR, None)
+    # 200 pixels on a dense screen are small to the eye.
+    assert lod.select(200, dpi=REFERENCE_DPI * 3) == (LOD_BITMAP, 256)
+    assert lod.select(1000, dpi=REFERENCE_DPI * 20) == (LOD_VECTOR, None)
+
+
+def test_bitmaps_are_cached_per_bucket(app, svg_file):
+    from flatkivy.svg_cache import svg_cache
+
+    data = svg_cache.load(svg_file)
+    calls = []
+
+    def instruction():
+        calls.append(None)
+        return data.instructions()
+
+    key = svg_cache.key(svg_file)
+    texture = icon_lod.get_bitmap(key, 32, data.size, instruction)
+    assert texture.size == (32, 16)
+    assert icon_lod.get_bitmap(key, 32, data.size, instruction) is texture
+    assert len(calls) == 1
+    icon_lod.get_bitmap(key, 64, data.size, instruction)
+    assert len(calls) == 2
+    icon_lod.clear(key)
+    icon_lod.get_bitmap(key, 32, data.size, instruction)
+    assert len(calls) == 3
+
+
+def test_small_icons_are_bitmaps(app, svg_file, frames):
+    image = make_image(svg_file, (16, 8))
+    frames()
+    assert image._current_lod == (LOD_BITMAP, 16)
+    image.size = (600, 300)
+    frames()
+    assert image._current_lod == (LOD_VECTOR, None)
+
+
+def test_forced_lod(app, svg_file, frames):
+    image = make_image(svg_file, (600, 300), lod=LOD_BITMAP)
+    frames()
+    assert image._current_lod == (LOD_BITMAP, 512)
+    image.lod = LOD_VECTOR
+    assert image._current_lod == (LOD_VECTOR, None)
+
+
+def test_icons_of_a_bucket_share_the_bitmap(app, svg_file, frames):
+    first = make_image(svg_file, (12, 6))
+    second = make_image(svg_file, (16, 8))
+    frames()
+    first_rect = first._lod_group.children[-1]
+    second_rect = second._lod_group.children[-1]
+    assert first_rect.texture is second_rect.texture
+
+
+def test_bitmaps_are_not_tinted_by_the_parent_color(
+    app, tmp_path, frames
+):
+    from kivy.graphics import Color, Fbo, Rectangle
+
+    filename = tmp_path / "white.svg"
+    filename.write_text(SVG.replace("#f00", "#fff"))
+    image = make_image(str(filename), (32, 16), lod=LOD_BITMAP)
+    frames()
+    assert image._current_lod == (LOD_BITMAP, 32)
+    # The Rectangle is preceded by the BindTexture of its texture.
+    color, rect = image._lod_group.children[0], image._lod_group.children[-1]
+    assert isinstance(color, Color) and color.rgba == [1, 1, 1, 1]
+    assert isinstance(rect, Rectangle)
+
+    fbo = Fbo(size=(64, 32))
+    with fbo:
+        Color(1, 0, 0, 1)
+    fbo.add(image.canvas)
+    fbo.draw()
+    try:
+        assert fbo.get_pixel_color(8, 8) == [255, 255, 255, 255]
+    finally:
+        # Release the framebuffer now: collected later, it would be freed
+        # in the middle of the next framebuffer drawn.
+        fbo.remove(image.canvas)
+        del fbo
+        gc.collect()
+
+
+def test_svg_image_coalesces_transform_updates(
+    app, svg_file, frames, monkeypatch
+):
+    from kivy.graphics.transformation import Matrix
+
+    from flatkivy.uix import label
+
+    image = make_image(svg_file, (64, 32))
+    assert not isinstance(image, label.Scatter)
+    frames()
+    created = []
+
+    def counting_matrix():
+        created.append(None)
+        return Matrix()
+
+    monkeypatch.setattr(label, "Matrix", counting_matrix)
+    for x in (10, 20, 30):
+        image.pos = (x, 5)
+    image.size = (128, 64)
+    image.size = (32, 16)
+    frames()
+    assert len(created) == 1
+    assert image._matrix.matrix.get()[0] == 0.5
+    assert image._matrix.matrix.get()[12:14] == (30, 5)
+    image.pos = (0, 0)
+    image.pos = (30, 5)
+    frames()
+    assert len(created) == 1
+
+
+def test_svg_icon_only_rescales_on_change(app, svg_file):
+    from flatkivy.uix.label import FlatSvgIcon
+
+    icon = FlatSvgIcon(filename=svg_file, async_load=False)
+
+    class RecordingScale:
+        writes = []
+
+        @property
+        def xyz(self):
+            return self.writes[-1]
+
+        @xyz.setter
+        def xyz(self, value):
+            self.writes.append(value)
+
+    icon._scale = RecordingScale()
+    icon._update_transform()
+    assert RecordingScale.writes == []
+    icon.size = (128, 64)
+    assert RecordingScale.writes == [(2, 2, 1.)]
+    icon._update_transform()
+    assert RecordingScale.writes == [(2, 2, 1.)]
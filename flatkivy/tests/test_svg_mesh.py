@@ -0,0 +1,261 @@
+import gc
+import math
+import os
+import time
+import weakref
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from flatkivy import path
+from flatkivy import svg_mesh
+from flatkivy.svg_cache import SvgCache
+from flatkivy.svg_mesh import (
+    UnsupportedSvg,
+    read_svg_mesh,
+    tessellate_polygon,
+    tessellate_svg,
+    write_svg_mesh,
+)
+
+GLYPHICONS = os.path.join(
+    path, "icons", "glyphicons", "flat-ui-pro-icons-regular.svg"
+)
+ICOMOON = os.path.join(path, "icons", "iconmoon", "icomoon.svg")
+LATO = os.path.join(path, "fonts", "lato", "lato-regular.svg")
+
+TRIANGLE = "M896 192l-384 512-384-512h768z"
+"""Glyph U+E600 of the glyphicons pack."""
+
+
+def glyph_paths(filename):
+    root = ET.parse(filename).getroot()
+    return {
+        glyph.get("unicode"): glyph.get("d")
+        for glyph in root.iter("{http://www.w3.org/2000/svg}glyph")
+        if glyph.get("d")
+    }
+
+
+def triangles(vertices, indices):
+    for i in range(0, len(indices), 3):
+        yield [
+            (vertices[index * 2], vertices[index * 2 + 1])
+            for index in indices[i:i + 3]
+        ]
+
+
+def area(meshes):
+    total = 0
+    for vertices, indices in meshes:
+        for (x1, y1), (x2, y2), (x3, y3) in triangles(vertices, indices):
+            total += abs((x2 - x1) * (y3 - y1) - (x3 - x1) * (y2 - y1)) / 2
+    return total
+
+
+def write_svg(tmp_path, body, attributes='width="64" height="64"'):
+    filename = tmp_path / "test.svg"
+    filename.write_text(
+        f'<svg xmlns="http://www.w3.org/2000/svg" {attributes}>{body}</svg>'
+    )
+    return str(filename)
+
+
+@pytest.mark.parametrize("filename", [GLYPHICONS, ICOMOON, LATO])
+def test_bundled_glyphs_parse(filename):
+    paths = glyph_paths(filename)
+    assert paths
+    for d in paths.values():
+        contours = svg_mesh._path_contours(d)
+        assert contours
+        for contour in contours:
+            assert all(math.isfinite(v) for point in contour for v in point)
+
+
+def test_bundled_glyphs_tessellate():
+    for code, d in glyph_paths(GLYPHICONS).items():
+        contours = svg_mesh._path_contours(d)
+        xs = [x for contour in contours for x, _ in contour]
+        ys = [y for contour in contours for _, y in contour]
+        meshes = tessellate_polygon(contours)
+        assert meshes, code
+        for vertices, indices in meshes:
+            assert len(indices) % 3 == 0
+            assert max(indices) < len(vertices) // 2
+            assert min(xs) - 1 <= min(vertices[0::2])
+            assert max(vertices[0::2]) <= max(xs) + 1
+            assert min(ys) - 1 <= min(vertices[1::2])
+            assert max(vertices[1::2]) <= max(ys) + 1
+
+
+def test_path_contours():
+    assert svg_mesh._path_contours(TRIANGLE) == [
+        [(896, 192), (512, 704), (128, 192), (896, 192)]
+    ]
+    assert area(tessellate_polygon(svg_mesh._path_contours(TRIANGLE))) == (
+        pytest.approx(768 * 512 / 2)
+    )
+    # Half a circle of radius 10, from (0, 0) to (20, 0).
+    arc = svg_mesh._path_contours("M0 0 A10 10 0 0 1 20 0 Z")[0]
+    assert arc[-1] == pytest.approx((20, 0))
+    assert all(math.hypot(x - 10, y) == pytest.approx(10) for x, y in arc)
+    with pytest.raises(UnsupportedSvg):
+        svg_mesh._path_contours("M0 0 X10 10")
+
+
+def test_even_odd_holes():
+    outer = [(0, 0), (10, 0), (10, 10), (0, 10)]
+    inner = [(2, 2), (8, 2), (8, 8), (2, 8)]
+    assert area(tessellate_polygon([outer, inner])) == pytest.approx(64)
+
+
+def test_parse_transform():
+    matrix = svg_mesh._parse_transform("translate(10, 20) scale(2)")
+    assert matrix == (2, 0, 0, 2, 10, 20)
+    x, y = 5, 0
+    a, b, c, d, e, f = svg_mesh._parse_transform("rotate(90)")
+    assert (a * x + c * y + e, b * x + d * y + f) == pytest.approx((0, 5))
+    with pytest.raises(UnsupportedSvg):
+        svg_mesh._parse_transform("perspective(2)")
+
+
+def test_tessellate_svg(tmp_path):
+    filename = write_svg(
+        tmp_path,
+        f'<g opacity="0.5"><path fill="#f00" d="{TRIANGLE}"/></g>',
+        'width="64" height="64" viewBox="0 0 1024 1024"',
+    )
+    data = tessellate_svg(filename)
+    assert data.size == (64, 64)
+    (rgba, vertices, indices), = data.fills
+    assert rgba == pytest.approx((1, 0, 0, 0.5))
+    # Scaled to 64 pixels and flipped: the apex at y=704 ends up at 20.
+    assert max(vertices[1::2]) == pytest.approx(64 - 192 / 16)
+    assert min(vertices[1::2]) == pytest.approx(64 - 704 / 16)
+    assert area([(vertices, indices)]) == pytest.approx(48 * 32 / 2)
+
+    compiled = str(tmp_path / "test.fkmesh")
+    write_svg_mesh(data, compiled)
+    read = read_svg_mesh(compiled)
+    assert read.size == data.size
+    (read_rgba, read_vertices, read_indices), = read.fills
+    assert read_rgba == pytest.approx(rgba)
+    assert list(read_vertices) == list(vertices)
+    assert list(read_indices) == list(indices)
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        f'<path stroke="#000" d="{TRIANGLE}"/>',
+        f'<path fill="url(#gradient)" d="{TRIANGLE}"/>',
+        f'<path clip-path="url(#clip)" d="{TRIANGLE}"/>',
+        '<text>Text</text>',
+    ],
+)
+def test_unsupported_documents(tmp_path, body):
+    with pytest.raises(UnsupportedSvg):
+        tessellate_svg(write_svg(tmp_path, body))
+
+
+def test_bundled_fonts_are_unsupported_documents():
+    with pytest.raises(UnsupportedSvg):
+        tessellate_svg(GLYPHICONS)
+
+
+def wait_for(cache, frames, timeout=5):
+    deadline = time.monotonic() + timeout
+    while cache._pending and time.monotonic() < deadline:
+        frames()
+
+
+class Receiver:
+    def __init__(self):
+        self.received = []
+
+    def on_loaded(self, data):
+        self.received.append(data)
+
+
+def test_cache_delivers_tessellated_data(tmp_path, frames):
+    cache = SvgCache()
+    receiver = Receiver()
+    filename = write_svg(tmp_path, f'<path d="{TRIANGLE}"/>')
+    cache.request(filename, receiver.on_loaded)
+    wait_for(cache, frames)
+    data, = receiver.received
+    assert data is cache.get(filename)
+    cache.request(filename, receiver.on_loaded)
+    assert receiver.received == [data, data]
+
+
+def test_cache_holds_callbacks_weakly(tmp_path, frames):
+    cache = SvgCache()
+    receiver = Receiver()
+    received = receiver.received
+    ref = weakref.ref(receiver)
+    cache.request(
+        write_svg(tmp_path, f'<path d="{TRIANGLE}"/>'), receiver.on_loaded
+    )
+    del receiver
+    gc.collect()
+    assert ref() is None
+    wait_for(cache, frames)
+    assert not cache._pending
+    assert received == []
+
+
+def test_compile_tool(tmp_path):
+    import subprocess
+    import sys
+
+    icons = tmp_path / "icons"
+    icons.mkdir()
+    supported = write_svg(icons, f'<path d="{TRIANGLE}"/>')
+    unsupported = icons / "stroked.svg"
+    unsupported.write_text(
+        '<svg xmlns="http://www.w3.org/2000/svg" width="8" height="8">'
+        '<path stroke="#000" d="M0 0H8V8Z"/></svg>'
+    )
+    result = subprocess.run(
+        [sys.executable, "-m", "flatkivy.tools.compile_svg_meshes", str(icons)],
+        capture_output=True,
+        text=True,
+        cwd=os.path.dirname(path),
+    )
+    assert result.returncode == 0, result.stderr
+    assert "stroked.svg: not compiled" in result.stdout
+    assert not os.path.exists(svg_mesh.compiled_filename(str(unsupported)))
+    assert svg_mesh.has_compiled_mesh(supported)
+    compiled = read_svg_mesh(svg_mesh.compiled_filename(supported))
+    assert area([(v, i) for _, v, i in compiled.fills]) == pytest.approx(
+        768 * 512 / 2
+    )
+
+
+def test_cache_loads_compiled_meshes(tmp_path, monkeypatch):
+    filename = write_svg(tmp_path, f'<path d="{TRIANGLE}"/>')
+    compiled = svg_mesh.compiled_filename(filename)
+    write_svg_mesh(tessellate_svg(filename), compiled)
+    cache = SvgCache()
+    assert cache.is_ready(filename)
+
+    def fail(filename):
+        raise AssertionError("tessellated a compiled file")
+
+    monkeypatch.setattr("flatkivy.svg_cache.tessellate_svg", fail)
+    assert cache.load(filename).fills
+    # The compiled mesh alone is enough.
+    os.remove(filename)
+    assert SvgCache().load(filename).fills
+    assert SvgCache().load(compiled).fills
+
+
+def test_stale_compiled_meshes_are_ignored(tmp_path):
+    filename = write_svg(tmp_path, f'<path d="{TRIANGLE}"/>')
+    compiled = svg_mesh.compiled_filename(filename)
+    write_svg_mesh(tessellate_svg(filename), compiled)
+    mtime = os.path.getmtime(compiled)
+    os.utime(filename, (mtime + 10, mtime + 10))
+    assert not svg_mesh.has_compiled_mesh(filename)
+    assert not SvgCache().is_ready(filename)
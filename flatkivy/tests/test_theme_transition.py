@@ -0,0 +1,169 @@
+import time
+
+import pytest
+from kivy.core.window import Window
+from kivy.uix.widget import Widget
+
+from flatkivy.colors import (
+    DARK_TEXT,
+    LIGHT_TEXT,
+    intern_color,
+    palette_colors,
+    style_colors,
+)
+
+
+class StaticRecorder:
+    def __init__(self):
+        self.refreshes = 0
+
+    def refresh_theme(self, theme_cls):
+        self.refreshes += 1
+
+
+@pytest.fixture
+def theme_cls(app, frames):
+    theme_cls = app.theme_cls
+    primary_palette = theme_cls.primary_palette
+    theme_cls.transition_duration = 0
+    theme_cls.theme_style = "Light"
+    frames()
+    yield theme_cls
+    theme_cls.transition_duration = 0
+    theme_cls.theme_style = "Light"
+    theme_cls.primary_palette = primary_palette
+    frames()
+
+
+def run_transition(theme_cls, frames, timeout=2.0):
+    end = time.monotonic() + timeout
+    while theme_cls.transition_progress < 1 and time.monotonic() < end:
+        frames()
+        time.sleep(0.005)
+    frames()
+
+
+def start_transition(theme_cls, frames):
+    # Runs a few frames of a long transition.
+    for _ in range(3):
+        frames()
+        time.sleep(0.02)
+    assert 0 < theme_cls.transition_progress < 1
+
+
+def test_instant_switch(theme_cls):
+    theme_cls.theme_style = "Dark"
+    assert theme_cls.text_color == style_colors["Dark"].text
+    assert theme_cls.transition_progress == 1
+
+
+def test_transition_interpolates_then_reaches_target(theme_cls, frames):
+    theme_cls.transition_duration = 0.1
+    start = theme_cls.bg_color
+    theme_cls.theme_style = "Dark"
+    assert theme_cls.bg_color == start
+    assert theme_cls.transition_progress == 0
+    run_transition(theme_cls, frames)
+    assert theme_cls.transition_progress == 1
+    assert theme_cls.bg_color == style_colors["Dark"].bg
+    assert theme_cls._transition_event is None
+
+
+def test_zero_duration_during_transition(theme_cls, frames):
+    theme_cls.transition_duration = 10
+    theme_cls.theme_style = "Dark"
+    frames()
+    theme_cls.transition_duration = 0
+    frames()
+    assert theme_cls._transition_event is None
+    assert theme_cls._shown_colors == theme_cls._target_colors()
+    assert theme_cls.text_color == style_colors["Dark"].text
+
+
+def test_instant_switch_cancels_running_transition(theme_cls, frames):
+    theme_cls.transition_duration = 10
+    theme_cls.theme_style = "Dark"
+    frames()
+    theme_cls.transition_duration = 0
+    theme_cls.theme_style = "Light"
+    assert theme_cls._transition_event is None
+    assert theme_cls._shown_colors == theme_cls._target_colors()
+    assert theme_cls.transition_progress == 1
+    assert theme_cls.text_color == style_colors["Light"].text
+    frames(3)
+    assert theme_cls.text_color == style_colors["Light"].text
+
+
+def test_static_widgets_refreshed_once_per_transition(theme_cls, frames):
+    recorder = StaticRecorder()
+    theme_cls.register_static(recorder)
+    theme_cls.transition_duration = 0.1
+    theme_cls.theme_style = "Dark"
+    run_transition(theme_cls, frames)
+    assert recorder.refreshes == 1
+
+
+def test_transition_start_dispatches_nothing(theme_cls, frames):
+    dispatched = []
+    for name in ("primary_color", "bg_color", "text_color"):
+        theme_cls.fbind(name, lambda *args, name=name: dispatched.append(name))
+
+    def on_clearcolor(*args):
+        dispatched.append("clearcolor")
+
+    Window.fbind("clearcolor", on_clearcolor)
+    clearcolor = list(Window.clearcolor)
+    try:
+        theme_cls.transition_duration = 10
+        theme_cls.theme_style = "Dark"
+        theme_cls.primary_palette = "Alizarin"
+        assert dispatched == []
+        assert list(Window.clearcolor) == clearcolor
+        start_transition(theme_cls, frames)
+        assert set(dispatched) == {
+            "primary_color", "bg_color", "text_color", "clearcolor"
+        }
+    finally:
+        Window.funbind("clearcolor", on_clearcolor)
+
+
+def test_specific_text_color_follows_transition(theme_cls, frames):
+    from flatkivy.theming import ThemableBehavior
+    from flatkivy.uix.behaviors import SpecificBackgroundColorBehavior
+
+    class Panel(ThemableBehavior, SpecificBackgroundColorBehavior, Widget):
+        pass
+
+    theme_cls.primary_palette = "Turquoise"
+    panel = Panel(background_palette="Primary")
+    start = panel.specific_text_color
+    target = palette_colors["Alizarin"].base
+    theme_cls.transition_duration = 10
+    theme_cls.primary_palette = "Alizarin"
+    assert panel.specific_text_color == start
+    start_transition(theme_cls, frames)
+    assert panel.specific_text_color not in (start, target)
+    assert theme_cls.get_palette_colors("Primary").base == (
+        panel.specific_text_color
+    )
+    theme_cls.transition_duration = 0
+    frames()
+    assert panel.specific_text_color is intern_color(target)
+    assert panel.specific_secondary_text_color is intern_color(
+        (*target[:3], 0.7)
+    )
+
+
+def test_toolbar_text_follows_transition(theme_cls, frames):
+    from flatkivy.uix.toolbar import FlatToolbar
+
+    theme_cls.primary_palette = "Clouds"
+    toolbar = FlatToolbar()
+    assert toolbar.specific_text_color == DARK_TEXT[0]
+    theme_cls.transition_duration = 10
+    theme_cls.primary_palette = "Wet Asphalt"
+    start_transition(theme_cls, frames)
+    assert toolbar.specific_text_color not in (DARK_TEXT[0], LIGHT_TEXT[0])
+    theme_cls.transition_duration = 0
+    frames()
+    assert toolbar.specific_text_color == LIGHT_TEXT[0]
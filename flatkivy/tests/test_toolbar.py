@@ -0,0 +1,233 @@
+import sys
+
+import pytest
+from kivy.uix.widget import Widget
+
+from flatkivy.colors import DARK_TEXT, LIGHT_TEXT, palette_colors
+
+
+@pytest.fixture
+def theme_cls(app):
+    theme_cls = app.theme_cls
+    primary_palette = theme_cls.primary_palette
+    yield theme_cls
+    theme_cls.primary_palette = primary_palette
+
+
+def test_toolbar_does_not_import_kivymd(app):
+    import flatkivy.uix.toolbar  # noqa: F401
+
+    assert not any(name.split(".")[0] == "kivymd" for name in sys.modules)
+
+
+@pytest.mark.parametrize(
+    "palette, text", [("Clouds", DARK_TEXT), ("Wet Asphalt", LIGHT_TEXT)]
+)
+def test_toolbar_text_contrasts_with_its_palette(theme_cls, palette, text):
+    from flatkivy.uix.toolbar import FlatToolbar
+
+    toolbar = FlatToolbar(title="Title")
+    theme_cls.primary_palette = palette
+    assert toolbar.specific_text_color == text[0]
+    assert toolbar.specific_secondary_text_color == text[1]
+    assert toolbar.ids.label_title.color == list(text[0])
+
+
+def test_specific_text_color_is_the_palette_color(theme_cls):
+    from flatkivy.uix.behaviors import SpecificBackgroundColorBehavior
+
+    class Panel(SpecificBackgroundColorBehavior, Widget):
+        pass
+
+    panel = Panel(background_palette="Alizarin")
+    base = palette_colors["Alizarin"].base
+    assert panel.specific_text_color == base
+    assert panel.specific_secondary_text_color == (*base[:3], 0.7)
+
+
+def test_toolbar_elevation(app):
+    from kivy.metrics import dp
+
+    from flatkivy.uix.toolbar import FlatToolbar
+
+    toolbar = FlatToolbar(title="Title")
+    assert toolbar.elevation == 6
+    assert toolbar._shadow in toolbar.canvas.before.children
+    assert toolbar._shadow.offset == (0, -dp(6) / 2)
+    assert toolbar._shadow_color_instruction.a > 0
+    bottom = FlatToolbar(type="bottom")
+    assert bottom.elevation == 0
+    assert bottom._shadow_color_instruction.a == 0
+
+
+def _buttons(action_bar):
+    return list(reversed(action_bar.children))
+
+
+def test_action_buttons_are_reconciled(app):
+    from flatkivy.uix.toolbar import FlatToolbar
+
+    toolbar = FlatToolbar()
+    bar = toolbar.ids.right_actions
+    calls = []
+    toolbar.right_action_items = [
+        ["ic-clock", lambda x: calls.append("clock")],
+        ["ic-vertical-menu", lambda x: calls.append("menu")],
+    ]
+    clock, menu = _buttons(bar)
+    assert [b.icon for b in (clock, menu)] == ["ic-clock", "ic-vertical-menu"]
+    menu.dispatch("on_release")
+    assert calls == ["menu"]
+
+    toolbar.right_action_items = [["ic-vertical-menu", lambda x: None]]
+    assert _buttons(bar) == [menu]
+    assert toolbar._action_button_pool == [clock]
+
+
+def test_action_button_pool_is_per_toolbar(app):
+    from flatkivy.uix.toolbar import FlatToolbar
+
+    first, second = FlatToolbar(), FlatToolbar()
+    first.right_action_items = [["ic-clock", lambda x: None]]
+    first.right_action_items = []
+    assert len(first._action_button_pool) == 1
+    assert second._action_button_pool == []
+    second.right_action_items = [["ic-clock", lambda x: None]]
+    assert _buttons(second.ids.right_actions)[0] not in first._action_button_pool
+
+
+def test_pooled_action_button_is_reset(app):
+    from flatkivy.uix.toolbar import FlatToolbar
+
+    toolbar = FlatToolbar()
+    calls = []
+    toolbar.right_action_items = [["ic-clock", lambda x: calls.append("old")]]
+    button = _buttons(toolbar.ids.right_actions)[0]
+    button.bind(on_press=lambda x: calls.append("press"))
+    button.fbind("on_release", lambda x: calls.append("fbind"))
+    button.disabled = True
+    button.opposite_colors = True
+    toolbar.right_action_items = []
+    assert button.get_property_observers("on_release") == []
+    assert button.get_property_observers("on_press") == []
+
+    toolbar.right_action_items = [["ic-menu", lambda x: calls.append("new")]]
+    assert _buttons(toolbar.ids.right_actions) == [button]
+    assert button.icon == "ic-menu"
+    assert not button.disabled and not button.opposite_colors
+    assert button.text_color == toolbar.specific_text_color
+    button.dispatch("on_press")
+    button.dispatch("on_release")
+    assert calls == ["new"]
+
+
+def test_pooled_action_buttons_are_not_orphans(app, window, monkeypatch):
+    from flatkivy.leak_tracker import LeakTracker
+    from flatkivy.uix.toolbar import FlatToolbar
+
+    tracker = LeakTracker()
+    tracker.enable()
+    monkeypatch.setattr("flatkivy.theming.leak_tracker", tracker)
+    toolbar = FlatToolbar()
+    window.add_widget(toolbar)
+    toolbar.right_action_items = [["ic-clock", lambda x: None]]
+    toolbar.right_action_items = []
+    (button,) = toolbar.pooled_widgets()
+    assert button.parent is None
+    assert not hasattr(button, "_pooled_by")
+    assert button not in tracker.orphans(min_age=0)
+    window.remove_widget(toolbar)
+    assert button in tracker.orphans(min_age=0)
+
+
+@pytest.fixture
+def bottom_bar(app, frames):
+    from flatkivy.uix.toolbar import FlatToolbar
+
+    toolbar = FlatToolbar(type="bottom", mode="center", size=(400, 56))
+    frames()
+    return toolbar
+
+
+def test_notch_is_updated_once_per_frame(app, frames, monkeypatch):
+    from flatkivy.uix.toolbar import FlatToolbar, NotchGeometry
+
+    updates = []
+    original = NotchGeometry.update
+
+    # Named like the method, the trigger looks it up by name.
+    def update(self, *args):
+        if self._dirty:
+            updates.append(None)
+        original(self, *args)
+
+    monkeypatch.setattr(NotchGeometry, "update", update)
+    toolbar = FlatToolbar(type="bottom")
+    frames()
+    updates.clear()
+    toolbar.size = (300, 56)
+    toolbar.pos = (10, 10)
+    toolbar.round = 4
+    frames()
+    assert len(updates) == 1
+
+
+def test_top_bar_has_no_notch(app, frames):
+    from flatkivy.uix.toolbar import FlatToolbar
+
+    toolbar = FlatToolbar()
+    frames()
+    notch = toolbar.notch
+    for shape in (notch._left, notch._gap, notch._right, notch._notch):
+        assert tuple(shape.size) == (0, 0)
+
+
+def test_notch_shapes_cover_the_bar(bottom_bar):
+    notch = bottom_bar.notch
+    left, gap, right = notch._left, notch._gap, notch._right
+    assert left.pos[0] == bottom_bar.x
+    assert left.pos[0] + left.size[0] == pytest.approx(gap.pos[0])
+    assert gap.pos[0] + gap.size[0] == pytest.approx(right.pos[0])
+    assert right.pos[0] + right.size[0] >= bottom_bar.right
+    assert gap.pos[0] == notch._notch.pos[0]
+    assert notch._mesh_group.children == []
+
+
+def mesh_area(meshes):
+    total = 0
+    for mesh in meshes:
+        v, i = mesh.vertices, mesh.indices
+        for a, b, c in zip(i[0::3], i[1::3], i[2::3]):
+            total += abs(
+                (v[b * 2] - v[a * 2]) * (v[c * 2 + 1] - v[a * 2 + 1])
+                - (v[c * 2] - v[a * 2]) * (v[b * 2 + 1] - v[a * 2 + 1])
+            ) / 2
+    return total
+
+
+def test_notch_mesh(bottom_bar, frames):
+    notch = bottom_bar.notch
+    bottom_bar.notch_mesh = True
+    frames()
+    for shape in (notch._left, notch._gap, notch._right, notch._notch):
+        assert tuple(shape.size) == (0, 0)
+    meshes = list(notch._mesh_group.children[1::2])
+    bar_area = bottom_bar.width * bottom_bar.height
+    assert 0.8 * bar_area < mesh_area(meshes) < bar_area
+    # Nothing the outline depends on changed: the mesh is kept.
+    notch.mark_dirty()
+    frames()
+    assert list(notch._mesh_group.children[1::2]) == meshes
+    bottom_bar.width = 500
+    frames()
+    assert mesh_area(notch._mesh_group.children[1::2]) > mesh_area(meshes)
+
+
+def test_notch_outline():
+    from flatkivy.uix.toolbar import notch_outline
+
+    square = notch_outline(0, 0, 100, 50, 40, 20, 40, 10, 4, notched=False)
+    assert square == [(0, 0), (100, 0), (100, 50), (0, 50)]
+    outline = notch_outline(0, 0, 100, 50, 40, 20, 40, 10, 4)
+    assert min(y for _, y in outline if 0 < y) == pytest.approx(30)
+    assert all(0 <= x <= 100 and 0 <= y <= 50 for x, y in outline)
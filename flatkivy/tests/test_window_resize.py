@@ -0,0 +1,81 @@
+import gc
+
+import pytest
+from kivy.event import EventDispatcher
+from kivy.properties import ListProperty
+
+from flatkivy.window_resize import WindowResizeDispatcher
+
+
+class FakeWindow(EventDispatcher):
+    size = ListProperty([800, 600])
+
+
+class Receiver:
+    def __init__(self):
+        self.sizes = []
+
+    def on_resize(self, window, width, height):
+        self.sizes.append((width, height))
+
+
+@pytest.fixture
+def window():
+    return FakeWindow()
+
+
+@pytest.fixture
+def dispatcher(window):
+    return WindowResizeDispatcher(window)
+
+
+def test_calls_once_per_frame_with_the_last_size(dispatcher, window, frames):
+    receiver = Receiver()
+    dispatcher.bind(receiver.on_resize)
+    window.size = [640, 480]
+    window.size = [320, 240]
+    window.size = [1024, 768]
+    frames()
+    assert receiver.sizes == [(1024, 768)]
+    frames()
+    assert receiver.sizes == [(1024, 768)]
+
+
+def test_size_back_to_start_is_not_a_change(dispatcher, window, frames):
+    receiver = Receiver()
+    dispatcher.bind(receiver.on_resize)
+    window.size = [640, 480]
+    window.size = [800, 600]
+    frames()
+    assert receiver.sizes == []
+
+
+def test_window_bound_once_and_released(dispatcher, window):
+    first, second = Receiver(), Receiver()
+    dispatcher.bind(first.on_resize)
+    dispatcher.bind(second.on_resize)
+    assert len(window.get_property_observers("size")) == 1
+    dispatcher.unbind(first.on_resize)
+    assert len(dispatcher) == 1
+    dispatcher.unbind(second.on_resize)
+    assert window.get_property_observers("size") == []
+
+
+def test_methods_are_held_weakly(dispatcher, window, frames):
+    receiver = Receiver()
+    dispatcher.bind(receiver.on_resize)
+    del receiver
+    gc.collect()
+    assert len(dispatcher) == 0
+    window.size = [640, 480]
+    frames()
+    assert window.get_property_observers("size") == []
+
+
+def test_functions_are_held_strongly(dispatcher, window, frames):
+    sizes = []
+    dispatcher.bind(lambda window, width, height: sizes.append(width))
+    gc.collect()
+    window.size = [640, 480]
+    frames()
+    assert sizes == [640]
@@ -21,24 +21,62 @@ The main application class inherited from the `FlatApp` class has the :attr:`fla
 attribute, with which you control the flat ui properties of your application.
 """
 
+from collections import namedtuple
+from weakref import WeakSet
+
 from kivy.app import App
 from kivy.core.window import Window
+from kivy.animation import AnimationTransition
 from kivy.clock import Clock
-from kivy.metrics import dp
+from kivy.metrics import Metrics, dp, sp
 from kivy.properties import (
     OptionProperty,
     AliasProperty,
     ObjectProperty,
     StringProperty,
-    ListProperty,
     BooleanProperty,
     DictProperty,
+    NumericProperty,
 )
 from kivy.event import EventDispatcher
-from kivy.utils import get_color_from_hex
 
 from flatkivy.color_definitions import colors, palette
+from flatkivy.colors import PaletteColors, intern_color, palette_colors
+from flatkivy.colors import style_colors as theme_style_colors
 from flatkivy.flat_resources import DEVICE_TYPE, DEVICE_IOS
+from flatkivy.instrumentation import instrumented
+from flatkivy.leak_tracker import leak_tracker
+from flatkivy.window_resize import window_resize
+
+
+FontStyle = namedtuple(
+    "FontStyle", ("font_name", "font_size", "capitalize", "letter_spacing")
+)
+"""Font style of :attr:`ThemeManager.font_style_table`."""
+
+
+CLEAR_COLORS = {
+    "Light": palette_colors["Clouds"].base,
+    "Dark": palette_colors["Wet Asphalt"].base,
+}
+"""Window clear color of each theme style."""
+
+TRANSITION_COLORS = (
+    "primary_color",
+    "accent_color",
+    "bg_color",
+    "bg_accent",
+    "text_color",
+    "secondary_text_color",
+)
+"""Colors of :class:`ThemeManager` interpolated by theme transitions."""
+
+
+def _mix(start, target, t):
+    # Interpolates two rgba colors, or two PaletteColors field by field.
+    if isinstance(target, PaletteColors):
+        return PaletteColors(*(_mix(a, b, t) for a, b in zip(start, target)))
+    return tuple(a + (b - a) * t for a, b in zip(start, target))
 
 
 class ThemeManager(EventDispatcher):
@@ -93,13 +131,25 @@ class ThemeManager(EventDispatcher):
     """
 
 
+    def _get_primary_colors(self):
+        return palette_colors[self.primary_palette]
+
+    primary_colors = AliasProperty(
+        _get_primary_colors, bind=["primary_palette"], cache=True
+    )
+    """
+    :class:`~flatkivy.colors.PaletteColors` of :attr:`primary_palette`:
+    base color, shades, pressed variant and contrasting text colors.
+
+    :attr:`primary_colors` is an :class:`~kivy.properties.AliasProperty`
+    and is readonly.
+    """
+
     def _get_primary_color(self):
-        return get_color_from_hex(
-            colors[self.primary_palette]['BASE']
-        )
+        return self._shown_colors["primary_color"]
 
     primary_color = AliasProperty(
-        _get_primary_color, bind=("primary_palette", "primary_palette")
+        _get_primary_color, bind=["_shown_colors"], cache=True
     )
 
     accent_palette = OptionProperty("Silver", options=palette)
@@ -110,11 +160,24 @@ class ThemeManager(EventDispatcher):
     returns the value of the current application theme, property is readonly.
     """
 
+    def _get_accent_colors(self):
+        return palette_colors[self.accent_palette]
+
+    accent_colors = AliasProperty(
+        _get_accent_colors, bind=["accent_palette"], cache=True
+    )
+    """
+    :class:`~flatkivy.colors.PaletteColors` of :attr:`accent_palette`.
+
+    :attr:`accent_colors` is an :class:`~kivy.properties.AliasProperty`
+    and is readonly.
+    """
+
     def _get_accent_color(self):
-        return get_color_from_hex(colors[self.accent_palette])
+        return self._shown_colors["accent_color"]
 
     accent_color = AliasProperty(
-        _get_accent_color, bind=["accent_palette"]
+        _get_accent_color, bind=["_shown_colors"], cache=True
     )
     """Similar to :attr:`primary_color`,
     but returns a value for :attr:`accent_color`.
@@ -163,14 +226,65 @@ class ThemeManager(EventDispatcher):
         else:
             return self.theme_style
 
+    def _get_style_colors(self):
+        return theme_style_colors[self.theme_style]
+
+    style_colors = AliasProperty(
+        _get_style_colors, bind=["theme_style"], cache=True
+    )
+    """
+    :class:`~flatkivy.colors.StyleColors` of :attr:`theme_style`:
+    backgrounds, disabled and pressed overlays and text colors.
+
+    :attr:`style_colors` is an :class:`~kivy.properties.AliasProperty`
+    and is readonly.
+    """
+
+    def _get_text_color(self):
+        return self._shown_colors["text_color"]
+
+    text_color = AliasProperty(
+        _get_text_color, bind=["_shown_colors"], cache=True
+    )
+    """
+    Color of the text on :attr:`bg_color`.
+
+    :attr:`text_color` is an :class:`~kivy.properties.AliasProperty` that
+    returns the value in ``rgba`` format, property is readonly.
+    """
+
+    def _get_secondary_text_color(self):
+        return self._shown_colors["secondary_text_color"]
+
+    secondary_text_color = AliasProperty(
+        _get_secondary_text_color, bind=["_shown_colors"], cache=True
+    )
+    """
+    Color of the secondary text on :attr:`bg_color`.
+
+    :attr:`secondary_text_color` is an
+    :class:`~kivy.properties.AliasProperty` that returns the value in
+    ``rgba`` format, property is readonly.
+    """
+
+    def get_palette_colors(self, name):
+        """Returns the :class:`~flatkivy.colors.PaletteColors` of the palette
+        `name`, which can also be `'Primary'` or `'Accent'`. During a theme
+        transition, the colors of those two are the interpolated ones: bind
+        :attr:`primary_color` or :attr:`accent_color` to follow them."""
+
+        if name == "Primary":
+            return self._shown_colors["primary_colors"]
+        if name == "Accent":
+            return self._shown_colors["accent_colors"]
+        return palette_colors[name]
+
     def _get_bg_color(self, opposite=False):
-        theme_style = self._get_theme_style(opposite)
-        if theme_style == "Light":
-            return get_color_from_hex(colors["Clouds"]["BASE"])
-        elif theme_style == "Dark":
-            return get_color_from_hex(colors["Midnight Blue"]["BASE"])
+        if not opposite:
+            return self._shown_colors["bg_color"]
+        return theme_style_colors[self._get_theme_style(opposite)].bg
 
-    bg_color = AliasProperty(_get_bg_color, bind=["theme_style", "theme_style"])
+    bg_color = AliasProperty(_get_bg_color, bind=["_shown_colors"], cache=True)
     """
     Similar to :attr:`bg_dark`,
     but the color values ​​are a tone lower (darker) than :attr:`bg_dark`.
@@ -221,13 +335,13 @@ class ThemeManager(EventDispatcher):
     """
 
     def _get_bg_accent(self, opposite=False):
-        theme_style = self._get_theme_style(opposite)
-        if theme_style == "Light":
-            return get_color_from_hex(colors["Silver"]["BASE"])
-        elif theme_style == "Dark":
-            return get_color_from_hex(colors["Wet Asphalt"]["BASE"])
+        if not opposite:
+            return self._shown_colors["bg_accent"]
+        return theme_style_colors[self._get_theme_style(opposite)].bg_accent
 
-    bg_accent = AliasProperty(_get_bg_accent, bind=["theme_style"])
+    bg_accent = AliasProperty(
+        _get_bg_accent, bind=["_shown_colors"], cache=True
+    )
     """
     Similar to :attr:`bg_normal`,
     but the color values ​​are one tone lower (darker) than :attr:`bg_normal`.
@@ -252,10 +366,10 @@ class ThemeManager(EventDispatcher):
         return self._ripple_color
 
     def _set_ripple_color(self, value):
-        self._ripple_color = value
+        self._ripple_color = intern_color(value)
 
     var = colors['Silver']
-    _ripple_color = ListProperty(get_color_from_hex(colors["Silver"]['BASE']))
+    _ripple_color = ObjectProperty(palette_colors["Silver"].base)
     """Private value."""
 
     ripple_color = AliasProperty(
@@ -329,12 +443,114 @@ class ThemeManager(EventDispatcher):
     def set_clearcolor_by_theme_style(self, theme_style):
         if not self.set_clearcolor:
             return
-        if theme_style == "Light":
-            Window.clearcolor = get_color_from_hex(
-                colors["Clouds"]["BASE"]
+        if theme_style == self.theme_style:
+            # Mid transition the clear color shown is the interpolated one.
+            Window.clearcolor = self._shown_colors["clearcolor"]
+        else:
+            Window.clearcolor = CLEAR_COLORS[theme_style]
+
+    transition_duration = NumericProperty(0)
+    """
+    Duration in seconds of the cross-fade between the old and the new theme
+    colors when :attr:`theme_style`, :attr:`primary_palette` or
+    :attr:`accent_palette` change. `0` switches them at once.
+
+    During the transition the handful of colors in
+    :data:`TRANSITION_COLORS`, the primary and accent palettes returned by
+    :meth:`get_palette_colors` and the window clear color are interpolated
+    once per frame, here, and reach the widgets through their usual
+    bindings on those properties: the animation work does not depend on the
+    number of widgets. Widgets registered with :meth:`register_static` are
+    refreshed once, when the transition ends.
+
+    .. code-block:: python
+
+        theme_cls.transition_duration = 0.3
+        theme_cls.theme_style = "Dark"
+
+    :attr:`transition_duration` is an
+    :class:`~kivy.properties.NumericProperty` and defaults to `0`.
+    """
+
+    transition_progress = NumericProperty(1)
+    """
+    Progress of the current theme transition, from `0` to `1`. `1` when no
+    transition is running.
+
+    :attr:`transition_progress` is an
+    :class:`~kivy.properties.NumericProperty` and defaults to `1`.
+    """
+
+    def _target_colors(self):
+        style_colors = self.style_colors
+        return {
+            "primary_color": self.primary_colors.base,
+            "accent_color": self.accent_colors.base,
+            "bg_color": style_colors.bg,
+            "bg_accent": style_colors.bg_accent,
+            "text_color": style_colors.text,
+            "secondary_text_color": style_colors.secondary_text,
+            "clearcolor": CLEAR_COLORS[self.theme_style],
+            "primary_colors": self.primary_colors,
+            "accent_colors": self.accent_colors,
+        }
+
+    _shown_colors = ObjectProperty()
+    # ``{name: color}`` of the colors above as shown: the targets, or the
+    # interpolated ones during a transition. The color aliases only depend
+    # on it, so they dispatch once per frame and only when their value
+    # changes.
+
+    def _start_transition(self, *args):
+        targets = self._target_colors()
+        if self.transition_duration <= 0:
+            self._transition_targets = targets
+            if self._transition_event is not None:
+                self._end_transition()
+            else:
+                self._shown_colors = targets
+            return
+        # Mid transition the colors shown are the interpolated ones, and
+        # the transition starts from them without dispatching anything.
+        self._transition_start = self._shown_colors
+        self._transition_targets = targets
+        self._transition_elapsed = 0
+        if self._transition_event is None:
+            self._transition_event = Clock.schedule_interval(
+                self._step_transition, 0
             )
-        elif theme_style == "Dark":
-            Window.clearcolor = get_color_from_hex(colors["Wet Asphalt"]["BASE"])
+        self.transition_progress = 0
+
+    def _step_transition(self, dt):
+        self._transition_elapsed += dt
+        duration = self.transition_duration
+        if duration <= 0 or self._transition_elapsed >= duration:
+            self._end_transition()
+            return
+        progress = self._transition_elapsed / duration
+        eased = AnimationTransition.in_out_quad(progress)
+        start = self._transition_start
+        self.transition_progress = progress
+        self._shown_colors = {
+            name: _mix(start[name], target, eased)
+            for name, target in self._transition_targets.items()
+        }
+
+    def _end_transition(self):
+        if self._transition_event is not None:
+            self._transition_event.cancel()
+            self._transition_event = None
+        self.transition_progress = 1
+        self._shown_colors = self._transition_targets
+        self._trigger_broadcast()
+
+    def _on_shown_colors(self, *args):
+        self.on_theme_style(self, self.theme_style)
+
+    def _schedule_broadcast(self, *args):
+        # A running transition refreshes the static widgets when it ends.
+        if self._transition_event is None:
+            self._trigger_broadcast()
 
     # font name, size (sp), always caps, letter spacing (sp)
     font_styles = DictProperty(
@@ -347,11 +563,80 @@ class ThemeManager(EventDispatcher):
         }
     )
 
+    _font_scale = NumericProperty(1)
+
+    def _get_font_style_table(self):
+        scale = self._font_scale
+        table = {}
+        for name, info in self.font_styles.items():
+            table[name] = FontStyle(
+                info[0],
+                info[1] * scale,
+                info[2],
+                info[3] * scale if len(info) > 3 else 0,
+            )
+        return table
+
+    font_style_table = AliasProperty(
+        _get_font_style_table, bind=["font_styles", "_font_scale"], cache=True
+    )
+    """
+    :attr:`font_styles` resolved for the screen, as
+    ``{style name: FontStyle(font_name, font_size, capitalize,
+    letter_spacing)}`` with the sizes in pixels.
+
+    It is computed once and again only when :attr:`font_styles`, the
+    density or the font scale of :class:`~kivy.metrics.Metrics` change.
+
+    :attr:`font_style_table` is an :class:`~kivy.properties.AliasProperty`
+    and is readonly.
+    """
+
+    def _update_font_scale(self, *args):
+        self._font_scale = sp(1)
+
     def __init__(self, **kwargs):
+        self._static_widgets = WeakSet()
+        self._transition_event = None
+        self._shown_colors = self._target_colors()
         super().__init__(**kwargs)
+        self._shown_colors = self._target_colors()
+        self.fbind("_shown_colors", self._on_shown_colors)
+        self._update_font_scale()
+        Metrics.fbind("density", self._update_font_scale)
+        Metrics.fbind("fontscale", self._update_font_scale)
         Clock.schedule_once(lambda x: self.on_theme_style(0, self.theme_style))
         self._determine_device_orientation(None, Window.size)
-        Window.bind(size=self._determine_device_orientation)
+        window_resize.bind(self._on_window_resize)
+        self._trigger_broadcast = Clock.create_trigger(
+            self.broadcast_static, -1
+        )
+        self.fbind("theme_style", self._start_transition)
+        self.fbind("primary_palette", self._start_transition)
+        self.fbind("accent_palette", self._start_transition)
+        self.fbind("theme_style", self._schedule_broadcast)
+        self.fbind("primary_palette", self._schedule_broadcast)
+        self.fbind("font_style_table", self._trigger_broadcast)
+
+    def register_static(self, widget):
+        """Registers a widget resolving the theme once, like
+        :class:`~flatkivy.uix.label.FlatStaticLabel`, instead of binding
+        its properties. It is held weakly and refreshed by
+        :meth:`broadcast_static`."""
+
+        self._static_widgets.add(widget)
+
+    def broadcast_static(self, *args):
+        """Calls ``refresh_theme(theme_cls)`` of the registered widgets.
+        Done once per frame after the style, the palette or the font style
+        table changed, and can be called after changing anything else they use.
+        """
+
+        for widget in list(self._static_widgets):
+            widget.refresh_theme(self)
+
+    def _on_window_resize(self, window, width, height):
+        self._determine_device_orientation(window, (width, height))
 
 
 class ThemableBehavior(EventDispatcher):
@@ -371,6 +656,7 @@ class ThemableBehavior(EventDispatcher):
 
     opposite_colors = BooleanProperty(False)
 
+    @instrumented
     def __init__(self, **kwargs):
         if self.theme_cls is not None:
             pass
@@ -392,4 +678,6 @@ class ThemableBehavior(EventDispatcher):
                     "https://github.com/HeaTTheatR/KivyMD/wiki/Modules-Material-App#exceptions"
                 )
             self.theme_cls = App.get_running_app().theme_cls
+        if leak_tracker.enabled:
+            leak_tracker.track(self)
         super().__init__(**kwargs)
@@ -0,0 +1,19 @@
+"""
+Tool for compiling icon tables
+==============================
+
+Writes the memory-mapped icon table (see :mod:`flatkivy.icon_table`) of
+every pack registered in :data:`flatkivy.icon_packs.icon_registry`. Run it
+again after updating an icon font.
+"""
+
+if __name__ == "__main__":
+    from flatkivy.icon_packs import icon_registry
+    from flatkivy.icon_table import write_icon_table
+
+    for pack in icon_registry.packs:
+        if not pack.table_file:
+            continue
+        icons = pack.load_source()
+        write_icon_table(icons, pack.table_file)
+        print(f"{pack.name}: {len(icons)} icons -> {pack.table_file}")
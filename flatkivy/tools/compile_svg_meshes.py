@@ -0,0 +1,53 @@
+"""
+Tool for compiling SVG meshes
+=============================
+
+Tessellates SVG files ahead of time into compiled meshes (see
+:mod:`flatkivy.svg_mesh`) stored next to them, so
+:class:`~flatkivy.uix.label.FlatSvgIcon` loads them without parsing XML.
+Directories are searched recursively. Files the tessellator does not
+support are reported and left to :class:`kivy.graphics.svg.Svg`.
+
+.. code-block:: bash
+
+    python flatkivy/tools/compile_svg_meshes.py assets/icons logo.svg
+"""
+
+if __name__ == "__main__":
+    import argparse
+    import os
+
+    from flatkivy.svg_mesh import (
+        UnsupportedSvg,
+        compiled_filename,
+        tessellate_svg,
+        write_svg_mesh,
+    )
+
+    parser = argparse.ArgumentParser(description="Compile SVG meshes")
+    parser.add_argument("paths", nargs="+", help="SVG files or directories")
+    args = parser.parse_args()
+
+    filenames = []
+    for path in args.paths:
+        if not os.path.isdir(path):
+            filenames.append(path)
+            continue
+        for root, _, files in os.walk(path):
+            filenames.extend(
+                os.path.join(root, name)
+                for name in sorted(files)
+                if name.lower().endswith(".svg")
+            )
+
+    for filename in filenames:
+        try:
+            data = tessellate_svg(filename)
+        except UnsupportedSvg as e:
+            print(f"{filename}: not compiled ({e})")
+            continue
+        write_svg_mesh(data, compiled_filename(filename))
+        print(
+            f"{filename}: {len(data.fills)} fills, "
+            f"{data.vertex_count} vertices"
+        )
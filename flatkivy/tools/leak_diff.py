@@ -0,0 +1,44 @@
+"""
+Tool for comparing leak snapshots
+=================================
+
+Prints the difference between two snapshots written by
+:meth:`flatkivy.leak_tracker.LeakTracker.dump`: how many instances of each
+themable class appeared or went away, and the widgets orphaned since the
+first snapshot with the reference paths keeping them alive.
+
+.. code-block:: bash
+
+    python flatkivy/tools/leak_diff.py before.json after.json
+"""
+
+if __name__ == "__main__":
+    import argparse
+    import json
+    import sys
+
+    from flatkivy.leak_tracker import diff_snapshots
+
+    parser = argparse.ArgumentParser(description="Compare leak snapshots")
+    parser.add_argument("before", help="Earlier snapshot")
+    parser.add_argument("after", help="Later snapshot")
+    args = parser.parse_args()
+
+    with open(args.before) as f:
+        before = json.load(f)
+    with open(args.after) as f:
+        after = json.load(f)
+    changes, orphans = diff_snapshots(before, after)
+
+    print(f"{after['time'] - before['time']:.1f} s between the snapshots")
+    for name, delta in sorted(changes.items(), key=lambda item: -item[1]):
+        print(f"{delta:+6d} {name}")
+    for orphan in orphans:
+        print(f"\norphan #{orphan['serial']} {orphan['class']}")
+        if not orphan["paths"] and not orphan["bindings"]:
+            print("    no path to a root found")
+        for binding in orphan["bindings"]:
+            print("    bound by " + binding)
+        for path in orphan["paths"]:
+            print("    " + " -> ".join(path))
+    sys.exit(1 if orphans else 0)
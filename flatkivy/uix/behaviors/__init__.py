@@ -5,12 +5,15 @@ Modules and classes implementing various behaviors for buttons etc.
 """
 
 from .ripplebehavior import CircularRippleBehavior, RectangularRippleBehavior
-# from .hover_behavior import HoverBehavior
+from .hover_behavior import HoverBehavior
 # from .focus_behavior import FocusBehavior
 
 from .backgroundcolorbehavior import (
     BackgroundColorBehavior,
     SpecificBackgroundColorBehavior,
 )
+from .elevation import RectangularElevationBehavior
+from .spatial_touch_behavior import SpatialTouchBehavior
+
 # from .magic_behavior import MagicBehavior
 # from .touch_behavior import TouchBehavior
\ No newline at end of file
@@ -7,11 +7,12 @@ Behaviors/Background Color
 
 from kivy.lang import Builder
 from kivy.properties import BoundedNumericProperty, ReferenceListProperty
-from kivy.properties import OptionProperty, ListProperty
+from kivy.properties import ObjectProperty, OptionProperty, ListProperty
 from kivy.uix.widget import Widget
-from kivy.utils import get_color_from_hex
 
-from flatkivy.color_definitions import palette, text_colors, colors
+from flatkivy.color_definitions import palette
+from flatkivy.colors import DARK_TEXT, palette_colors, with_alpha
+from flatkivy.instrumentation import instrumented
 
 Builder.load_string(
     """
@@ -108,44 +109,60 @@ class SpecificBackgroundColorBehavior(BackgroundColorBehavior):
     and defaults to `'Primary'`.
     """
 
-    specific_text_color = ListProperty([0, 0, 0, 0.87])
-    """:attr:`specific_text_color` is an :class:`~kivy.properties.ListProperty`
-    and defaults to `[0, 0, 0, 0.87]`.
+    specific_text_color = ObjectProperty(DARK_TEXT[0])
+    """Text color of the background palette, an interned ``rgba`` tuple (see
+    :func:`~flatkivy.colors.intern_color`) outside theme transitions, during
+    which it follows the interpolated palette. Assign a new color instead of
+    editing it in place.
+
+    :attr:`specific_text_color` is an :class:`~kivy.properties.ObjectProperty`
+    and defaults to `(0, 0, 0, 0.87)`.
     """
 
-    specific_secondary_text_color = ListProperty([0, 0, 0, 0.87])
-    """:attr:`specific_secondary_text_color`is an :class:`~kivy.properties.ListProperty`
-    and defaults to `[0, 0, 0, 0.87]`.
+    specific_secondary_text_color = ObjectProperty(DARK_TEXT[1])
+    """Secondary text color of the background palette, an interned ``rgba``
+    tuple.
+
+    :attr:`specific_secondary_text_color` is an
+    :class:`~kivy.properties.ObjectProperty` and defaults to
+    `(0, 0, 0, 0.54)`.
     """
 
+    @instrumented
     def _update_specific_text_color(self, instance, value):
+        intern = True
         if hasattr(self, "theme_cls"):
-            palette = {
-                "Primary": self.theme_cls.primary_palette,
-                "Accent": self.theme_cls.accent_palette,
-            }.get(self.background_palette, self.background_palette)
-        else:
-            palette = {"Primary": "Blue"}.get(
-                self.background_palette, self.background_palette
+            derived = self.theme_cls.get_palette_colors(
+                self.background_palette
             )
-        color = get_color_from_hex(colors[palette]['BASE'])
-        secondary_color = color[:]
+            # Don't fill the interned colors with those of a transition.
+            intern = self.theme_cls.transition_progress >= 1
+        else:
+            derived = palette_colors[
+                {"Primary": "Peter River"}.get(
+                    self.background_palette, self.background_palette
+                )
+            ]
+        color = derived.base
         # Check for black text (need to adjust opacity)
-        if (color[0] + color[1] + color[2]) == 0:
-            color[3] = 0.87
-            secondary_color[3] = 0.54
+        if color[0] + color[1] + color[2] == 0:
+            self.specific_text_color = with_alpha(color, 0.87, intern)
+            self.specific_secondary_text_color = with_alpha(
+                color, 0.54, intern
+            )
         else:
-            secondary_color[3] = 0.7
-        self.specific_text_color = color
-        self.specific_secondary_text_color = secondary_color
+            self.specific_text_color = color
+            self.specific_secondary_text_color = with_alpha(
+                color, 0.7, intern
+            )
 
+    @instrumented
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         if hasattr(self, "theme_cls"):
-            self.theme_cls.bind(
-                primary_palette=self._update_specific_text_color
-            )
-            self.theme_cls.bind(accent_palette=self._update_specific_text_color)
+            # The palette colors follow the theme transitions.
+            self.theme_cls.bind(primary_color=self._update_specific_text_color)
+            self.theme_cls.bind(accent_color=self._update_specific_text_color)
             self.theme_cls.bind(theme_style=self._update_specific_text_color)
         self.bind(background_palette=self._update_specific_text_color)
         self._update_specific_text_color(None, None)
@@ -0,0 +1,76 @@
+"""
+Behaviors/Elevation
+===================
+
+.. rubric:: Draws the shadow of a rectangular widget raised above the
+    content behind it.
+
+The shadow is a single :class:`~kivy.graphics.boxshadow.BoxShadow`
+instruction at the start of ``canvas.before``, offset downwards and blurred
+according to :attr:`~RectangularElevationBehavior.elevation`:
+
+.. code-block:: python
+
+    from kivy.uix.boxlayout import BoxLayout
+
+    from flatkivy.uix.behaviors import (
+        RectangularElevationBehavior,
+        SpecificBackgroundColorBehavior,
+    )
+
+    class Card(
+        RectangularElevationBehavior,
+        SpecificBackgroundColorBehavior,
+        BoxLayout,
+    ):
+        pass
+
+An elevation of `0` draws nothing.
+"""
+
+__all__ = ("RectangularElevationBehavior",)
+
+from kivy.graphics import Color
+from kivy.graphics.boxshadow import BoxShadow
+from kivy.metrics import dp
+from kivy.properties import ListProperty, NumericProperty
+
+
+class RectangularElevationBehavior(object):
+    elevation = NumericProperty(0)
+    """Height of the widget above the content behind it, in ``dp``. The
+    shadow is offset by half of it and blurred over twice of it.
+
+    :attr:`elevation` is a :class:`~kivy.properties.NumericProperty`
+    and defaults to `0`.
+    """
+
+    shadow_color = ListProperty([0, 0, 0, 0.3])
+    """Color of the shadow in ``rgba`` format.
+
+    :attr:`shadow_color` is a :class:`~kivy.properties.ListProperty`
+    and defaults to `[0, 0, 0, 0.3]`.
+    """
+
+    def __init__(self, **kwargs):
+        self._shadow_color_instruction = Color(rgba=(0, 0, 0, 0))
+        self._shadow = BoxShadow()
+        super().__init__(**kwargs)
+        self.canvas.before.insert(0, self._shadow)
+        self.canvas.before.insert(0, self._shadow_color_instruction)
+        self.fbind("pos", self._update_shadow)
+        self.fbind("size", self._update_shadow)
+        self.fbind("elevation", self._update_shadow)
+        self.fbind("shadow_color", self._update_shadow)
+        self._update_shadow()
+
+    def _update_shadow(self, *args):
+        if self.elevation <= 0:
+            self._shadow_color_instruction.rgba = (0, 0, 0, 0)
+            return
+        elevation = dp(self.elevation)
+        self._shadow_color_instruction.rgba = self.shadow_color
+        self._shadow.pos = self.pos
+        self._shadow.size = self.size
+        self._shadow.offset = (0, -elevation / 2)
+        self._shadow.blur_radius = elevation * 2
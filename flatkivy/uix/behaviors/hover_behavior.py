@@ -0,0 +1,223 @@
+"""
+Behaviors/Hover
+===============
+
+.. rubric:: Dispatches events when the mouse pointer enters or leaves a
+    widget.
+
+A widget inheriting :class:`HoverBehavior` gets the :attr:`on_enter` and
+:attr:`on_leave` events and the :attr:`~HoverBehavior.hovering` property:
+
+.. code-block:: python
+
+    from flatkivy.uix.behaviors import HoverBehavior
+    from flatkivy.uix.button import FlatButton
+
+    class HoverButton(HoverBehavior, FlatButton):
+        def on_enter(self, *args):
+            self.flat_bg_color = self.theme_cls.accent_color
+
+        def on_leave(self, *args):
+            self.flat_bg_color = self.theme_cls.primary_color
+
+The widgets do not bind :attr:`Window.mouse_pos
+<kivy.core.window.WindowBase.mouse_pos>` themselves. A single
+:class:`HoverTracker`, :data:`hover_tracker`, follows the pointer and looks
+it up in a :class:`~flatkivy.spatial_index.SpatialIndex` of the window
+bounds of the hoverable widgets, so a pointer move costs the same with ten
+or a thousand of them. Events are only dispatched to the widgets the
+pointer entered or left.
+
+The index is rebuilt after a hoverable widget, or one of its parents, is
+moved, resized or reparented, or after a parent
+:class:`~kivy.uix.scrollview.ScrollView` scrolled or
+:class:`~kivy.uix.scatter.Scatter` was transformed. Widgets the pointer now
+enters or leaves because of it are updated on the next frame, without
+waiting for the pointer to move.
+
+The bounds of a widget are clipped to the visible area of the
+:class:`~kivy.uix.stencilview.StencilView` parents, like a scroll view, so
+content scrolled out of view is not hovered.
+
+.. note:: Bounds are taken as axis aligned rectangles in window
+    coordinates: the rotation of a :class:`~kivy.uix.scatter.Scatter` is
+    not accounted for.
+"""
+
+__all__ = ("HoverBehavior", "HoverTracker", "hover_tracker")
+
+import weakref
+
+from kivy.clock import Clock
+from kivy.properties import BooleanProperty, ObjectProperty
+from kivy.uix.stencilview import StencilView
+
+from flatkivy.spatial_index import SpatialIndex
+
+MOVING_PROPERTIES = (
+    "pos",
+    "size",
+    "parent",
+    "scroll_x",
+    "scroll_y",
+    "transform",
+)
+"""Properties of a widget whose change can move its hoverable descendants
+in the window: scroll views and scatters move their content without
+changing its position."""
+
+
+class HoverTracker:
+    def __init__(self):
+        self._widgets = weakref.WeakSet()
+        self._watched = weakref.WeakSet()
+        self._hovered = weakref.WeakSet()
+        self._index = SpatialIndex()
+        self._index_dirty = True
+        self._mouse_pos = None
+        self._window = None
+        self._trigger_update = Clock.create_trigger(self._update, -1)
+
+    def register(self, widget):
+        """Starts dispatching the hover events of `widget`."""
+
+        if self._window is None:
+            from kivy.core.window import Window
+
+            self._window = Window
+            Window.fbind("mouse_pos", self._on_mouse_pos)
+            Window.fbind("on_cursor_enter", self._on_cursor_enter)
+            Window.fbind("on_cursor_leave", self._on_cursor_leave)
+        self._widgets.add(widget)
+        self._invalidate()
+
+    def unregister(self, widget):
+        self._widgets.discard(widget)
+        self._invalidate()
+
+    def hovered(self):
+        """Returns the widgets under the pointer."""
+
+        return list(self._hovered)
+
+    def _invalidate(self, *args):
+        self._index_dirty = True
+        if self._mouse_pos is not None:
+            self._trigger_update()
+
+    def _watch(self, widget):
+        if widget not in self._watched:
+            self._watched.add(widget)
+            for name in MOVING_PROPERTIES:
+                if widget.property(name, quiet=True) is not None:
+                    widget.fbind(name, self._invalidate)
+
+    def _unwatch(self, widget):
+        self._watched.discard(widget)
+        for name in MOVING_PROPERTIES:
+            if widget.property(name, quiet=True) is not None:
+                widget.funbind(name, self._invalidate)
+
+    def _rebuild(self):
+        window = self._window
+        items = []
+        watched = set()
+        for widget in list(self._widgets):
+            left, bottom, right, top = _window_rect(widget)
+            # Watching the parents keeps the window bounds of the widget
+            # up to date when a layout or a scroll view moves it.
+            node = widget
+            while node is not None and node is not window:
+                watched.add(node)
+                self._watch(node)
+                if node is not widget and isinstance(node, StencilView):
+                    clip = _window_rect(node)
+                    left, bottom = max(left, clip[0]), max(bottom, clip[1])
+                    right, top = min(right, clip[2]), min(top, clip[3])
+                parent = node.parent
+                node = None if parent is node else parent
+            if node is None or left >= right or bottom >= top:
+                continue
+            items.append((widget, left, bottom, right - left, top - bottom))
+        for node in list(self._watched):
+            if node not in watched:
+                self._unwatch(node)
+        self._index.rebuild(items)
+        self._index_dirty = False
+
+    def _on_mouse_pos(self, window, pos):
+        self._mouse_pos = pos
+        self._update()
+
+    def _on_cursor_enter(self, *args):
+        # The pointer may come back where it left, without a mouse_pos
+        # change.
+        self._on_mouse_pos(self._window, self._window.mouse_pos)
+
+    def _on_cursor_leave(self, *args):
+        self._mouse_pos = None
+        for widget in list(self._hovered):
+            self._leave(widget)
+
+    def _update(self, *args):
+        if self._mouse_pos is None:
+            return
+        if self._index_dirty:
+            self._rebuild()
+        x, y = self._mouse_pos
+        under = set(self._index.query(x, y))
+        for widget in list(self._hovered):
+            if widget not in under:
+                self._leave(widget)
+        for widget in under:
+            if widget not in self._hovered:
+                self._hovered.add(widget)
+                widget.enter_point = (x, y)
+                widget.hovering = True
+                widget.dispatch("on_enter")
+
+    def _leave(self, widget):
+        self._hovered.discard(widget)
+        widget.hovering = False
+        widget.enter_point = None
+        widget.dispatch("on_leave")
+
+
+def _window_rect(widget):
+    """Returns ``(left, bottom, right, top)`` of `widget` in the window."""
+
+    x1, y1 = widget.to_window(widget.x, widget.y)
+    x2, y2 = widget.to_window(widget.right, widget.top)
+    return min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)
+
+
+hover_tracker = HoverTracker()
+"""Shared :class:`HoverTracker` instance."""
+
+
+class HoverBehavior(object):
+    hovering = BooleanProperty(False)
+    """`True` while the mouse pointer is over the widget.
+
+    :attr:`hovering` is a :class:`~kivy.properties.BooleanProperty`
+    and defaults to `False`.
+    """
+
+    enter_point = ObjectProperty(allownone=True)
+    """Window position of the pointer when it entered the widget.
+
+    :attr:`enter_point` is a :class:`~kivy.properties.ObjectProperty`
+    and defaults to `None`.
+    """
+
+    def __init__(self, **kwargs):
+        self.register_event_type("on_enter")
+        self.register_event_type("on_leave")
+        super().__init__(**kwargs)
+        hover_tracker.register(self)
+
+    def on_enter(self):
+        """Called when the mouse pointer enters the widget."""
+
+    def on_leave(self):
+        """Called when the mouse pointer leaves the widget."""
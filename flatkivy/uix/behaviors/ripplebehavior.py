@@ -89,7 +89,7 @@ that inherits from the :class:`~RectangularRippleBehavior` class:
 """
 
 from kivy.properties import (
-    ListProperty,
+    ObjectProperty,
     NumericProperty,
     StringProperty,
     BooleanProperty,
@@ -105,6 +105,9 @@ from kivy.graphics import (
     Rectangle,
 )
 
+from flatkivy.colors import with_alpha
+from flatkivy.instrumentation import instrumented
+
 
 class CommonRipple(object):
     """Base class for ripple effect."""
@@ -120,12 +123,14 @@ class CommonRipple(object):
     and defaults to `1`.
     """
 
-    ripple_color = ListProperty()
+    ripple_color = ObjectProperty(None, allownone=True)
     """
-    Ripple color in ``rgba`` format.
+    Ripple color in ``rgba`` format. `None` uses the ripple color of the
+    theme. The property holds a tuple: assign a new color, e.g. with
+    :func:`~flatkivy.colors.with_alpha`, instead of editing it in place.
 
-    :attr:`ripple_color` is an :class:`~kivy.properties.ListProperty`
-    and defaults to `[]`.
+    :attr:`ripple_color` is an :class:`~kivy.properties.ObjectProperty`
+    and defaults to `None`.
     """
 
     ripple_alpha = NumericProperty(0.5)
@@ -212,18 +217,13 @@ class CommonRipple(object):
             self.ripple_pos = (touch.x, touch.y)
 
             if self.ripple_color:
-                pass
+                color = self.ripple_color
             elif hasattr(self, "theme_cls"):
-                self.ripple_color = self.theme_cls.ripple_color
+                color = self.theme_cls.ripple_color
             else:
                 # If no theme, set Gray 300
-                self.ripple_color = [
-                    0.8784313725490196,
-                    0.8784313725490196,
-                    0.8784313725490196,
-                    self.ripple_alpha,
-                ]
-            self.ripple_color[3] = self.ripple_alpha
+                color = (0.8784313725490196,) * 3
+            self.ripple_color = with_alpha(color, self.ripple_alpha)
 
             self.lay_canvas_instructions()
             self.finish_rad = max(self.width, self.height) * self.ripple_scale
@@ -280,7 +280,7 @@ class CommonRipple(object):
         if not self._fading_out:
             Animation.cancel_all(self, "ripple_color")
             anim = Animation(
-                ripple_color=[rc[0], rc[1], rc[2], 0.0],
+                ripple_color=with_alpha(rc, 0.0),
                 t=self.ripple_func_out,
                 duration=self.ripple_duration_out,
             )
@@ -306,6 +306,7 @@ class RectangularRippleBehavior(CommonRipple):
     and defaults to `2.75`.
     """
 
+    @instrumented
     def lay_canvas_instructions(self):
         if self._no_ripple_effect:
             return
@@ -345,6 +346,7 @@ class CircularRippleBehavior(CommonRipple):
     and defaults to `1`.
     """
 
+    @instrumented
     def lay_canvas_instructions(self):
         with self.canvas.after:
             StencilPush()
@@ -0,0 +1,83 @@
+"""
+Behaviors/Spatial Touch
+=======================
+
+.. rubric:: Routes the new touches of a layout to the children under them.
+
+Kivy hands a touch to every child of a layout, last added first, until one
+of them accepts it, and each child tests whether the touch is within its
+bounds. On a panel of hundreds of buttons, most of the work of a touch is
+those tests. :class:`SpatialTouchBehavior` keeps the children in a
+:class:`~flatkivy.spatial_index.SpatialIndex` and only dispatches
+:meth:`~kivy.uix.widget.Widget.on_touch_down` to the children containing
+the touch, in the usual order, so the cost of a touch does not grow with
+the number of children.
+
+Moves and releases are still dispatched to every child, as by any layout:
+a child reacting to a touch leaving it, like the ripple of a button being
+dragged off, keeps working.
+
+The index is rebuilt lazily, on the first touch after children were added,
+removed, moved or resized.
+
+.. note:: A child only receives the new touches within its bounds, which
+    is what buttons, labels and icons expect. Children handling touches
+    outside of themselves, like a :class:`~kivy.uix.scatter.Scatter`,
+    belong in a regular layout.
+
+.. code-block:: python
+
+    from flatkivy.uix.behaviors import SpatialTouchBehavior
+
+    class Keypad(SpatialTouchBehavior, GridLayout):
+        pass
+
+:class:`~flatkivy.uix.layout.FlatSpatialGridLayout` and
+:class:`~flatkivy.uix.layout.FlatSpatialFloatLayout` are ready to use.
+"""
+
+__all__ = ("SpatialTouchBehavior",)
+
+from flatkivy.spatial_index import SpatialIndex
+
+
+class SpatialTouchBehavior(object):
+    def __init__(self, **kwargs):
+        self._spatial_index = SpatialIndex()
+        self._spatial_index_dirty = True
+        super().__init__(**kwargs)
+
+    def add_widget(self, widget, *args, **kwargs):
+        widget.fbind("pos", self._invalidate_spatial_index)
+        widget.fbind("size", self._invalidate_spatial_index)
+        super().add_widget(widget, *args, **kwargs)
+        self._spatial_index_dirty = True
+
+    def remove_widget(self, widget, *args, **kwargs):
+        widget.funbind("pos", self._invalidate_spatial_index)
+        widget.funbind("size", self._invalidate_spatial_index)
+        super().remove_widget(widget, *args, **kwargs)
+        self._spatial_index_dirty = True
+
+    def _invalidate_spatial_index(self, *args):
+        self._spatial_index_dirty = True
+
+    def children_at(self, x, y):
+        """Returns the children containing the point `x`, `y`, topmost
+        first."""
+
+        if self._spatial_index_dirty:
+            self._spatial_index.rebuild(
+                (child, child.x, child.y, child.width, child.height)
+                for child in self.children
+            )
+            self._spatial_index_dirty = False
+        return self._spatial_index.query(x, y)
+
+    def on_touch_down(self, touch):
+        if self.disabled and self.collide_point(*touch.pos):
+            return True
+        for child in self.children_at(*touch.pos):
+            if child.dispatch("on_touch_down", touch):
+                return True
+        return False
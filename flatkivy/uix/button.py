@@ -1,5 +1,7 @@
 __all__ = (
     "FlatButton",
+    "FlatIconButton",
+    "FlatFloatingActionButton",
 )
 
 from kivy.core.window import Window
@@ -9,7 +11,6 @@ from kivy.lang import Builder
 from kivy.uix.button import Button
 from kivy.uix.image import Image
 from kivy.uix.widget import Widget
-from kivy.utils import get_color_from_hex
 from kivy.uix.floatlayout import FloatLayout
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.anchorlayout import AnchorLayout
@@ -33,13 +34,17 @@ from kivy.properties import (
     OptionProperty,
     ObjectProperty,
     DictProperty,
+    ReferenceListProperty,
 )
 
+from flatkivy.colors import intern_color, pressed_color
+from flatkivy.instrumentation import instrumented
 from flatkivy.theming import ThemableBehavior
-from flatkivy.uix.label import FlatLabel
+from flatkivy.uix.label import FlatIcon, FlatLabel
 from flatkivy.uix.behaviors import (
     SpecificBackgroundColorBehavior,
     RectangularRippleBehavior,
+    CircularRippleBehavior,
 )
 
 Builder.load_string(
@@ -83,6 +88,33 @@ Builder.load_string(
         valign: 'middle'
         halign: 'center'
         opposite_colors: root.opposite_colors
+
+<BaseRoundButton>
+    canvas:
+        Clear
+        Color:
+            rgba: self._current_button_color
+        Ellipse:
+            size: self.size
+            pos: self.pos
+    size: (dp(48), dp(48))
+
+    FlatIcon:
+        icon: root.icon
+        font_size: root.user_font_size if root.user_font_size else sp(24)
+        color:
+            root.text_color if root.text_color else \
+            ((1, 1, 1, 1) if root.theme_cls.theme_style == "Dark" \
+            else (0, 0, 0, 0.87))
+        text_size: self.size
+        halign: 'center'
+        valign: 'middle'
+        disabled: root.disabled
+
+<FlatFloatingActionButton>
+    size: (dp(56), dp(56))
+    flat_bg_color: self.theme_cls.primary_color
+    text_color: (1, 1, 1, 1)
     """
 )
 
@@ -118,10 +150,12 @@ class BaseButton(
     and defaults to `None`.
     """
 
-    text_color = ListProperty(None, allownone=True)
+    text_color = ObjectProperty(None, allownone=True)
     """
-    Text color in ``rgba`` format.
-    :attr:`text_color` is an :class:`~kivy.properties.ListProperty`
+    Text color in ``rgba`` format. The property holds a tuple: assign a new
+    color instead of editing it in place.
+
+    :attr:`text_color` is an :class:`~kivy.properties.ObjectProperty`
     and defaults to `None`.
     """
 
@@ -150,8 +184,9 @@ class BaseButton(
 
     _flat_bg_color_down = ListProperty(None, allownone=True)
     _flat_bg_color_disabled = ListProperty(None, allownone=True)
-    _current_button_color = ListProperty([0.0, 0.0, 0.0, 0.0])
+    _current_button_color = ObjectProperty(intern_color((0.0, 0.0, 0.0, 0.0)))
 
+    @instrumented
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         Clock.schedule_once(self._finish_init)
@@ -162,11 +197,14 @@ class BaseButton(
     def on_flat_bg_color(self, instance, value):
         self._update_color()
 
+    @instrumented
     def _update_color(self):
         if not self.disabled:
-            self._current_button_color = self.flat_bg_color
+            self._current_button_color = intern_color(self.flat_bg_color)
         else:
-            self._current_button_color = self.flat_bg_color_disabled
+            self._current_button_color = intern_color(
+                self.flat_bg_color_disabled
+            )
 
     def _call_get_bg_color_down(self):
         return self._get_flat_bg_color_down()
@@ -214,9 +252,11 @@ class BaseButton(
 
     def on_disabled(self, instance, value):
         if self.disabled:
-            self._current_button_color = self.flat_bg_color_disabled
+            self._current_button_color = intern_color(
+                self.flat_bg_color_disabled
+            )
         else:
-            self._current_button_color = self.flat_bg_color
+            self._current_button_color = intern_color(self.flat_bg_color)
 
 
 class BaseFlatButton(BaseButton):
@@ -225,29 +265,19 @@ class BaseFlatButton(BaseButton):
     Enforces the recommended down/disabled colors for flat buttons
     """
 
+    @instrumented
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.flat_bg_color = (0.0, 0.0, 0.0, 0.0)
 
     def _get_flat_bg_color_down(self):
-        if self.theme_cls.theme_style == "Dark":
-            c = get_color_from_hex("cccccc")
-            c[3] = 0.25
-        else:
-            c = get_color_from_hex("999999")
-            c[3] = 0.4
-        return c
+        return self.theme_cls.style_colors.flat_pressed
 
     def _get_flat_bg_color_disabled(self):
         bg_c = self.flat_bg_color
         if bg_c[3] == 0:  # transparent background
-            c = bg_c
-        else:
-            if self.theme_cls.theme_style == "Dark":
-                c = (1.0, 1.0, 1.0, 0.12)
-            else:
-                c = (0.0, 0.0, 0.0, 0.12)
-        return c
+            return bg_c
+        return self.theme_cls.style_colors.disabled
 
 
 class BasePressedButton(BaseButton):
@@ -267,7 +297,8 @@ class BasePressedButton(BaseButton):
             return False
         else:
             self.fade_bg = Animation(
-                duration=0.5, _current_button_color=self.flat_bg_color_down
+                duration=0.5,
+                _current_button_color=intern_color(self.flat_bg_color_down),
             )
             self.fade_bg.start(self)
             return super().on_touch_down(touch)
@@ -276,7 +307,8 @@ class BasePressedButton(BaseButton):
         if touch.grab_current is self:
             self.fade_bg.stop_property(self, "_current_button_color")
             Animation(
-                duration=0.05, _current_button_color=self.flat_bg_color
+                duration=0.05,
+                _current_button_color=intern_color(self.flat_bg_color),
             ).start(self)
         return super().on_touch_up(touch)
 
@@ -291,6 +323,11 @@ class BaseRectangularButton(RectangularRippleBehavior, BaseButton):
     width = BoundedNumericProperty(
         88, min=88, max=None, errorhandler=lambda x: 88
     )
+
+    # `size` refers to the `width` property of Widget, it is redefined to
+    # refer to the bounded one.
+    size = ReferenceListProperty(width, Widget.height)
+
     text = StringProperty("")
     """Button text.
     :attr:`text` is an :class:`~kivy.properties.StringProperty`
@@ -319,3 +356,33 @@ class BaseRectangularButton(RectangularRippleBehavior, BaseButton):
 
 class FlatButton(BaseRectangularButton, BaseFlatButton, BasePressedButton):
     pass
+
+
+class BaseRoundButton(CircularRippleBehavior, BaseButton):
+    """
+    Abstract base class for all round buttons, drawing an icon of
+    :mod:`flatkivy.icon_packs` with a :class:`~flatkivy.uix.label.FlatIcon`.
+    """
+
+    icon = StringProperty("android")
+    """
+    Button icon, see :attr:`flatkivy.uix.label.FlatIcon.icon`.
+    :attr:`icon` is an :class:`~kivy.properties.StringProperty`
+    and defaults to `'android'`.
+    """
+
+
+class FlatIconButton(BaseRoundButton, BaseFlatButton, BasePressedButton):
+    pass
+
+
+class FlatFloatingActionButton(BaseRoundButton, BasePressedButton):
+    def _get_flat_bg_color_down(self):
+        if self._flat_bg_color_down:
+            return self._flat_bg_color_down
+        return pressed_color(tuple(self.flat_bg_color))
+
+    def _get_flat_bg_color_disabled(self):
+        if self._flat_bg_color_disabled:
+            return self._flat_bg_color_disabled
+        return self.theme_cls.style_colors.disabled
@@ -1,9 +1,14 @@
 __all__ = (
     "FlatLabel",
+    "FlatStaticLabel",
 )
 
+from collections import OrderedDict
+from math import floor
+
+from kivy.app import App
 from kivy.lang import Builder
-from kivy.metrics import sp
+from kivy.logger import Logger
 from kivy.properties import (
     OptionProperty,
     ListProperty,
@@ -11,26 +16,48 @@ from kivy.properties import (
     StringProperty,
     AliasProperty,
     NumericProperty,
+    ObjectProperty,
 )
+from kivy.core.text import Label as CoreLabel
 from kivy.uix.label import Label
-from kivy.uix.floatlayout import FloatLayout
 from kivy.uix.scatter import Scatter
+from kivy.uix.widget import Widget
 from kivy.graphics.svg import Svg
-from kivy.graphics import Scale
+from kivy.clock import Clock
+from kivy.graphics import (
+    Color,
+    InstructionGroup,
+    MatrixInstruction,
+    PopMatrix,
+    PushMatrix,
+    Rectangle,
+    Scale,
+)
+from kivy.graphics.transformation import Matrix
 
 from flatkivy.font_definitions import theme_font_styles
 from flatkivy.theming import ThemableBehavior
-from flatkivy.icon_definitions import flat_icons
+from flatkivy.icon_lod import (
+    BUCKETS,
+    LOD_BITMAP,
+    LOD_VECTOR,
+    icon_lod,
+    size_bucket,
+)
+from flatkivy.icon_packs import icon_registry
+from flatkivy.instrumentation import instrumented
+from flatkivy.svg_cache import svg_cache
 
 Builder.load_string(
     """
-#:import flat_icons flatkivy.icon_definitions.flat_icons    
-    
 <FlatLabel>
     disabled_color: [1,1,1,1]
     text_size: self.width, None
     pos_hint: {"center_x": .5, "center_y": .5}
     
+<FlatStaticLabel>
+    pos_hint: {"center_x": .5, "center_y": .5}
+
 <FlatIcon>:
     font_style: "Icon"
     text: self.code
@@ -41,15 +68,148 @@ Builder.load_string(
             pos:  self.pos
             size: self.size
             
-<FlatColorIcon>  
+<FlatColorIcon>
+    pos_hint: {"center_x": .5, "center_y": .5}
 
 <FlatSvgIcon>:
     do_rotation: False
 
+<FlatSvgImage>:
+    pos_hint: {"center_x": .5, "center_y": .5}
+
 """
 )
 
 
+LOCALE_UPPER = {
+    "az": {ord("i"): "\u0130"},
+    "tr": {ord("i"): "\u0130"},
+}
+"""Characters capitalized differently than by :meth:`str.upper`, by
+language."""
+
+
+def upper_text(text, locale=None):
+    """Returns `text` capitalized with the rules of the language `locale`,
+    either a language code (`'tr'`) or a locale name (`'tr_TR'`)."""
+
+    if locale:
+        table = LOCALE_UPPER.get(locale.split("_")[0].lower())
+        if table:
+            text = text.translate(table)
+    return text.upper()
+
+
+MAX_GLYPH_EXTENTS = 4096
+"""Number of character and character pair extents kept for
+:class:`SpacedCoreLabel`, the least recently used ones are dropped first."""
+
+
+class SpacedCoreLabel(CoreLabel):
+    """
+    Core label adding :attr:`letter_spacing` pixels between characters.
+
+    The extents of the characters, and of the pairs of characters to keep
+    their kerning, are measured once per font and size and shared by every
+    label, so laying out spaced text does not measure the text again.
+    Lines are rendered into the single texture of the label in runs: the
+    glyphs are drawn at whole pixels, so the characters the spacing moves
+    by the same number of pixels are drawn by one call to the text
+    provider, with its own kerning. With no spacing it behaves as the core
+    label it extends.
+    """
+
+    letter_spacing = 0
+
+    _advances = (None, None)
+
+    def _get_extent(self, chars):
+        options = self.options
+        key = (
+            options["font_name_r"],
+            options["font_size"],
+            options["bold"],
+            options["italic"],
+            chars,
+        )
+        size = _glyph_extents.get(key)
+        if size is None:
+            size = _glyph_extents[key] = super().get_extents(chars)
+            while len(_glyph_extents) > MAX_GLYPH_EXTENTS:
+                _glyph_extents.popitem(last=False)
+        else:
+            _glyph_extents.move_to_end(key)
+        return size
+
+    def _get_advances(self, text):
+        """Returns the width of every character of `text`, up to the next
+        one: a pair is narrower than its two characters when kerned."""
+
+        options = self.options
+        key = (
+            options["font_name_r"],
+            options["font_size"],
+            options["bold"],
+            options["italic"],
+            text,
+        )
+        # A line is measured by the layout and then rendered: the advances
+        # of the last one are kept for the rendering.
+        last_key, advances = self._advances
+        if last_key == key:
+            return advances
+        advances = []
+        last = len(text) - 1
+        for index, char in enumerate(text):
+            if index < last:
+                following = text[index + 1]
+                advances.append(
+                    self._get_extent(char + following)[0]
+                    - self._get_extent(following)[0]
+                )
+            else:
+                advances.append(self._get_extent(char)[0])
+        self._advances = (key, advances)
+        return advances
+
+    def get_extents(self, text):
+        spacing = self.letter_spacing
+        if not spacing or not text:
+            return super().get_extents(text)
+        if len(text) == 1:
+            return self._get_extent(text)
+        height = max(self._get_extent(char)[1] for char in text)
+        width = sum(self._get_advances(text)) + spacing * (len(text) - 1)
+        return width, height
+
+    def get_cached_extents(self):
+        if self.letter_spacing:
+            return self.get_extents
+        return super().get_cached_extents()
+
+    def _render_text(self, text, x, y):
+        spacing = self.letter_spacing
+        if not spacing or len(text) < 2:
+            return super()._render_text(text, x, y)
+        start = 0
+        start_x = glyph_x = int(x)
+        run_shift = 0
+        for index, advance in enumerate(self._get_advances(text)):
+            shift = floor(index * spacing)
+            if shift != run_shift:
+                self._render_run(text[start:index], start_x, y)
+                start, start_x, run_shift = index, glyph_x + shift, shift
+            glyph_x += advance
+        self._render_run(text[start:], start_x, y)
+
+    def _render_run(self, run, x, y):
+        if not run.isspace():
+            super()._render_text(run, x, y)
+
+
+_glyph_extents = OrderedDict()
+
+
 class FlatLabel(ThemableBehavior, Label):
     font_style = OptionProperty("Body", options=theme_font_styles)
     """
@@ -64,9 +224,18 @@ class FlatLabel(ThemableBehavior, Label):
 
     _capitalizing = BooleanProperty(False)
 
+    casing_locale = StringProperty(None, allownone=True)
+    """
+    Language code, like `'tr'`, of the rules used to capitalize the text of
+    font styles in caps. Languages without specific rules, and `None`, use
+    :meth:`str.upper`.
+    :attr:`casing_locale` is an :class:`~kivy.properties.StringProperty`
+    and defaults to `None`.
+    """
+
     def _get_text(self):
         if self._capitalizing:
-            return self._text.upper()
+            return upper_text(self._text, self.casing_locale)
         return self._text
 
     def _set_text(self, value):
@@ -74,8 +243,15 @@ class FlatLabel(ThemableBehavior, Label):
 
     _text = StringProperty()
 
-    text = AliasProperty(_get_text, _set_text, bind=["_text", "_capitalizing"])
-    """Text of the label."""
+    text = AliasProperty(
+        _get_text,
+        _set_text,
+        bind=["_text", "_capitalizing", "casing_locale"],
+        cache=True,
+    )
+    """Text of the label, capitalized when the font style is in caps. The
+    capitalized text is computed once per change of the text, of the font
+    style or of :attr:`casing_locale`."""
 
     # theme_text_color = OptionProperty(
     #     None,
@@ -97,18 +273,29 @@ class FlatLabel(ThemableBehavior, Label):
     and defaults to `None`.
     """
 
-    text_color = ListProperty(None, allownone=True)
-    """Label text color in ``rgba`` format.
-    :attr:`text_color` is an :class:`~kivy.properties.ListProperty`
+    text_color = ObjectProperty(None, allownone=True)
+    """Label text color in ``rgba`` format. The property holds a tuple:
+    assign a new color instead of editing it in place.
+
+    :attr:`text_color` is an :class:`~kivy.properties.ObjectProperty`
     and defaults to `None`.
     """
 
     parent_background = ListProperty(None, allownone=True)
 
+    letter_spacing = NumericProperty(0)
+    """
+    Pixels added between characters, set from the font style. Not applied
+    to markup text.
+    :attr:`letter_spacing` is an :class:`~kivy.properties.NumericProperty`
+    and defaults to `0`.
+    """
+
     _currently_bound_property = {}
 
     can_capitalize = BooleanProperty(True)
 
+    @instrumented
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.theme_text_color = OptionProperty(
@@ -131,17 +318,43 @@ class FlatLabel(ThemableBehavior, Label):
         self.update_font_style()
         self.on_opposite_colors(None, self.opposite_colors)
 
-    def update_font_style(self, *args):
-        font_info = self.theme_cls.font_styles[self.font_style]
-        self.font_name = font_info[0]
-        self.font_size = sp(font_info[1])
-        if font_info[2] and self.can_capitalize:
-            self._capitalizing = True
-        else:
-            self._capitalizing = False
-        # TODO: Add letter spacing change
-        # self.letter_spacing = font_info[3]
+    _applied_font_style = None
 
+    @instrumented
+    def update_font_style(self, *args):
+        style = self.theme_cls.font_style_table[self.font_style]
+        capitalizing = style.capitalize and self.can_capitalize
+        if (
+            style is self._applied_font_style
+            and capitalizing == self._capitalizing
+        ):
+            return
+        self._applied_font_style = style
+        self.font_name = style.font_name
+        self.font_size = style.font_size
+        self._capitalizing = capitalizing
+        self.letter_spacing = style.letter_spacing
+
+    def _create_label(self):
+        if self.markup:
+            super()._create_label()
+            return
+        if isinstance(self._label, SpacedCoreLabel):
+            return
+        options = {name: getattr(self, name) for name in self._font_properties}
+        options["usersize"] = self.text_size
+        if self.disabled:
+            options["color"] = self.disabled_color
+            options["outline_color"] = self.disabled_outline_color
+        self._label = SpacedCoreLabel(**options)
+        self._label.letter_spacing = self.letter_spacing
+
+    def on_letter_spacing(self, instance, value):
+        if isinstance(self._label, SpacedCoreLabel):
+            self._label.letter_spacing = value
+            self._trigger_texture()
+
+    @instrumented
     def on_theme_text_color(self, instance, value):
         t = self.theme_cls
         op = self.opposite_colors
@@ -178,15 +391,151 @@ class FlatLabel(ThemableBehavior, Label):
         self.on_theme_text_color(self, self.theme_text_color)
 
 
+class FlatStaticLabel(Widget):
+    """
+    Lightweight single line label for static captions.
+
+    It is a plain :class:`~kivy.uix.widget.Widget` drawing one
+    :class:`~kivy.graphics.Rectangle`, textured with the white texture of its
+    text and tinted by a :class:`~kivy.graphics.Color`. The texture is
+    rendered again only when the text or the font changes, and the previous
+    one is released. It has none of the
+    :class:`~kivy.uix.label.Label` and
+    :class:`~flatkivy.theming.ThemableBehavior` properties, and binds
+    nothing on the :class:`~flatkivy.theming.ThemeManager`: the font and
+    the color are resolved from the theme when the label is created, then
+    the theme manager refreshes all the static labels at once through
+    :meth:`~flatkivy.theming.ThemeManager.broadcast_static` when its style,
+    palette or font styles change.
+
+    Text is neither wrapped nor shortened, use :class:`FlatLabel` for that.
+    """
+
+    text = StringProperty()
+    """Text of the label, drawn centered in the widget.
+    :attr:`text` is an :class:`~kivy.properties.StringProperty`
+    and defaults to `''`.
+    """
+
+    font_style = OptionProperty("Body", options=theme_font_styles)
+    """
+    Label font style, see :attr:`FlatLabel.font_style`.
+    :attr:`font_style` is an :class:`~kivy.properties.OptionProperty`
+    and defaults to `'Body'`.
+    """
+
+    theme_text_color = OptionProperty(
+        "Primary", options=["Primary", "Secondary", "Custom"]
+    )
+    """
+    Label color scheme name. `'Custom'` uses :attr:`color`.
+    :attr:`theme_text_color` is an :class:`~kivy.properties.OptionProperty`
+    and defaults to `'Primary'`.
+    """
+
+    color = ListProperty([0, 0, 0, 1])
+    """Text color in ``rgba`` format when :attr:`theme_text_color` is
+    `'Custom'`.
+    :attr:`color` is an :class:`~kivy.properties.ListProperty`
+    and defaults to `[0, 0, 0, 1]`.
+    """
+
+    texture_size = ListProperty([0, 0])
+    """Size of the text, readonly.
+    :attr:`texture_size` is an :class:`~kivy.properties.ListProperty`
+    and defaults to `[0, 0]`.
+    """
+
+    _font = None
+    _rendered = None
+
+    @instrumented
+    def __init__(self, **kwargs):
+        self._color_instruction = Color(rgba=self.color)
+        self._rect = Rectangle(size=(0, 0))
+        super().__init__(**kwargs)
+        self.canvas.add(self._color_instruction)
+        self.canvas.add(self._rect)
+        self.fbind("pos", self._update_rect)
+        self.fbind("size", self._update_rect)
+        theme_cls = getattr(App.get_running_app(), "theme_cls", None)
+        if theme_cls is None:
+            raise ValueError(
+                "FlatKivy: a FlatApp must be running before creating a "
+                "FlatStaticLabel"
+            )
+        theme_cls.register_static(self)
+        self.refresh_theme(theme_cls)
+
+    def refresh_theme(self, theme_cls):
+        """Resolves the font and the color from `theme_cls` again."""
+
+        self._font = theme_cls.font_style_table[self.font_style]
+        if self.theme_text_color == "Custom":
+            self._color_instruction.rgba = self.color
+        else:
+            self._color_instruction.rgba = (
+                theme_cls.text_color
+                if self.theme_text_color == "Primary"
+                else theme_cls.secondary_text_color
+            )
+        self._update_texture()
+
+    def on_text(self, instance, value):
+        if self._font is not None:
+            self._update_texture()
+
+    def on_font_style(self, instance, value):
+        if self._font is not None:
+            self.refresh_theme(App.get_running_app().theme_cls)
+
+    def on_theme_text_color(self, instance, value):
+        self.on_font_style(instance, self.font_style)
+
+    def on_color(self, instance, value):
+        if self.theme_text_color == "Custom":
+            self._color_instruction.rgba = value
+
+    def _update_texture(self):
+        font_name, font_size, capitalize, _ = self._font
+        text = self.text.upper() if capitalize else self.text
+        rendered = (font_name, font_size, text)
+        if rendered == self._rendered:
+            return
+        self._rendered = rendered
+        if text:
+            label = CoreLabel(
+                text=text, font_name=font_name, font_size=font_size
+            )
+            label.refresh()
+            texture = label.texture
+            self._rect.texture = texture
+            self._rect.size = texture.size
+        else:
+            self._rect.texture = None
+            self._rect.size = (0, 0)
+        self.texture_size = list(self._rect.size)
+        self._update_rect()
+
+    def _update_rect(self, *args):
+        self._rect.pos = (
+            int(self.center_x - self._rect.size[0] / 2.0),
+            int(self.center_y - self._rect.size[1] / 2.0),
+        )
+
+
 class FlatIcon(FlatLabel):
     icon = StringProperty("android")
-    code = StringProperty(u"\uE900")
     """
-    Label icon name.
+    Label icon name, either bare (``"App-Amethyst"``) or qualified with the
+    icon pack (``"glyphicons:triangle-up"``).
+    See :mod:`flatkivy.icon_packs`.
     :attr:`icon` is an :class:`~kivy.properties.StringProperty`
     and defaults to `'android'`.
     """
 
+    code = StringProperty(u"\uE900")
+
     source = StringProperty(None, allownone=True)
     """
     Path to icon.
@@ -194,47 +543,376 @@ class FlatIcon(FlatLabel):
     and defaults to `None`.
     """
 
-    text_color = ListProperty(None, allownone=True)
-    """Label text color in ``rgba`` format.
-    :attr:`text_color` is an :class:`~kivy.properties.ListProperty`
+    text_color = ObjectProperty(None, allownone=True)
+    """Label text color in ``rgba`` format. The property holds a tuple:
+    assign a new color instead of editing it in place.
+
+    :attr:`text_color` is an :class:`~kivy.properties.ObjectProperty`
     and defaults to `None`.
     """
 
+    _icon_font_name = None
+
+    def on_icon(self, instance, value):
+        resolved = icon_registry.resolve(value)
+        if resolved is None:
+            Logger.warning(f"FlatKivy: unknown icon '{value}'")
+            return
+        pack, layers = resolved
+        self._set_icon_font(pack.register_font())
+        self.code = layers[0][1]
+
+    def _set_icon_font(self, font_name):
+        self._icon_font_name = font_name
+        self.font_name = font_name
+
+    @instrumented
+    def update_font_style(self, *args):
+        super().update_font_style(*args)
+        if self._icon_font_name:
+            self.font_name = self._icon_font_name
+
+
+MAX_GLYPH_TEXTURES = 512
+"""Number of glyph textures kept by :func:`get_glyph_texture`, the least
+recently used ones are dropped first."""
+
+
+def get_glyph_texture(font_name, font_size, code):
+    """Returns the white texture of the glyph `code`, rendered once per
+    ``(font_name, font_size, code)`` and shared by every icon drawing it.
+    Glyphs are tinted by the :class:`~kivy.graphics.Color` preceding them.
+    """
+
+    key = (font_name, font_size, code)
+    texture = _glyph_textures.get(key)
+    if texture is None:
+        label = CoreLabel(text=code, font_name=font_name, font_size=font_size)
+        label.refresh()
+        texture = _glyph_textures[key] = label.texture
+        while len(_glyph_textures) > MAX_GLYPH_TEXTURES:
+            _glyph_textures.popitem(last=False)
+    else:
+        _glyph_textures.move_to_end(key)
+    return texture
+
+
+_glyph_textures = OrderedDict()
+
+
+class FlatColorIcon(ThemableBehavior, Widget):
+    """
+    Multi color icon drawn by a single widget.
+
+    Every layer of the icon is a :class:`~kivy.graphics.Color` and
+    :class:`~kivy.graphics.Rectangle` pair on the widget canvas, textured
+    with the shared glyph texture from :func:`get_glyph_texture`. Changing
+    :attr:`layer_colors` only updates the ``Color`` instructions.
+    """
 
-class FlatColorIcon(FlatLabel, FloatLayout):
     icon = StringProperty("android")
+    """
+    Icon name, bare or qualified with the icon pack.
+    :attr:`icon` is an :class:`~kivy.properties.StringProperty`
+    and defaults to `'android'`.
+    """
 
+    font_size = NumericProperty(None, allownone=True)
+    """
+    Glyph size in pixels. ``None`` uses the size of the ``"Icon"`` font
+    style of the theme.
+    :attr:`font_size` is an :class:`~kivy.properties.NumericProperty`
+    and defaults to `None`.
+    """
+
+    layer_colors = ListProperty()
+    """
+    ``rgba`` color of every layer. Filled with the colors of the icon
+    definition whenever :attr:`icon` changes.
+    :attr:`layer_colors` is an :class:`~kivy.properties.ListProperty`
+    and defaults to `[]`.
+    """
+
+    _layers = None
+
+    @instrumented
     def __init__(self, **kwargs):
-        super(FlatColorIcon, self).__init__(**kwargs)
-        self.font_name = 'Icon'
-        icon_stack = flat_icons[self.icon]
-        for layer in icon_stack:
-            color = layer[0]
-            code = layer[1]
-            icon_layer = FlatIcon(code=code)
-            icon_layer.theme_text_color = 'Custom'
-            icon_layer.text_color = color
-            self.add_widget(icon_layer)
-
-
-class FlatSvgIcon(FlatLabel, Scatter):
+        self._color_instructions = []
+        self._rect_instructions = []
+        self._font_name = None
+        self._codes = []
+        super().__init__(**kwargs)
+        self._layers = InstructionGroup()
+        self.canvas.add(self._layers)
+        self.bind(pos=self._update_rects, size=self._update_rects)
+        self._build_layers()
+
+    def on_icon(self, instance, value):
+        if self._layers is not None:
+            self._build_layers()
+
+    def on_font_size(self, instance, value):
+        if self._codes:
+            self._update_textures()
+
+    def on_layer_colors(self, instance, value):
+        for instruction, color in zip(self._color_instructions, value):
+            instruction.rgba = color
+
+    def set_layer_color(self, index, color):
+        """Changes the color of a single layer."""
+
+        self.layer_colors[index] = color
+
+    def _get_font_size(self):
+        if self.font_size is not None:
+            return self.font_size
+        return self.theme_cls.font_style_table["Icon"].font_size
+
+    def _build_layers(self):
+        self._layers.clear()
+        self._color_instructions = []
+        self._rect_instructions = []
+        self._codes = []
+        resolved = icon_registry.resolve(self.icon)
+        if resolved is None:
+            Logger.warning(f"FlatKivy: unknown icon '{self.icon}'")
+            self.layer_colors = []
+            return
+        pack, layers = resolved
+        self._font_name = pack.register_font()
+        colors = []
+        for color, code in layers:
+            instruction = Color(rgba=color)
+            rect = Rectangle()
+            self._layers.add(instruction)
+            self._layers.add(rect)
+            self._color_instructions.append(instruction)
+            self._rect_instructions.append(rect)
+            self._codes.append(code)
+            colors.append(color)
+        self.layer_colors = colors
+        self._update_textures()
+
+    def _update_textures(self):
+        font_size = self._get_font_size()
+        for rect, code in zip(self._rect_instructions, self._codes):
+            texture = get_glyph_texture(self._font_name, font_size, code)
+            rect.texture = texture
+            rect.size = texture.size
+        self._update_rects()
+
+    def _update_rects(self, *args):
+        for rect in self._rect_instructions:
+            rect.pos = (
+                int(self.center_x - rect.size[0] / 2.0),
+                int(self.center_y - rect.size[1] / 2.0),
+            )
+
+
+class CommonSvgIcon(object):
+    """Loading and level of detail of the SVG icon widgets.
+
+    Subclasses create the canvas in :meth:`_build_canvas` and place the
+    artwork, drawn at its own size from the origin, in
+    :meth:`_update_transform`.
+    """
+
     filename = StringProperty(None)
-    """Filename that includes the path to your SVG icon.
+    """Filename that includes the path to your SVG icon. Files compiled by
+    ``flatkivy/tools/compile_svg_meshes.py`` are loaded from their mesh,
+    the compiled ``.fkmesh`` file can also be given directly.
     :attr:`filename` is an :class:`~kivy.properties.StringProperty`
     and defaults to `None`.
     """
 
+    lod = OptionProperty("auto", options=["auto", LOD_BITMAP, LOD_VECTOR])
+    """
+    How the icon is drawn. `'auto'` lets :data:`~flatkivy.icon_lod.icon_lod`
+    pick a cached bitmap for small icons and the vector paths for large
+    ones, see :mod:`flatkivy.icon_lod`.
+    Available options are: `'auto'`, `'bitmap'`, `'vector'`.
+    :attr:`lod` is an :class:`~kivy.properties.OptionProperty`
+    and defaults to `'auto'`.
+    """
+
+    async_load = BooleanProperty(True)
+    """
+    Tessellate files missing from :data:`~flatkivy.svg_cache.svg_cache` on
+    a worker thread, showing a placeholder meanwhile. Only read at
+    construction.
+    :attr:`async_load` is an :class:`~kivy.properties.BooleanProperty`
+    and defaults to `True`.
+    """
+
+    placeholder_color = ListProperty([0, 0, 0, 0.12])
+    """
+    Color of the placeholder drawn while the file is loading.
+    :attr:`placeholder_color` is an :class:`~kivy.properties.ListProperty`
+    and defaults to `[0, 0, 0, 0.12]`.
+    """
+
+    @instrumented
     def __init__(self, **kwargs):
-        super(FlatSvgIcon, self).__init__(**kwargs)
+        super(CommonSvgIcon, self).__init__(**kwargs)
+        self._lod_group = InstructionGroup()
+        self._build_canvas()
+        self.svg = None
+        """:class:`~kivy.graphics.svg.Svg` of files :mod:`flatkivy.svg_mesh`
+        does not support, ``None`` otherwise."""
+        self._svg_data = None
+        self._svg_size = None
+        self._current_lod = None
+        self._placeholder = None
+        self.size_hint = (None, None)
+        self.bind(lod=self._update_lod)
+        if svg_cache.is_ready(self.filename) or not self.async_load:
+            self._on_svg_loaded(svg_cache.load(self.filename))
+        else:
+            self._size_at_request = tuple(self.size)
+            self._placeholder = Rectangle(pos=(0, 0), size=self.size)
+            self._lod_group.add(Color(rgba=self.placeholder_color))
+            self._lod_group.add(self._placeholder)
+            svg_cache.request(self.filename, self._on_svg_loaded)
+
+    def _build_canvas(self):
+        pass
+
+    def _update_transform(self, *args):
+        pass
+
+    def _lod_pixels(self):
+        """Size in pixels the icon is shown at."""
+
+        return max(self.size)
+
+    def _on_svg_loaded(self, data):
+        self._svg_data = data
+        if data is None:
+            self.svg = Svg(self.filename)
+            self._svg_size = (self.svg.width, self.svg.height)
+        else:
+            self._svg_size = data.size
+        self._placeholder = None
+        self._lod_group.clear()
+        keep_size = getattr(self, "_size_at_request", None)
+        if keep_size is None or keep_size == tuple(self.size):
+            self.size = self._svg_size
+        self._update_transform()
+
+    def _update_lod(self, *args):
+        if self._svg_size is None:
+            return
+        pixels = self._lod_pixels()
+        if self.lod == "auto":
+            lod, bucket = icon_lod.select(pixels)
+        elif self.lod == LOD_BITMAP:
+            lod, bucket = LOD_BITMAP, size_bucket(pixels) or BUCKETS[-1]
+        else:
+            lod, bucket = LOD_VECTOR, None
+        if (lod, bucket) == self._current_lod:
+            return
+        self._current_lod = (lod, bucket)
+        self._lod_group.clear()
+        if lod == LOD_BITMAP:
+            texture = icon_lod.get_bitmap(
+                svg_cache.key(self.filename),
+                bucket,
+                self._svg_size,
+                self._bitmap_instructions,
+            )
+            # The bitmap holds the colors of the icon: draw it untinted by
+            # the Color last set on the parent canvas.
+            self._lod_group.add(Color(1, 1, 1, 1))
+            self._lod_group.add(
+                Rectangle(texture=texture, pos=(0, 0), size=self._svg_size)
+            )
+        else:
+            self._lod_group.add(self._vector_instructions())
+
+    def _vector_instructions(self):
+        if self._svg_data is not None:
+            return self._svg_data.instructions()
+        if self.svg is None:
+            self.svg = Svg(self.filename)
+        return self.svg
+
+    def _bitmap_instructions(self):
+        # The bitmap cache keeps what it is given, so never hand it the
+        # Svg drawn by this widget.
+        if self._svg_data is not None:
+            return self._svg_data.instructions()
+        return Svg(self.filename)
+
+
+class FlatSvgIcon(CommonSvgIcon, FlatLabel, Scatter):
+    """SVG icon that can be moved and scaled by touch, see
+    :class:`FlatSvgImage` for icons that are only displayed."""
+
+    def _build_canvas(self):
+        self._scale_xyz = (1., 1., 1.)
         with self.canvas:
             self._scale = Scale(1.)
-            self.svg = Svg(self.filename)
-        self.size = self.svg.width, self.svg.height
-        self.size_hint = (None, None)
-        self.bind(size=self._do_scale)
+        self.canvas.add(self._lod_group)
+        self.bind(size=self._update_transform, scale=self._update_lod)
+
+    def _lod_pixels(self):
+        return max(self.size) * self.scale
+
+    def _update_transform(self, *args):
+        if self._svg_size is None:
+            return
+        svg_width, svg_height = self._svg_size
+        xyz = (self.width / svg_width, self.height / svg_height, 1.)
+        if xyz != self._scale_xyz:
+            self._scale_xyz = xyz
+            self._scale.xyz = xyz
+        self._update_lod()
+
+
+class FlatSvgImage(CommonSvgIcon, Widget):
+    """Display only SVG icon.
+
+    Unlike :class:`FlatSvgIcon` it is neither a label nor a
+    :class:`~kivy.uix.scatter.Scatter`: touches are not transformed and the
+    artwork is placed by a single :class:`~kivy.graphics.MatrixInstruction`.
+    Changes of :attr:`pos` and :attr:`size` are coalesced into one update
+    per frame, and the matrix is only written when it changes, so layouts
+    animating the icon do not rebuild its transform several times a frame.
+    """
 
-    def _do_scale(self, *args):
-        if [self.svg.width, self.svg.height] != self.size:
-            self._scale.xyz = ( (self.width / self.svg.width),
-                                (self.height / self.svg.height),
-                              1)
\ No newline at end of file
+    def _build_canvas(self):
+        self._transform = None
+        with self.canvas:
+            PushMatrix()
+            self._matrix = MatrixInstruction()
+        self.canvas.add(self._lod_group)
+        self.canvas.add(PopMatrix())
+        self._trigger_transform = Clock.create_trigger(
+            self._update_transform, -1
+        )
+        self.bind(pos=self._trigger_transform, size=self._trigger_transform)
+        self._trigger_transform()
+
+    def _update_transform(self, *args):
+        if self._svg_size is None:
+            scale_x = scale_y = 1.
+            if self._placeholder is not None:
+                self._placeholder.size = self.size
+        else:
+            scale_x = self.width / self._svg_size[0]
+            scale_y = self.height / self._svg_size[1]
+        transform = (self.x, self.y, scale_x, scale_y)
+        if transform != self._transform:
+            self._transform = transform
+            matrix = Matrix()
+            matrix.set(
+                flat=[
+                    scale_x, 0., 0., 0.,
+                    0., scale_y, 0., 0.,
+                    0., 0., 1., 0.,
+                    self.x, self.y, 0., 1.,
+                ]
+            )
+            self._matrix.matrix = matrix
+        self._update_lod()
@@ -0,0 +1,35 @@
+"""
+Components/Layout
+=================
+
+Layouts dispatching touches through
+:class:`~flatkivy.uix.behaviors.SpatialTouchBehavior`: a new touch only
+reaches the children under it, so panels of hundreds of buttons, like a
+keypad, answer a touch as fast as a panel of a few.
+
+.. code-block:: kv
+
+    FlatSpatialGridLayout:
+        cols: 20
+
+        FlatButton:
+            text: "1"
+        ...
+"""
+
+__all__ = ("FlatSpatialFloatLayout", "FlatSpatialGridLayout")
+
+from kivy.uix.floatlayout import FloatLayout
+from kivy.uix.gridlayout import GridLayout
+
+from flatkivy.uix.behaviors import SpatialTouchBehavior
+
+
+class FlatSpatialGridLayout(SpatialTouchBehavior, GridLayout):
+    """:class:`~kivy.uix.gridlayout.GridLayout` routing new touches to
+    the children under them."""
+
+
+class FlatSpatialFloatLayout(SpatialTouchBehavior, FloatLayout):
+    """:class:`~kivy.uix.floatlayout.FloatLayout` routing new touches to
+    the children under them."""
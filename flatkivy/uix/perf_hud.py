@@ -0,0 +1,231 @@
+"""
+Components/Performance HUD
+==========================
+
+Overlay showing where the frames of a :class:`~flatkivy.app.FlatApp` go,
+meant to diagnose jank on a device without attaching a profiler:
+
+- frames per second and a histogram of the last frame times,
+- live widget counts per ``flatkivy`` class,
+- graphics instruction count of the whole window,
+- memory of the textures drawn by those instructions,
+- number of :class:`~kivy.clock.Clock` events scheduled.
+
+It is started and stopped at runtime through the app:
+
+.. code-block:: python
+
+    class MainApp(FlatApp):
+        def on_start(self):
+            self.perf_hud_start()
+
+Nothing is scheduled nor bound while it is stopped. Widget, instruction
+and texture figures come from a walk of the window, repeated every
+:attr:`PerfHUD.refresh_interval` seconds.
+"""
+
+__all__ = ("PerfHUD",)
+
+from collections import Counter, deque
+
+from kivy.clock import Clock
+from kivy.core.text import Label as CoreLabel
+from kivy.core.window import Window
+from kivy.graphics import Color, Rectangle
+from kivy.metrics import dp
+from kivy.properties import NumericProperty
+from kivy.uix.widget import Widget
+
+HISTOGRAM_BINS = (1 / 120.0, 1 / 60.0, 1 / 30.0, 1 / 20.0, float("inf"))
+"""Upper bounds, in seconds, of the frame time histogram bars."""
+
+HISTOGRAM_LABELS = ("8ms", "16ms", "33ms", "50ms", "slow")
+
+HISTOGRAM_COLORS = (
+    (0.18, 0.8, 0.44, 1),
+    (0.18, 0.8, 0.44, 1),
+    (0.95, 0.77, 0.06, 1),
+    (0.9, 0.49, 0.13, 1),
+    (0.91, 0.3, 0.24, 1),
+)
+
+FRAME_SAMPLES = 240
+"""Number of frames the histogram covers."""
+
+TOP_CLASSES = 8
+"""Number of widget classes listed."""
+
+
+def walk_widgets(widget):
+    yield widget
+    for child in widget.children:
+        yield from walk_widgets(child)
+
+
+def canvas_stats(canvas, textures):
+    """Returns the number of instructions under `canvas` and records the
+    ``{texture id: bytes}`` of the textures they draw into `textures`."""
+
+    count = 0
+    stack = [canvas]
+    while stack:
+        instruction = stack.pop()
+        count += 1
+        texture = getattr(instruction, "texture", None)
+        if texture is not None:
+            size = texture.width * texture.height * 4
+            if size > textures.get(texture.id, 0):
+                textures[texture.id] = size
+        children = getattr(instruction, "children", None)
+        if children:
+            stack.extend(children)
+        if getattr(instruction, "has_before", False):
+            stack.append(instruction.before)
+        if getattr(instruction, "has_after", False):
+            stack.append(instruction.after)
+    return count
+
+
+class PerfHUD(Widget):
+    """The overlay itself, added to the window by
+    :meth:`~flatkivy.app.FlatApp.perf_hud_start`."""
+
+    refresh_interval = NumericProperty(0.5)
+    """
+    Seconds between two refreshes of the text and the counts.
+
+    :attr:`refresh_interval` is an :class:`~kivy.properties.NumericProperty`
+    and defaults to `0.5`.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.size_hint = (None, None)
+        self._frames = deque(maxlen=FRAME_SAMPLES)
+        self._label = CoreLabel(font_size=dp(11), halign="left")
+        with self.canvas:
+            Color(0, 0, 0, 0.7)
+            self._background = Rectangle()
+            Color(1, 1, 1, 1)
+            self._text = Rectangle()
+            self._bar_colors = []
+            self._bars = []
+            for rgba in HISTOGRAM_COLORS:
+                self._bar_colors.append(Color(rgba=rgba))
+                self._bars.append(Rectangle(size=(0, 0)))
+        self._sample_event = None
+        self._refresh_event = None
+
+    @property
+    def running(self):
+        return self._sample_event is not None
+
+    def start(self, window=None):
+        if self.running:
+            return
+        window = window or Window
+        self._frames.clear()
+        window.add_widget(self)
+        self._sample_event = Clock.schedule_interval(self._sample, 0)
+        self._refresh_event = Clock.schedule_interval(
+            self.refresh, self.refresh_interval
+        )
+        self.refresh()
+
+    def stop(self):
+        if not self.running:
+            return
+        self._sample_event.cancel()
+        self._refresh_event.cancel()
+        self._sample_event = self._refresh_event = None
+        if self.parent is not None:
+            self.parent.remove_widget(self)
+
+    def _sample(self, dt):
+        self._frames.append(dt)
+
+    def histogram(self):
+        counts = [0] * len(HISTOGRAM_BINS)
+        for dt in self._frames:
+            for index, bound in enumerate(HISTOGRAM_BINS):
+                if dt <= bound:
+                    counts[index] += 1
+                    break
+        return counts
+
+    def collect(self):
+        """Returns the figures shown by the overlay as a dict."""
+
+        window = self.get_root_window() or Window
+        classes = Counter()
+        for root in window.children:
+            if root is self:
+                continue
+            for widget in walk_widgets(root):
+                cls = type(widget)
+                if cls.__module__.startswith("flatkivy"):
+                    classes[cls.__name__] += 1
+        textures = {}
+        instructions = canvas_stats(window.canvas, textures)
+        frames = self._frames
+        return {
+            "fps": len(frames) / sum(frames) if frames else Clock.get_fps(),
+            "frame_time": sum(frames) / len(frames) if frames else 0,
+            "frame_time_max": max(frames) if frames else 0,
+            "histogram": self.histogram(),
+            "widgets": dict(classes),
+            "instructions": instructions,
+            "texture_bytes": sum(textures.values()),
+            "textures": len(textures),
+            "clock_events": len(Clock.get_events()),
+        }
+
+    def refresh(self, *args):
+        stats = self.collect()
+        lines = [
+            f"FPS {stats['fps']:.1f}  "
+            f"frame {stats['frame_time'] * 1000:.1f} ms "
+            f"(max {stats['frame_time_max'] * 1000:.1f})",
+            f"instructions {stats['instructions']}  "
+            f"clock events {stats['clock_events']}",
+            f"textures {stats['textures']}  "
+            f"{stats['texture_bytes'] / 1048576.0:.1f} MiB",
+        ]
+        widgets = Counter(stats["widgets"]).most_common(TOP_CLASSES)
+        lines += [f"{name} {count}" for name, count in widgets]
+        lines.append("  ".join(HISTOGRAM_LABELS))
+        self._label.text = "\n".join(lines)
+        self._label.refresh()
+        texture = self._label.texture
+        padding = dp(6)
+        bars_height = dp(30)
+        self.size = (
+            texture.width + padding * 2,
+            texture.height + bars_height + padding * 2,
+        )
+        window = self.get_root_window() or Window
+        self.pos = (0, window.height - self.height)
+        self._background.pos = self.pos
+        self._background.size = self.size
+        self._text.texture = texture
+        self._text.size = texture.size
+        self._text.pos = (
+            self.x + padding,
+            self.top - padding - texture.height,
+        )
+
+        counts = stats["histogram"]
+        total = max(1, sum(counts))
+        bar_width = texture.width / len(counts)
+        for index, count in enumerate(counts):
+            self._bars[index].pos = (
+                self.x + padding + index * bar_width,
+                self.y + padding,
+            )
+            self._bars[index].size = (
+                bar_width - dp(2),
+                bars_height * count / total,
+            )
+
+    def on_touch_down(self, touch):
+        return False
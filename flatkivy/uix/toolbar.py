@@ -8,10 +8,7 @@ Components/Toolbar
 
     `Material Design spec, App bars: bottom <https://material.io/components/app-bars-bottom/app-bars-bottom.html>`_
 
-.. image:: https://github.com/HeaTTheatR/KivyMD-data/raw/master/gallery/kivymddoc/app-bar-top.png
-    :align: center
-
-`KivyMD` provides the following toolbar positions for use:
+`FlatKivy` provides the following toolbar positions for use:
 
 - Top_
 - Bottom_
@@ -24,110 +21,91 @@ Top
 
     from kivy.lang import Builder
 
-    from kivymd.app import MDApp
+    from flatkivy.app import FlatApp
 
     KV = '''
     BoxLayout:
         orientation: "vertical"
 
-        MDToolbar:
-            title: "MDToolbar"
+        FlatToolbar:
+            title: "FlatToolbar"
 
-        MDLabel:
+        FlatLabel:
             text: "Content"
             halign: "center"
     '''
 
 
-    class Test(MDApp):
+    class Test(FlatApp):
         def build(self):
             return Builder.load_string(KV)
 
 
     Test().run()
 
-.. image:: https://github.com/HeaTTheatR/KivyMD-data/raw/master/gallery/kivymddoc/toolbar-1.png
-    :align: center
-
 Add left menu
 -------------
 
 .. code-block:: kv
 
-    MDToolbar:
-        title: "MDToolbar"
-        left_action_items: [["menu", lambda x: app.callback()]]
-
-.. image:: https://github.com/HeaTTheatR/KivyMD-data/raw/master/gallery/kivymddoc/toolbar-2.png
-    :align: center
+    FlatToolbar:
+        title: "FlatToolbar"
+        left_action_items: [["ic-horizontal-menu", lambda x: app.callback()]]
 
 Add right menu
 --------------
 
 .. code-block:: kv
 
-    MDToolbar:
-        title: "MDToolbar"
-        right_action_items: [["dots-vertical", lambda x: app.callback()]]
-
-.. image:: https://github.com/HeaTTheatR/KivyMD-data/raw/master/gallery/kivymddoc/toolbar-3.png
-    :align: center
+    FlatToolbar:
+        title: "FlatToolbar"
+        right_action_items: [["ic-vertical-menu", lambda x: app.callback()]]
 
 Add two item to the right menu
 ------------------------------
 
 .. code-block:: kv
 
-    MDToolbar:
-        title: "MDToolbar"
-        right_action_items: [["dots-vertical", lambda x: app.callback_1()], ["clock", lambda x: app.callback_2()]]
+    FlatToolbar:
+        title: "FlatToolbar"
+        right_action_items: [["ic-vertical-menu", lambda x: app.callback_1()], ["ic-clock", lambda x: app.callback_2()]]
 
-.. image:: https://github.com/HeaTTheatR/KivyMD-data/raw/master/gallery/kivymddoc/toolbar-4.png
-    :align: center
+Icons are names of :mod:`flatkivy.icon_packs`.
 
 Change toolbar color
 --------------------
 
 .. code-block:: kv
 
-    MDToolbar:
-        title: "MDToolbar"
-        md_bg_color: app.theme_cls.accent_color
-
-.. image:: https://github.com/HeaTTheatR/KivyMD-data/raw/master/gallery/kivymddoc/toolbar-5.png
-    :align: center
+    FlatToolbar:
+        title: "FlatToolbar"
+        flat_bg_color: app.theme_cls.accent_color
 
 Change toolbar text color
 -------------------------
 
 .. code-block:: kv
 
-    MDToolbar:
-        title: "MDToolbar"
+    FlatToolbar:
+        title: "FlatToolbar"
         specific_text_color: app.theme_cls.accent_color
 
-.. image:: https://github.com/HeaTTheatR/KivyMD-data/raw/master/gallery/kivymddoc/toolbar-6.png
-    :align: center
+The title and the action icons are white or dark, whichever contrasts with
+the palette of the toolbar, until :attr:`specific_text_color` is set.
 
 Shadow elevation control
 ------------------------
 
 .. code-block:: kv
 
-    MDToolbar:
+    FlatToolbar:
         title: "Elevation 10"
         elevation: 10
 
-.. image:: https://github.com/HeaTTheatR/KivyMD-data/raw/master/gallery/kivymddoc/toolbar-7.png
-    :align: center
-
 .. Bottom:
 Bottom
 ------
 
-.. image:: https://github.com/HeaTTheatR/KivyMD-data/raw/master/gallery/kivymddoc/app-bar-bottom.png
-    :align: center
-
 Usage
 -----
 
@@ -135,32 +113,29 @@ Usage
 
     from kivy.lang import Builder
 
-    from kivymd.app import MDApp
+    from flatkivy.app import FlatApp
 
     KV = '''
     BoxLayout:
 
         # Will always be at the bottom of the screen.
-        MDBottomAppBar:
+        FlatBottomAppBar:
 
-            MDToolbar:
+            FlatToolbar:
                 title: "Title"
-                icon: "git"
+                icon: "plus"
                 type: "bottom"
-                left_action_items: [["menu", lambda x: x]]
+                left_action_items: [["ic-horizontal-menu", lambda x: x]]
     '''
 
 
-    class Test(MDApp):
+    class Test(FlatApp):
         def build(self):
             return Builder.load_string(KV)
 
 
     Test().run()
 
-.. image:: https://github.com/HeaTTheatR/KivyMD-data/raw/master/gallery/kivymddoc/toolbar-8.png
-    :align: center
-
 Event on floating button
 ------------------------
 
@@ -168,13 +143,13 @@ Event ``on_action_button``:
 
 .. code-block:: kv
 
-    MDBottomAppBar:
+    FlatBottomAppBar:
 
-        MDToolbar:
+        FlatToolbar:
             title: "Title"
-            icon: "git"
+            icon: "plus"
             type: "bottom"
-            left_action_items: [["menu", lambda x: x]]
+            left_action_items: [["ic-horizontal-menu", lambda x: x]]
             on_action_button: app.callback(self.icon)
 
 Floating button position
@@ -189,42 +164,37 @@ Mode:
 
 .. code-block:: kv
 
-    MDBottomAppBar:
+    FlatBottomAppBar:
 
-        MDToolbar:
+        FlatToolbar:
             title: "Title"
-            icon: "git"
+            icon: "plus"
             type: "bottom"
-            left_action_items: [["menu", lambda x: x]]
+            left_action_items: [["ic-horizontal-menu", lambda x: x]]
             mode: "end"
+"""
 
-.. image:: https://github.com/HeaTTheatR/KivyMD-data/raw/master/gallery/kivymddoc/toolbar-9.png
-    :align: center
-
-.. code-block:: kv
-
-    MDBottomAppBar:
-
-        MDToolbar:
-            title: "Title"
-            icon: "git"
-            type: "bottom"
-            left_action_items: [["menu", lambda x: x]]
-            mode: "free-end"
-
-.. image:: https://github.com/HeaTTheatR/KivyMD-data/raw/master/gallery/kivymddoc/toolbar-10.png
-    :align: center
-
-.. seealso::
+__all__ = (
+    "FlatToolbar",
+    "FlatBottomAppBar",
+)
 
-    `Components-Bottom-App-Bar <https://github.com/HeaTTheatR/KivyMD/wiki/Components-Bottom-App-Bar>`_
-"""
+import math
 
 from kivy.animation import Animation
 from kivy.clock import Clock
+from kivy.graphics import (
+    Color,
+    Ellipse,
+    InstructionGroup,
+    Mesh,
+    Rectangle,
+    RoundedRectangle,
+)
 from kivy.lang import Builder
 from kivy.metrics import dp
 from kivy.properties import (
+    BooleanProperty,
     ListProperty,
     StringProperty,
     NumericProperty,
@@ -234,21 +204,38 @@ from kivy.uix.boxlayout import BoxLayout
 from kivy.core.window import Window
 from kivy.uix.floatlayout import FloatLayout
 
-from kivymd.uix.button import MDIconButton, MDFloatingActionButton
+from flatkivy.instrumentation import instrumented
+from flatkivy.svg_mesh import MESH_FMT, tessellate_polygon
+from flatkivy.theming import ThemableBehavior
 from flatkivy.uix.behaviors import (
-    SpecificBackgroundColorBehavior,
     RectangularElevationBehavior,
+    SpecificBackgroundColorBehavior,
 )
-from kivymd.theming import ThemableBehavior
+from flatkivy.uix.button import FlatFloatingActionButton, FlatIconButton
+from flatkivy.window_resize import window_resize
+
+ACTION_BUTTON_POOL_SIZE = 16
+"""Most action buttons a toolbar keeps for reuse once removed from it."""
+
+ACTION_BUTTON_STATE = {
+    "icon": "android",
+    "disabled": False,
+    "opacity": 1,
+    "opposite_colors": False,
+    "theme_text_color": None,
+    "user_font_size": 0,
+    "flat_bg_color": (0.0, 0.0, 0.0, 0.0),
+}
+"""Properties of an action button restored before it is reused, in case
+a callback changed them."""
+
+ACTION_BUTTON_EVENTS = ("on_press", "on_release")
+"""Events of an action button whose handlers are all unbound before it is
+reused."""
 
 Builder.load_string(
     """
-#:import m_res kivymd.material_resources
-
-
-<MDActionBottomAppBarButton>:
-    md_bg_color: self.theme_cls.primary_color
-
+<FlatActionBottomAppBarButton>:
     canvas.before:
         PushMatrix
         Scale:
@@ -259,58 +246,13 @@ Builder.load_string(
         PopMatrix
 
 
-<MDToolbar>
+<FlatToolbar>
     size_hint_y: None
     height: root.theme_cls.standard_increment
     padding: [root.theme_cls.horizontal_margins - dp(12), 0]
     opposite_colors: True
-    elevation: 6
-    md_bg_color: self.theme_cls.primary_color if root.type != "bottom" else [0, 0, 0, 0]
-
-    canvas:
-        Color:
-            rgba: root.theme_cls.primary_color
-        RoundedRectangle:
-            pos:
-                self.pos \
-                if root.mode == "center" else \
-                (self.width - root.action_button.width + dp(6), self.y)
-            size:
-                (((self.width - root.action_button.width) / 2 - dp(6), self.height) \
-                if root.mode == "center" else \
-                (root.action_button.width - dp(6), self.height)) if root.type == "bottom" else self.pos
-            radius:
-                (0, root.round, 0, 0) if root.mode == "center" else (root.round, 0, 0, 0)
-        Rectangle:
-            pos:
-                ((self.width / 2 - root.action_button.width / 2) - dp(6), self.y - root._shift) \
-                if root.mode == "center" else \
-                (self.width - root.action_button.width * 2 - dp(6), self.y - root._shift)
-            size:
-                (root.action_button.width + dp(6) * 2, self.height - root._shift * 2) \
-                if root.type == "bottom" else (0, 0)
-        RoundedRectangle:
-            pos:
-                ((self.width + root.action_button.width) / 2 + dp(6), self.y) \
-                if root.mode == "center" else self.pos
-            size:
-                (((self.width - root.action_button.width) / 2 + dp(6), self.height) \
-                if root.mode == "center" else \
-                ((self.width - root.action_button.width * 2 - dp(6)), self.height)) \
-                if root.type == "bottom" else (0, 0)
-            radius: (root.round, 0, 0, 0) if root.mode == "center" else (0, root.round, 0, 0)
-        Color:
-            rgba: 1, 1, 1, 1
-        Ellipse:
-            pos:
-                (self.center[0] - root.action_button.width / 2 - dp(6), self.center[1] - root._shift * 2) \
-                if root.mode == "center" else \
-                (self.width - root.action_button.width * 2 - dp(6), self.center[1] - root._shift * 2)
-            size:
-                (root.action_button.width + dp(6) * 2, root.action_button.width) \
-                if root.type == "bottom" else (0, 0)
-            angle_start: root._angle_start
-            angle_end: root._angle_end
+    elevation: 6 if root.type != "bottom" else 0
+    flat_bg_color: self.theme_cls.primary_color if root.type != "bottom" else [0, 0, 0, 0]
 
     BoxLayout:
         id: left_actions
@@ -321,16 +263,16 @@ Builder.load_string(
     BoxLayout:
         padding: dp(12), 0
 
-        MDLabel:
+        FlatLabel:
             id: label_title
-            font_style: 'H6'
-            opposite_colors: root.opposite_colors
-            theme_text_color: 'Custom'
-            text_color: root.specific_text_color
+            font_style: 'Subtitle'
+            color: root.specific_text_color
             text: root.title
+            text_size: self.size
             shorten: True
             shorten_from: 'right'
             halign: root.anchor_title
+            valign: 'middle'
 
     BoxLayout:
         id: right_actions
@@ -341,20 +283,181 @@ Builder.load_string(
 )
 
 
-class MDActionBottomAppBarButton(MDFloatingActionButton):
+NOTCH_SEGMENTS = 24
+"""Segments of the half ellipse of a tessellated notch."""
+
+CORNER_SEGMENTS = 6
+"""Segments of each rounded corner of a tessellated notch."""
+
+
+class NotchGeometry:
+    """Background of a bottom :class:`FlatToolbar` with the notch of its
+    action button.
+
+    Every property the shape depends on only marks the geometry dirty and
+    the instructions are updated once, before the next frame. With
+    :attr:`FlatToolbar.notch_mesh` the notched outline is tessellated into a
+    single :class:`~kivy.graphics.Mesh` instead of the two rounded
+    rectangles, the rectangle and the ellipse covering the notch.
+    """
+
+    def __init__(self, toolbar):
+        self.toolbar = toolbar
+        self._dirty = False
+        self._trigger = Clock.create_trigger(self.update, -1)
+        with toolbar.canvas.before:
+            self._color = Color()
+            self._mesh_group = InstructionGroup()
+            self._left = RoundedRectangle(size=(0, 0))
+            self._gap = Rectangle(size=(0, 0))
+            self._right = RoundedRectangle(size=(0, 0))
+            self._notch_color = Color()
+            self._notch = Ellipse(size=(0, 0))
+        self._mesh_key = None
+
+    def mark_dirty(self, *args):
+        if not self._dirty:
+            self._dirty = True
+            self._trigger()
+
+    def update(self, *args):
+        if not self._dirty:
+            return
+        self._dirty = False
+        bar = self.toolbar
+        theme_cls = bar.theme_cls
+        self._color.rgba = theme_cls.primary_color
+        self._notch_color.rgba = theme_cls.bg_color
+        if bar.type != "bottom":
+            self._hide_shapes()
+            self._set_mesh(None)
+            return
+
+        x, y = bar.pos
+        width, height = bar.size
+        button = bar.action_button.width
+        margin = dp(6)
+        shift = bar._shift
+        if bar.mode == "center":
+            notch_x = x + width / 2 - button / 2 - margin
+        else:
+            notch_x = x + width - button * 2 - margin
+        notch_width = button + margin * 2
+
+        if bar.notch_mesh:
+            self._hide_shapes()
+            notched = bar._angle_start != bar._angle_end
+            self._set_mesh(
+                (
+                    x, y, width, height, notch_x, notch_width,
+                    y + height / 2 - shift * 2 + button / 2,
+                    button / 2, bar.round, notched,
+                )
+            )
+            return
+        self._set_mesh(None)
+
+        zero, corner = (0, 0), (bar.round, bar.round)
+        if bar.mode == "center":
+            self._left.pos = (x, y)
+            self._left.size = (notch_x - x, height)
+            self._left.radius = [zero, corner, zero, zero]
+            self._right.pos = (notch_x + notch_width, y)
+            self._right.size = ((width - button) / 2 + margin, height)
+            self._right.radius = [corner, zero, zero, zero]
+        else:
+            self._left.pos = (notch_x + notch_width, y)
+            self._left.size = (button - margin, height)
+            self._left.radius = [corner, zero, zero, zero]
+            self._right.pos = (x, y)
+            self._right.size = (notch_x - x, height)
+            self._right.radius = [zero, corner, zero, zero]
+        self._gap.pos = (notch_x, y - shift)
+        self._gap.size = (notch_width, height - shift * 2)
+        self._notch.pos = (notch_x, y + height / 2 - shift * 2)
+        self._notch.size = (notch_width, button)
+        self._notch.angle_start = bar._angle_start
+        self._notch.angle_end = bar._angle_end
+
+    def _hide_shapes(self):
+        for shape in (self._left, self._gap, self._right, self._notch):
+            shape.size = (0, 0)
+
+    def _set_mesh(self, key):
+        if key == self._mesh_key:
+            return
+        self._mesh_key = key
+        self._mesh_group.clear()
+        if key is None:
+            return
+        for vertices, indices in tessellate_polygon([notch_outline(*key)]):
+            self._mesh_group.add(
+                Mesh(
+                    vertices=vertices,
+                    indices=indices,
+                    mode="triangles",
+                    fmt=MESH_FMT,
+                )
+            )
+
+
+def notch_outline(
+    x, y, width, height, notch_x, notch_width, notch_y, notch_depth,
+    radius, notched=True,
+):
+    """Returns the ``[(x, y), ...]`` outline of a bar of `width` and
+    `height` at `x`, `y` with a notch starting at `notch_x`.
+
+    The notch is a half ellipse of `notch_width` and `notch_depth` centred
+    on `notch_y`, joined to the top edge by straight sides; the top corners
+    around it are rounded by `radius`.
+    """
+
+    top = y + height
+    if not notched:
+        return [(x, y), (x + width, y), (x + width, top), (x, top)]
+    left, right = notch_x, notch_x + notch_width
+    radius = min(radius, top - notch_y)
+    outline = [(x, y), (x + width, y), (x + width, top)]
+
+    def corner(cx, cy, start):
+        for i in range(CORNER_SEGMENTS + 1):
+            angle = start + math.pi / 2 * i / CORNER_SEGMENTS
+            outline.append(
+                (cx + radius * math.cos(angle), cy + radius * math.sin(angle))
+            )
+
+    corner(right + radius, top - radius, math.pi / 2)
+    rx = notch_width / 2
+    center = left + rx
+    for i in range(NOTCH_SEGMENTS + 1):
+        angle = math.pi * i / NOTCH_SEGMENTS
+        outline.append(
+            (
+                center + rx * math.cos(angle),
+                notch_y - notch_depth * math.sin(angle),
+            )
+        )
+    corner(left - radius, top - radius, 0)
+    outline.append((x, top))
+    return outline
+
+
+class FlatActionBottomAppBarButton(FlatFloatingActionButton):
     _scale_x = NumericProperty(1)
     _scale_y = NumericProperty(1)
 
 
-class MDToolbar(
+class FlatToolbar(
     ThemableBehavior,
+    RectangularElevationBehavior,
     SpecificBackgroundColorBehavior,
     BoxLayout,
 ):
     """
     :Events:
         `on_action_button`
-            Method for the button used for the :class:`~MDBottomAppBar` class.
+            Method for the button used for the :class:`~FlatBottomAppBar` class.
     """
 
     left_action_items = ListProperty()
@@ -365,7 +468,7 @@ class MDToolbar(
 
         left_action_items: [`'icon_name'`, callback]
 
-    where `'icon_name'` is a string that corresponds to an icon definition and
+    where `'icon_name'` is the name of an icon of :mod:`flatkivy.icon_packs` and
     ``callback`` is the function called on a touch release event.
 
     :attr:`left_action_items` is an :class:`~kivy.properties.ListProperty`
@@ -387,19 +490,12 @@ class MDToolbar(
     and defaults to `''`.
     """
 
-    md_bg_color = ListProperty([0, 0, 0, 0])
-    """Color toolbar.
-
-    :attr:`md_bg_color` is an :class:`~kivy.properties.ListProperty`
-    and defaults to `[0, 0, 0, 0]`.
-    """
-
     anchor_title = StringProperty("left")
 
     mode = OptionProperty(
         "center", options=["free-end", "free-center", "end", "center"]
     )
-    """Floating button position. Onle for :class:`~MDBottomAppBar` class.
+    """Floating button position. Onle for :class:`~FlatBottomAppBar` class.
     Available options are: `'free-end'`, `'free-center'`, `'end'`, `'center'`.
 
     :attr:`mode` is an :class:`~kivy.properties.OptionProperty`
@@ -409,7 +505,7 @@ class MDToolbar(
     round = NumericProperty("10dp")
     """
     Rounding the corners at the notch for a button.
-    Onle for :class:`~MDBottomAppBar` class.
+    Onle for :class:`~FlatBottomAppBar` class.
 
     :attr:`round` is an :class:`~kivy.properties.NumericProperty`
     and defaults to `'10dp'`.
@@ -417,7 +513,7 @@ class MDToolbar(
 
     icon = StringProperty("android")
     """
-    Floating button. Onle for :class:`~MDBottomAppBar` class.
+    Floating button. Onle for :class:`~FlatBottomAppBar` class.
 
     :attr:`icon` is an :class:`~kivy.properties.StringProperty`
     and defaults to `'android'`.
@@ -425,7 +521,7 @@ class MDToolbar(
 
     icon_color = ListProperty()
     """
-    Color action button. Onle for :class:`~MDBottomAppBar` class.
+    Color action button. Onle for :class:`~FlatBottomAppBar` class.
 
     :attr:`icon_color` is an :class:`~kivy.properties.ListProperty`
     and defaults to `[]`.
@@ -433,14 +529,14 @@ class MDToolbar(
 
     type = OptionProperty("top", options=["top", "bottom"])
     """
-    When using the :class:`~MDBottomAppBar` class, the parameter ``type``
+    When using the :class:`~FlatBottomAppBar` class, the parameter ``type``
     must be set to `'bottom'`:
 
     .. code-block:: kv
 
-        MDBottomAppBar:
+        FlatBottomAppBar:
 
-            MDToolbar:
+            FlatToolbar:
                 type: "bottom"
 
     Available options are: `'top'`, `'bottom'`.
@@ -449,12 +545,25 @@ class MDToolbar(
     and defaults to `'top'`.
     """
 
+    notch_mesh = BooleanProperty(False)
+    """
+    Draw the notched background of a bottom toolbar as one tessellated
+    :class:`~kivy.graphics.Mesh`, the notch then shows what is behind the
+    toolbar instead of being painted with the theme background color.
+    See :class:`NotchGeometry`.
+
+    :attr:`notch_mesh` is an :class:`~kivy.properties.BooleanProperty`
+    and defaults to `False`.
+    """
+
     _shift = NumericProperty("3.5dp")
     _angle_start = NumericProperty(90)
     _angle_end = NumericProperty(270)
 
+    @instrumented
     def __init__(self, **kwargs):
-        self.action_button = MDActionBottomAppBarButton()
+        self._action_button_pool = []
+        self.action_button = FlatActionBottomAppBarButton()
         super().__init__(**kwargs)
         self.register_event_type("on_action_button")
         self.action_button.bind(
@@ -468,8 +577,26 @@ class MDToolbar(
         )
         if not self.icon_color:
             self.icon_color = self.theme_cls.primary_color
-        Window.bind(on_resize=self._on_resize)
+        window_resize.bind(self._on_resize)
         self.bind(specific_text_color=self.update_action_bar_text_colors)
+        self.notch = NotchGeometry(self)
+        self.bind(
+            pos=self.notch.mark_dirty,
+            size=self.notch.mark_dirty,
+            mode=self.notch.mark_dirty,
+            type=self.notch.mark_dirty,
+            round=self.notch.mark_dirty,
+            notch_mesh=self.notch.mark_dirty,
+            _shift=self.notch.mark_dirty,
+            _angle_start=self.notch.mark_dirty,
+            _angle_end=self.notch.mark_dirty,
+        )
+        self.action_button.bind(width=self.notch.mark_dirty)
+        self.theme_cls.bind(
+            primary_color=self.notch.mark_dirty,
+            bg_color=self.notch.mark_dirty,
+        )
+        self.notch.mark_dirty()
         Clock.schedule_once(
             lambda x: self.on_left_action_items(0, self.left_action_items)
         )
@@ -480,9 +607,16 @@ class MDToolbar(
     def on_action_button(self, *args):
         pass
 
-    def on_md_bg_color(self, instance, value):
-        if self.type == "bottom":
-            self.md_bg_color = [0, 0, 0, 0]
+    def _update_specific_text_color(self, instance, value):
+        # The toolbar is filled with its palette color, so its text takes
+        # the color contrasting with it rather than the palette color.
+        colors = self.theme_cls.get_palette_colors(self.background_palette)
+        self.specific_text_color = colors.text
+        self.specific_secondary_text_color = colors.secondary_text
+
+    def on_flat_bg_color(self, instance, value):
+        if self.type == "bottom" and value != [0, 0, 0, 0]:
+            self.flat_bg_color = [0, 0, 0, 0]
 
     def on_left_action_items(self, instance, value):
         self.update_action_bar(self.ids["left_actions"], value)
@@ -490,21 +624,87 @@ class MDToolbar(
     def on_right_action_items(self, instance, value):
         self.update_action_bar(self.ids["right_actions"], value)
 
+    @instrumented
     def update_action_bar(self, action_bar, action_bar_items):
-        action_bar.clear_widgets()
-        new_width = 0
+        """Reconciles the buttons of `action_bar` with `action_bar_items`.
+
+        Buttons already showing an icon are kept for it, the others are
+        reused for the new icons and only what changed is updated. Buttons
+        left over are reset and kept for reuse by this toolbar.
+        """
+
+        current = list(reversed(action_bar.children))
+        by_icon = {}
+        for button in current:
+            by_icon.setdefault(button.icon, []).append(button)
+        wanted = []
         for item in action_bar_items:
-            new_width += dp(48)
-            action_bar.add_widget(
-                MDIconButton(
-                    icon=item[0],
-                    on_release=item[1],
-                    opposite_colors=True,
-                    text_color=self.specific_text_color,
-                    theme_text_color="Custom",
-                )
-            )
-        action_bar.width = new_width
+            matches = by_icon.get(item[0])
+            wanted.append(matches.pop(0) if matches else None)
+        spare = [button for matches in by_icon.values() for button in matches]
+        spare.sort(key=current.index)
+        for index, item in enumerate(action_bar_items):
+            button = wanted[index]
+            if button is None:
+                button = spare.pop(0) if spare else self._get_action_button()
+                wanted[index] = button
+            self._update_action_button(button, item)
+        for button in spare:
+            action_bar.remove_widget(button)
+            self._release_action_button(button)
+
+        current = list(reversed(action_bar.children))
+        if current != wanted[:len(current)]:
+            action_bar.clear_widgets()
+            current = []
+        for button in wanted[len(current):]:
+            action_bar.add_widget(button)
+        action_bar.width = dp(48) * len(wanted)
+
+    def _get_action_button(self):
+        if self._action_button_pool:
+            button = self._action_button_pool.pop()
+            button.theme_cls = self.theme_cls
+            button.text_color = self.specific_text_color
+            return button
+        return FlatIconButton(text_color=self.specific_text_color)
+
+    def _update_action_button(self, button, item):
+        icon, callback = item[0], item[1]
+        if button.icon != icon:
+            button.icon = icon
+        old_callback = getattr(button, "_action_callback", None)
+        if old_callback is not callback:
+            if old_callback is not None:
+                button.unbind(on_release=old_callback)
+            button.bind(on_release=callback)
+            button._action_callback = callback
+
+    def _release_action_button(self, button):
+        # Anything bound or set on the button since it was handed out goes,
+        # so that it comes back from the pool like a new one.
+        for event in ACTION_BUTTON_EVENTS:
+            for callback, largs, kwargs, is_ref, uid in (
+                button.get_property_observers(event, args=True)
+            ):
+                if uid is not None:
+                    button.unbind_uid(event, uid)
+                else:
+                    callback = callback() if is_ref else callback
+                    if callback is not None:
+                        button.unbind(**{event: callback})
+        button._action_callback = None
+        for name, value in ACTION_BUTTON_STATE.items():
+            setattr(button, name, value)
+        if len(self._action_button_pool) < ACTION_BUTTON_POOL_SIZE:
+            self._action_button_pool.append(button)
+
+    def pooled_widgets(self):
+        """Returns the action buttons kept out of the action bars for
+        reuse. :mod:`~flatkivy.leak_tracker` does not report them as
+        orphans while the toolbar is in the widget tree."""
+
+        return list(self._action_button_pool)
 
     def update_action_bar_text_colors(self, instance, value):
         for child in self.ids["left_actions"].children:
@@ -522,17 +722,13 @@ class MDToolbar(
         self.action_button.icon = value
 
     def on_icon_color(self, instance, value):
-        self.action_button.md_bg_color = value
+        self.action_button.flat_bg_color = value
 
     def on_mode(self, instance, value):
         def set_button_pos(*args):
             self.action_button.x = x
             self.action_button.y = y
-            self.action_button._hard_shadow_size = (0, 0)
-            self.action_button._soft_shadow_size = (0, 0)
-            anim = Animation(_scale_x=1, _scale_y=1, d=0.05)
-            anim.bind(on_complete=self.set_shadow)
-            anim.start(self.action_button)
+            Animation(_scale_x=1, _scale_y=1, d=0.05).start(self.action_button)
 
         if value == "center":
             self.set_notch()
@@ -560,7 +756,6 @@ class MDToolbar(
             self.remove_notch()
             x = Window.width / 2 - self.action_button.width / 2
             y = self.action_button.height + self.action_button.height / 2
-        self.remove_shadow()
         anim = Animation(_scale_x=0, _scale_y=0, d=0.05)
         anim.bind(on_complete=set_button_pos)
         anim.start(self.action_button)
@@ -578,12 +773,12 @@ class MDToolbar(
         self._shift = dp(3.5)
 
 
-class MDBottomAppBar(FloatLayout):
+class FlatBottomAppBar(FloatLayout):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.size_hint_y = None
 
     def add_widget(self, widget, index=0, canvas=None):
-        if widget.__class__ is MDToolbar:
+        if widget.__class__ is FlatToolbar:
             super().add_widget(widget)
             return super().add_widget(widget.action_button)
@@ -0,0 +1,88 @@
+"""
+Themes/Window Resize
+====================
+
+Shared, debounced observer of the size of the :class:`~kivy.core.window.Window`.
+
+While a window is resized interactively or rotated it reports every
+intermediate size. :data:`window_resize` listens to the window once for
+the whole process and calls its callbacks at most once per frame, with the
+last size only, instead of every component binding the window itself.
+
+Bound methods are held weakly, so a widget that goes away is dropped
+without having to unbind and is not kept alive by the window:
+
+.. code-block:: python
+
+    from flatkivy.window_resize import window_resize
+
+    class MyWidget(Widget):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            window_resize.bind(self._on_resize)
+
+        def _on_resize(self, window, width, height):
+            ...
+"""
+
+__all__ = ("WindowResizeDispatcher", "window_resize")
+
+from weakref import WeakMethod
+
+from kivy.clock import Clock
+from kivy.core.window import Window
+
+
+class WindowResizeDispatcher:
+    """Calls ``callback(window, width, height)`` once per frame in which
+    the size of the window changed."""
+
+    def __init__(self, window=None):
+        self.window = window or Window
+        self._callbacks = []
+        self._bound = False
+        self._size = tuple(self.window.size)
+        self._trigger = Clock.create_trigger(self._dispatch, -1)
+
+    def bind(self, callback):
+        if getattr(callback, "__self__", None) is not None:
+            reference = WeakMethod(callback)
+        else:
+            reference = lambda: callback  # noqa: E731
+        self._callbacks.append(reference)
+        if not self._bound:
+            self._bound = True
+            self._size = tuple(self.window.size)
+            self.window.bind(size=self._trigger)
+
+    def unbind(self, callback):
+        self._callbacks = [
+            reference
+            for reference in self._callbacks
+            if reference() is not None and reference() != callback
+        ]
+        self._release()
+
+    def _release(self):
+        if self._bound and not self._callbacks:
+            self._bound = False
+            self.window.unbind(size=self._trigger)
+
+    def _dispatch(self, *args):
+        size = tuple(self.window.size)
+        if size == self._size:
+            return
+        self._size = size
+        for reference in list(self._callbacks):
+            callback = reference()
+            if callback is not None:
+                callback(self.window, *size)
+        self._callbacks = [r for r in self._callbacks if r() is not None]
+        self._release()
+
+    def __len__(self):
+        return sum(1 for reference in self._callbacks if reference())
+
+
+window_resize = WindowResizeDispatcher()
+"""Shared :class:`WindowResizeDispatcher` instance."""
@@ -0,0 +1,251 @@
+"""
+Frame time harness
+==================
+
+Boots :class:`~kitchen_sink.main.KitchenSinkApp` in a hidden window, drives
+its screens with synthetic input and theme switches, and reports the CPU
+time and the net allocated blocks of every frame:
+
+.. code-block:: bash
+
+    python -m kitchen_sink.frame_harness --output frames.json
+    python -m kitchen_sink.frame_harness --baseline frames.json --tolerance 0.2
+
+Frames are stepped one by one through :meth:`EventLoop.idle
+<kivy.base.EventLoopBase.idle>`, so the numbers do not depend on the
+refresh rate of the display. With ``--baseline`` the process exits with
+status 1 when the p99 frame time of a scenario grew by more than
+``--tolerance`` over the baseline. Without a display, run it under
+``xvfb-run``.
+"""
+
+import os
+
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+
+from kivy.config import Config  # noqa: E402
+
+Config.set("graphics", "window_state", "hidden")
+
+import argparse  # noqa: E402
+import json  # noqa: E402
+import sys  # noqa: E402
+import time  # noqa: E402
+from itertools import count  # noqa: E402
+
+from kivy.base import EventLoop  # noqa: E402
+from kivy.core.window import Window  # noqa: E402
+from kivy.input.motionevent import MotionEvent  # noqa: E402
+
+from kitchen_sink.main import KitchenSinkApp, KitchenSinkLayout  # noqa: E402
+
+WARMUP_FRAMES = 30
+"""Frames run before a scenario is measured."""
+
+_touch_ids = count()
+
+
+class HarnessTouch(MotionEvent):
+    """Synthetic touch in window coordinates."""
+
+    def __init__(self, x, y, button=None):
+        self._button = button
+        super().__init__("harness", next(_touch_ids), (x, y), is_touch=True)
+
+    def depack(self, args):
+        self.sx = args[0] / float(Window.width)
+        self.sy = args[1] / float(Window.height)
+        self.profile = ["pos"]
+        if self._button:
+            self.profile.append("button")
+            self.button = self._button
+        super().depack(args)
+
+    def press(self):
+        EventLoop.post_dispatch_input("begin", self)
+
+    def drag_to(self, x, y):
+        self.move((x, y))
+        EventLoop.post_dispatch_input("update", self)
+
+    def release(self):
+        EventLoop.post_dispatch_input("end", self)
+
+
+def tap(x, y):
+    """Frame steps of a tap at `x`, `y`."""
+
+    touch = HarnessTouch(x, y)
+    yield touch.press
+    yield touch.release
+
+
+def drag(x, y, dx, dy, steps):
+    """Frame steps of a drag from `x`, `y` by `dx`, `dy`."""
+
+    touch = HarnessTouch(x, y)
+    yield touch.press
+    for step in range(1, steps + 1):
+        yield lambda s=step: touch.drag_to(
+            x + dx * s / steps, y + dy * s / steps
+        )
+    yield touch.release
+
+
+def wheel(x, y, button):
+    touch = HarnessTouch(x, y, button=button)
+    yield touch.press
+    yield touch.release
+
+
+class Harness:
+    def __init__(self, frames):
+        self.frames = frames
+        self.app = KitchenSinkApp()
+        EventLoop.ensure_window()
+        self.root = KitchenSinkLayout()
+        self.app.root = self.root
+        Window.add_widget(self.root)
+
+    def step(self, action=None):
+        """Runs `action`, then one frame. Returns its ``(seconds of CPU,
+        net allocated blocks)``."""
+
+        blocks = sys.getallocatedblocks()
+        start = time.process_time()
+        if action is not None:
+            action()
+        EventLoop.idle()
+        return (
+            time.process_time() - start,
+            sys.getallocatedblocks() - blocks,
+        )
+
+    def run(self, name, setup, actions):
+        setup()
+        for _ in range(WARMUP_FRAMES):
+            self.step()
+        times = []
+        allocations = []
+        actions = iter(actions())
+        for _ in range(self.frames):
+            cpu, blocks = self.step(next(actions, None))
+            times.append(cpu)
+            allocations.append(blocks)
+        return summarize(name, times, allocations)
+
+    def show(self, screen):
+        return lambda: setattr(self.root.content, "current", screen)
+
+    def scenarios(self):
+        width, height = Window.size
+        center = (width / 2, height / 2)
+        theme_cls = self.app.theme_cls
+
+        def idle():
+            return iter(())
+
+        def taps():
+            while True:
+                yield from tap(*center)
+                yield None
+
+        def scrolls():
+            while True:
+                yield from drag(center[0], height * 0.3, 0, height * 0.4, 10)
+                yield from wheel(center[0], center[1], "scrolldown")
+                yield from drag(center[0], height * 0.7, 0, -height * 0.4, 10)
+                yield from wheel(center[0], center[1], "scrollup")
+
+        def theme_switches():
+            palettes = ("Turquoise", "Peter River", "Alizarin")
+            for index in count():
+                yield lambda i=index: setattr(
+                    theme_cls, "theme_style", ("Light", "Dark")[i % 2]
+                )
+                yield lambda i=index: setattr(
+                    theme_cls, "primary_palette", palettes[i % len(palettes)]
+                )
+
+        return (
+            ("icon_idle", self.show("icon"), idle),
+            ("icon_scroll", self.show("icon"), scrolls),
+            ("button_taps", self.show("welcome"), taps),
+            ("button_theme_switch", self.show("welcome"), theme_switches),
+            ("icon_theme_switch", self.show("icon"), theme_switches),
+        )
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(name, times, allocations):
+    return {
+        "scenario": name,
+        "frames": len(times),
+        "p50_ms": percentile(times, 0.5) * 1000,
+        "p99_ms": percentile(times, 0.99) * 1000,
+        "max_ms": max(times) * 1000 if times else 0.0,
+        "mean_blocks": sum(allocations) / len(allocations)
+        if allocations
+        else 0.0,
+        "net_blocks": sum(allocations),
+    }
+
+
+def regressions(results, baseline, tolerance):
+    """Returns the scenarios of `results` whose p99 exceeds the one of
+    `baseline` by more than `tolerance`."""
+
+    previous = {entry["scenario"]: entry for entry in baseline}
+    failed = []
+    for entry in results:
+        reference = previous.get(entry["scenario"])
+        if reference and entry["p99_ms"] > reference["p99_ms"] * (
+            1 + tolerance
+        ):
+            failed.append(entry["scenario"])
+    return failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--scenario", action="append")
+    parser.add_argument("--output")
+    parser.add_argument("--baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    harness = Harness(args.frames)
+    results = []
+    for name, setup, actions in harness.scenarios():
+        if args.scenario and name not in args.scenario:
+            continue
+        result = harness.run(name, setup, actions)
+        results.append(result)
+        print(
+            f"{name:24} p50 {result['p50_ms']:7.2f} ms  "
+            f"p99 {result['p99_ms']:7.2f} ms  "
+            f"max {result['max_ms']:7.2f} ms  "
+            f"blocks/frame {result['mean_blocks']:+8.1f}"
+        )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            failed = regressions(results, json.load(f), args.tolerance)
+        if failed:
+            print("p99 regressions: " + ", ".join(failed))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,7 +9,7 @@ from kivy.uix.anchorlayout import AnchorLayout
 from kivy.uix.floatlayout import FloatLayout
 from kivy.uix.screenmanager import ScreenManager, NoTransition
 
-from .flatkivy.app import FlatApp
+from flatkivy.app import FlatApp
 
 from kitchen_sink.uix.screens.button_screen import ButtonScreen
 from kitchen_sink.uix.screens.icon_screen import IconScreen